@@ -0,0 +1,2 @@
+from .local import InProcessBackend, ProcessPoolBackend
+from .cluster import DaskBackend
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List
+
+
+class _BaseBackend(ABC):
+    """Abstract base class for execution backends.
+
+    An execution backend runs a function over the partitions of a table,
+    possibly on other processes or nodes. Objects that every task needs, such
+    as a fitted imputer, are broadcast once and passed as keyword argument.
+    """
+
+    def broadcast(self, obj: Any) -> Any:
+        """Makes the object available to all workers.
+
+        Parameters
+        ----------
+        obj : Any
+            The (picklable) object that is shipped to the workers.
+
+        Returns:
+            Any : handle that can be passed as keyword argument to `map`.
+        """
+        return obj
+
+    @abstractmethod
+    def map(self, func: Callable, partitions: Iterable, *args: Iterable, **kwargs: Dict) -> List:
+        """Applies the function to each partition.
+
+        Parameters
+        ----------
+        func : Callable
+            Module-level function that takes a partition as first argument.
+            
+        partitions : Iterable
+            The partitions, or handles to partitions that live on the workers.
+            
+        args : Iterable
+            Further arguments per partition, e.g. seeds, that are passed after 
+            the partition like the iterables of the builtin `map`.
+
+        Returns:
+            List : results of the function in the order of the partitions.
+        """
+        return
+
+    def gather(self, results: List) -> List:
+        """Collects results of `map` that remained on the workers.
+
+        Returns:
+            List : the results as local objects.
+        """
+        return results
+
+    def close(self) -> None:
+        """Releases the workers of the backend."""
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,60 @@
+from typing import Any, Callable, Dict, Iterable, List
+from ._base import _BaseBackend
+
+
+class DaskBackend(_BaseBackend):
+    """Execution backend that processes partitions on a Dask cluster.
+    
+    Partitions can be pandas DataFrames, futures or delayed objects of data
+    that already lives on the workers, e.g. from `dask_df.to_delayed()`.
+    Requires the optional `distributed` package.
+
+    Parameters
+    ----------
+    client : distributed.Client (optional)
+        Client of the cluster to run on. Defaults to None, which starts a
+        LocalCluster with `n_workers` single-threaded worker processes.
+        
+    n_workers : int (optional)
+        Number of workers of the LocalCluster. Ignored if a client is given.
+        
+    gather_results : bool (optional)
+        Flag to indicate whether results are gathered to the calling process. 
+        If False, `map` returns futures that keep the results on the workers, 
+        use `gather` to collect them. Defaults to False.
+    """
+    
+    gather_results: bool
+
+    def __init__(self, client: Any = None, n_workers: int = None, gather_results: bool = False):
+        try:
+            from distributed import Client, LocalCluster
+        except ImportError as e:
+            raise ImportError('DaskBackend requires the \'distributed\' package. '
+                              'Install it with `pip install distributed`.') from e
+        
+        self._owns_client = client is None
+        if client is None:
+            client = Client(LocalCluster(n_workers=n_workers, threads_per_worker=1))
+        self.client = client
+        self.gather_results = gather_results
+
+    def broadcast(self, obj: Any) -> Any:
+        return self.client.scatter(obj, broadcast=True)
+
+    def map(self, func: Callable, partitions: Iterable, *args: Iterable, **kwargs: Dict) -> List:
+        from dask import is_dask_collection
+        
+        partitions = [self.client.compute(partition) if is_dask_collection(partition) 
+                      else partition for partition in partitions]
+        futures = self.client.map(func, partitions, *args, pure=False, **kwargs)
+        return self.client.gather(futures) if self.gather_results else futures
+
+    def gather(self, results: List) -> List:
+        return self.client.gather(results)
+
+    def close(self) -> None:
+        if self._owns_client:
+            cluster = self.client.cluster
+            self.client.close()
+            cluster.close()
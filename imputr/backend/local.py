@@ -0,0 +1,88 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List
+from ._base import _BaseBackend
+
+# Broadcast objects of a ProcessPoolBackend, set in each worker process by the
+# initializer of its pool.
+_WORKER_BROADCASTS: Dict[int, Any] = {}
+
+
+class _BroadcastHandle:
+    """Reference to an object that is shipped to the workers of a process pool.
+    
+    The handle holds the object in the calling process, so that it is released
+    with the handle. Only the key is pickled with the tasks.
+    """
+
+    def __init__(self, key: int, obj: Any):
+        self.key = key
+        self.obj = obj
+
+    def __getstate__(self) -> Dict:
+        return {'key': self.key, 'obj': None}
+
+
+def _init_worker(broadcasts: Dict[int, Any]) -> None:
+    """Stores the broadcast objects in the worker process, runs once per worker."""
+    global _WORKER_BROADCASTS
+    _WORKER_BROADCASTS = broadcasts
+
+
+def _run_with_broadcasts(func: Callable, kwargs: Dict, partition: Any, *args: Any) -> Any:
+    """Resolves the broadcast handles of the keyword arguments and calls the function."""
+    kwargs = {name: _WORKER_BROADCASTS[value.key] if isinstance(value, _BroadcastHandle) else value
+              for name, value in kwargs.items()}
+    return func(partition, *args, **kwargs)
+
+
+class InProcessBackend(_BaseBackend):
+    """Execution backend that processes partitions one by one in the current process."""
+
+    def map(self, func: Callable, partitions: Iterable, *args: Iterable, **kwargs: Dict) -> List:
+        return [func(partition, *partition_args, **kwargs) 
+                for partition, *partition_args in zip(partitions, *args)]
+
+
+class ProcessPoolBackend(_BaseBackend):
+    """Execution backend that processes partitions in parallel on a local process pool.
+    
+    Partitions are pickled to the worker processes per task. Broadcast objects are 
+    shipped once per worker when the pool starts. The pool is keyed by the broadcasts
+    of the map that started it and is restarted with only the broadcasts of a map 
+    that needs others, so that earlier broadcasts are neither kept nor shipped again.
+
+    Parameters
+    ----------
+    n_workers : int (optional)
+        Number of worker processes. Defaults to None, which uses the number of CPUs.
+    """
+    
+    n_workers: int
+
+    def __init__(self, n_workers: int = None):
+        self.n_workers = n_workers
+        self._executor = None
+        self._executor_keys = frozenset()
+        self._broadcast_count = 0
+
+    def broadcast(self, obj: Any) -> Any:
+        self._broadcast_count += 1
+        return _BroadcastHandle(self._broadcast_count, obj)
+
+    def map(self, func: Callable, partitions: Iterable, *args: Iterable, **kwargs: Dict) -> List:
+        broadcasts = {value.key: value.obj for value in kwargs.values() if isinstance(value, _BroadcastHandle)}
+        if self._executor is not None and not self._executor_keys.issuperset(broadcasts):
+            self.close()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.n_workers, 
+                                                 initializer=_init_worker,
+                                                 initargs=(broadcasts,))
+            self._executor_keys = frozenset(broadcasts)
+        return list(self._executor.map(partial(_run_with_broadcasts, func, kwargs), partitions, *args))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._executor_keys = frozenset()
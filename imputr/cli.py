@@ -0,0 +1,196 @@
+"""Command-line entry point that imputes many CSV or Parquet files in parallel.
+
+Example::
+
+    imputr 'data/*.csv' 'archive/**/*.parquet' --output-dir imputed --workers 8 \\
+        --strategies '{"age": {"strategy": "mean"}}' --report timings.csv
+"""
+
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List
+
+import pandas as pd
+
+_READERS = {
+    '.csv': pd.read_csv,
+    '.parquet': pd.read_parquet
+}
+
+_REPORT_COLUMNS = ['file', 'output', 'status', 'rows', 'columns', 'imputed_cells',
+                   'read_seconds', 'impute_seconds', 'write_seconds', 'error']
+
+
+def main(argv: List[str] = None) -> int:
+    """Runs the command line, returns the exit code (1 if any file failed)."""
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    files = _expand_globs(args.inputs)
+    if len(files) == 0:
+        parser.error(f'No files match {args.inputs}.')
+    unsupported = [path for path in files if _extension(path) not in _READERS]
+    if len(unsupported) > 0:
+        parser.error(f'Unsupported file types, use {sorted(_READERS)}: {unsupported}')
+    outputs = [_output_path(path, args.output_dir, args.suffix, args.format) for path in files]
+    if len(set(outputs)) < len(outputs):
+        parser.error('Input files with the same name would overwrite each other\'s output, '
+                     'impute them in separate runs.')
+    config = _load_config(args)
+    # Files are the outer tasks, the imputer of each file gets its share of the CPUs.
+    cpus = os.cpu_count() or 1
+    workers = min(cpus, len(files)) if args.workers is None else args.workers
+    config.setdefault('cpu_budget', max(1, cpus // workers))
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    reports = []
+    tasks = list(zip(files, outputs))
+    if workers == 1:
+        for path, output in tasks:
+            reports.append(_impute_file(path, output, args.imputer, config))
+            _print_progress(reports[-1], len(reports), len(tasks), args.quiet)
+    else:
+        # One persistent pool, so that interpreter and import start-up are paid per worker, not per file.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_warm_up,
+                                 initargs=(args.imputer,)) as pool:
+            futures = [pool.submit(_impute_file, path, output, args.imputer, config)
+                       for path, output in tasks]
+            for future in as_completed(futures):
+                reports.append(future.result())
+                _print_progress(reports[-1], len(reports), len(tasks), args.quiet)
+
+    report = pd.DataFrame(reports, columns=_REPORT_COLUMNS).sort_values('file', ignore_index=True) \
+        .astype({'rows': 'Int64', 'columns': 'Int64', 'imputed_cells': 'Int64'})
+    if args.report is not None:
+        report.to_csv(args.report, index=False)
+    failed = int((report['status'] == 'failed').sum())
+    if not args.quiet:
+        print(report.drop(columns=['error']).to_string(index=False))
+        print(f'{len(report) - failed} of {len(report)} files imputed in '
+              f'{time.perf_counter() - start:.2f}s, {failed} failed.')
+    return 1 if failed > 0 else 0
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='imputr',
+        description='Imputes CSV and Parquet files in parallel. Configuration options mirror '
+                    'the arguments of the AutoImputer constructor.')
+    parser.add_argument('inputs', nargs='+',
+                        help='Input files or glob patterns, ** matches directories recursively.')
+    parser.add_argument('-o', '--output-dir', required=True,
+                        help='Directory the imputed files are written to.')
+    parser.add_argument('--suffix', default='',
+                        help='Suffix added to the name of each output file. Defaults to none.')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default=None,
+                        help='Output file format. Defaults to the format of each input file.')
+    parser.add_argument('--imputer', choices=['auto', 'mean'], default='auto',
+                        help='AutoImputer or MeanImputer. Defaults to auto.')
+    parser.add_argument('--config', default=None,
+                        help='JSON file with imputer constructor arguments, e.g. '
+                             '{"predefined_strategies": ..., "time_budget": 60}.')
+    parser.add_argument('--strategies', type=json.loads, default=None,
+                        help='JSON of predefined_strategies, overrides the config file.')
+    parser.add_argument('--datatypes', type=json.loads, default=None,
+                        help='JSON of predefined_datatypes, overrides the config file.')
+    parser.add_argument('--order', type=json.loads, default=None,
+                        help='JSON of predefined_order, overrides the config file.')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='Number of worker processes, 1 imputes in this process. The CPUs '
+                             'are shared out between the workers, see cpu_budget. Defaults to '
+                             'the number of CPUs or of files, whichever is smaller.')
+    parser.add_argument('--report', default=None,
+                        help='CSV file the per-file timing report is written to.')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Do not print progress and the summary.')
+    return parser
+
+
+def _expand_globs(patterns: List[str]) -> List[str]:
+    """Expands the glob patterns into a sorted list of distinct files."""
+    files = set()
+    for pattern in patterns:
+        files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(files)
+
+
+def _extension(path: str) -> str:
+    return os.path.splitext(path)[1].lower()
+
+
+def _output_path(path: str, output_dir: str, suffix: str, output_format: str = None) -> str:
+    stem, extension = os.path.splitext(os.path.basename(path))
+    extension = extension.lower() if output_format is None else f'.{output_format}'
+    return os.path.join(output_dir, f'{stem}{suffix}{extension}')
+
+
+def _load_config(args: argparse.Namespace) -> Dict:
+    """Imputer constructor arguments from the config file and the command line."""
+    config = {}
+    if args.config is not None:
+        with open(args.config) as config_file:
+            config = json.load(config_file)
+    for key, value in (('predefined_strategies', args.strategies),
+                       ('predefined_datatypes', args.datatypes),
+                       ('predefined_order', args.order)):
+        if value is not None:
+            config[key] = value
+    return config
+
+
+def _warm_up(imputer_name: str) -> None:
+    """Imports the imputer and its models once per worker process."""
+    importlib.import_module('imputr.imputers')
+    if imputer_name == 'auto':
+        importlib.import_module('sklearn.ensemble')
+
+
+def _impute_file(path: str, output: str, imputer_name: str, config: Dict) -> Dict:
+    """Reads, imputes and writes a single file, runs on the workers of the pool.
+
+    Errors are reported instead of raised, so that one bad file does not stop a batch.
+    """
+    from .imputers import AutoImputer, MeanImputer
+
+    report = {'file': path, 'output': output, 'status': 'failed'}
+    try:
+        start = time.perf_counter()
+        data = _READERS[_extension(path)](path)
+        report.update(rows=data.shape[0], columns=data.shape[1],
+                      imputed_cells=int(data.isnull().values.sum()),
+                      read_seconds=time.perf_counter() - start)
+
+        start = time.perf_counter()
+        imputer_cls = AutoImputer if imputer_name == 'auto' else MeanImputer
+        imputer_cls(data, **config).impute(inplace=True)
+        report['impute_seconds'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if _extension(output) == '.parquet':
+            data.to_parquet(output, index=False)
+        else:
+            data.to_csv(output, index=False)
+        report['write_seconds'] = time.perf_counter() - start
+        report['status'] = 'imputed'
+    except Exception as error:
+        report['error'] = f'{type(error).__name__}: {error}'
+    return report
+
+
+def _print_progress(report: Dict, done: int, total: int, quiet: bool) -> None:
+    if quiet:
+        return
+    seconds = sum(report.get(key, 0.0) for key in ('read_seconds', 'impute_seconds', 'write_seconds'))
+    status = report['status'] if report['status'] != 'failed' else f'failed ({report["error"]})'
+    print(f'[{done}/{total}] {report["file"]}: {status} in {seconds:.2f}s', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
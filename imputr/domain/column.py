@@ -1,9 +1,62 @@
+import copy
 import numpy as np
 import pandas as pd
-from typing import Union
-from pandas.core.dtypes.common import is_numeric_dtype, is_object_dtype, is_string_dtype, is_categorical_dtype
-from sklearn.preprocessing import LabelEncoder
-from .types import DataType
+from typing import Dict, Iterable, List, Union
+from pandas.core.dtypes.common import is_numeric_dtype, is_object_dtype, is_string_dtype, is_categorical_dtype, \
+    is_datetime64_any_dtype
+from .types import DataType, _to_epoch, _to_numeric, _from_epoch
+from .sketches import ColumnSummary, MomentSketch
+
+
+def _take_labels(index: pd.Index, positions: np.ndarray) -> pd.Index:
+    """Index labels at the given positions.
+    
+    Positional lookups on a RangeIndex materialize and cache all of its labels
+    in pandas, so its labels are computed from the range instead.
+    """
+    if isinstance(index, pd.RangeIndex):
+        return pd.Index(index.start + index.step * np.asarray(positions, dtype=np.int64), name=index.name)
+    return index.take(positions)
+
+
+class _GrowableArray:
+    """Buffer that appends rows to an array in amortized time proportional to
+    the new rows, by over-allocating its capacity like a Python list.
+    """
+
+    def __init__(self):
+        self._buffer = None
+        self._size = 0
+
+    @staticmethod
+    def common_dtype(current: np.dtype, new: np.dtype) -> np.dtype:
+        """The dtype both arrays fit in, None if pandas would pick another one, e.g. for booleans and NaN."""
+        if current == new:
+            return current
+        if current.kind in 'iuf' and new.kind in 'iuf':
+            return np.result_type(current, new)
+        return None
+
+    def extend(self, current: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Returns the current rows followed by the new values.
+        
+        The values are written into the spare capacity of the buffer if the 
+        current rows are its content, otherwise the current rows are copied
+        into a new buffer with room to grow.
+        """
+        dtype = self.common_dtype(current.dtype, values.dtype)
+        size = len(current) + len(values)
+        is_content = self._buffer is not None and len(current) == self._size \
+            and dtype == self._buffer.dtype and len(current) > 0 \
+            and np.shares_memory(current[:1], self._buffer[:1])
+        if not is_content or size > len(self._buffer):
+            buffer = np.empty(max(size, 2 * len(current)), dtype=dtype)
+            buffer[:len(current)] = current
+            self._buffer = buffer
+        self._buffer[len(current):size] = values
+        self._size = size
+        return self._buffer[:size]
+
 
 class Column:
     """Data class that encapsulates the data and imputr-specific metadata of a column.
@@ -14,26 +67,183 @@ class Column:
         The Pandas Series that contains the column data.
     data_type : Union[str, DataType] (optional)
         The imputr DataType specified per string or DataType enum class.
+    summary : ColumnSummary (optional)
+        Streaming summary of the data, e.g. built chunk by chunk or merged across
+        partitions. If given, the statistics are taken from the summary instead 
+        of exact scans over the data.
+    sample_size : int (optional)
+        Caps the inference cost of object-dtype columns. If the column has more 
+        rows, the DataType and the categorical mode are inferred from a random 
+        sample of this size, and the exact unique count and mode are only
+        computed when needed. Defaults to None (exact).
+
+    Categorical columns are dictionary-encoded: the data is factorized once 
+    into integer `codes` (-1 for missing values) and the `categories` they 
+    index. Statistics, feature matrices and classifier targets work on the 
+    codes, and the original labels are only restored in `imputed_data`.
+    
+    Datetime columns are stored as nanoseconds since the epoch (NaN for missing 
+    values), imputed like continuous columns and converted back to timestamps
+    in `imputed_data`.
     """
 
     data: pd.Series
     name: str
     type: DataType
     missing_value_count: int
-    unique_value_count: int
     average: Union[bool, str, float]
+    is_estimated: bool
+    timezone: object
     _imputed_data: pd.Series
-    _label_encoder: LabelEncoder
+    _imputed_codes: np.ndarray
+    _codes: np.ndarray
+    _null_indices: tuple
+    _categories: pd.Index
+    _value_counts: pd.Series
+    _moments: MomentSketch
+    _summary: ColumnSummary
 
-    def __init__(self, data: pd.Series, data_type: Union[str, DataType] = None):
+    def __init__(self, 
+                 data: pd.Series, 
+                 data_type: Union[str, DataType] = None,
+                 summary: ColumnSummary = None,
+                 sample_size: int = None):
         self.name = data.name
-        self.data = self._cast_data_if_necessary(data, data_type)
-        self.missing_value_count = self._count_number_of_missing_values(data)
-        self.unique_value_count = self._count_number_of_unique_values(data)
-        self.type = self._infer_data_type(data, data_type)
-        self.average = self._compute_average(data, self.type)
+        sample = None
+        if summary is None and sample_size is not None and len(data) > sample_size \
+            and is_object_dtype(data.dtype):
+            sample = data.sample(n=sample_size, random_state=0)
+        self.type = self._infer_data_type(data, data_type, sample)
+        if self.type is DataType.CONTINUOUS and is_object_dtype(data.dtype):
+            try:
+                data = _to_numeric(data)
+            except ValueError:
+                if data_type is not None:
+                    raise
+                # Values outside the sample are not numbers, they must not become missing values.
+                self.type = DataType.CATEGORICAL
+        self.timezone = None
+        if self.type is DataType.DATETIME:
+            try:
+                data, self.timezone = _to_epoch(data)
+            except ValueError:
+                if data_type is not None:
+                    raise
+                # Values outside the probe are not timestamps, they must not become missing values.
+                self.type = DataType.CATEGORICAL
+        self.data = data
+        self._buffers = {}
+        self._codes = None
+        self._categories = None
+        self._null_indices = None
+        if summary is not None and summary.data_type is not self.type:
+            raise ValueError(f'Summary of column \'{self.name}\' has data type {summary.data_type}, expected {self.type}.')
+        self._summary = summary
+        # Mergeable statistics, so that appended rows update them incrementally.
+        if summary is not None:
+            self.missing_value_count = summary.missing_value_count
+            self._value_counts = None
+            self._moments = summary.moments if self.type is not DataType.CATEGORICAL else None
+        elif sample is not None and self.type is DataType.CATEGORICAL:
+            self.missing_value_count = self._count_number_of_missing_values(data)
+            self._value_counts = None
+            self._moments = None
+        elif self.type is DataType.CATEGORICAL:
+            self.missing_value_count = int(np.count_nonzero(self.codes == -1))
+            self._value_counts = self._count_codes(self.codes)
+            self._moments = None
+        else:
+            self.missing_value_count = self._count_number_of_missing_values(data)
+            self._value_counts = None
+            self._moments = MomentSketch.from_series(data)
+        self.is_estimated = self._value_counts is None and self.type is DataType.CATEGORICAL \
+            and summary is None
+        if self.is_estimated:
+            # Exact unique count is computed lazily, the mode is estimated from the sample.
+            self._unique_value_count = None
+            self.average = self._mode_from_value_counts(sample.value_counts())
+        else:
+            self.unique_value_count = self._count_number_of_unique_values(data)
+            self.average = self._compute_average(data, self.type)
         self._imputed_data = None
-        self._label_encoder = LabelEncoder() if self.type is DataType.CATEGORICAL else None
+        self._imputed_codes = None
+    
+    @classmethod
+    def from_chunks(cls, 
+                    chunks: Iterable[pd.Series], 
+                    data_type: Union[str, DataType] = None) -> 'Column':
+        """Constructs a Column from chunks of data, summarizing them one by one.
+        
+        The statistics are computed with streaming sketches, see ColumnSummary,
+        which saves the exact scans over the full column. The chunks are still
+        concatenated into one in-memory series.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.Series]
+            Chunks of the column data with the same name.
+        data_type : Union[str, DataType] (optional)
+            The imputr DataType specified per string or DataType enum class.
+
+        Returns
+        -------
+            Column : column with the concatenated data of all chunks.
+        """
+        chunks = list(chunks)
+        data = pd.concat(chunks)
+        return cls(data, data_type, cls._summarize_chunks(chunks, data, data_type))
+
+    @classmethod
+    def _summarize_chunks(cls, 
+                          chunks: List[pd.Series], 
+                          data: pd.Series, 
+                          data_type: Union[str, DataType] = None) -> ColumnSummary:
+        """Summarizes the chunks of a column with the data type of all chunks.
+        
+        The type is inferred from the concatenated data like in the constructor,
+        so that e.g. an all-NaN first chunk does not make a string column continuous.
+        """
+        inferred_type = cls._infer_data_type(data, data_type)
+        try:
+            return ColumnSummary.from_chunks(chunks, inferred_type)
+        except (TypeError, ValueError):
+            if data_type is not None or inferred_type is DataType.CATEGORICAL:
+                raise
+            # Values outside the probe are not numbers or timestamps, as in the constructor.
+            return ColumnSummary.from_chunks(chunks, DataType.CATEGORICAL)
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Gets the integer codes of a categorical column, -1 for missing values.
+        
+        The data is factorized on first access, in sorted order of the labels 
+        when they are comparable.
+
+        Returns
+        -------
+            np.ndarray: int32 codes into the categories, None for continuous columns.
+        """
+        if self._codes is None and self.type is DataType.CATEGORICAL:
+            try:
+                codes, categories = self._factorize(self.data, sort=True)
+            except TypeError:
+                # Labels of mixed types cannot be sorted, keep order of appearance.
+                codes, categories = self._factorize(self.data)
+            self._codes = codes.astype(np.int32)
+            self._categories = categories
+        return self._codes
+    
+    @property
+    def categories(self) -> pd.Index:
+        """Gets the labels that the codes of a categorical column refer to.
+
+        Returns
+        -------
+            pd.Index: the distinct non-null labels, None for continuous columns.
+        """
+        if self._categories is None:
+            self.codes
+        return self._categories
 
     @property
     def imputed_data(self) -> pd.Series:
@@ -41,15 +251,19 @@ class Column:
         
         If the data has not been imputed by any strategy yet, it interally sets
         the _imputed_data value as average-based imputed pd.Series (mode for
-        discrete and mean for continuous) and returns it.
+        discrete and mean for continuous) and returns it. Categorical columns
+        are decoded to their original labels and datetime columns to timestamps.
 
         Returns
         -------
             pd.Series: imputed data of the Column object.
         """
-        if self._imputed_data is None:
-            self._imputed_data = self.data.fillna(self.average)
-        return self._imputed_data
+        if self.type is DataType.CATEGORICAL:
+            return pd.Series(pd.Categorical.from_codes(self.imputed_codes, self.categories),
+                             index=self.data.index, name=self.name)
+        if self.type is DataType.DATETIME:
+            return _from_epoch(self.numeric_encoded_imputed_data, self.timezone)
+        return self.numeric_encoded_imputed_data
     
     @imputed_data.setter
     def imputed_data(self, column_values: pd.Series) -> None:
@@ -63,25 +277,361 @@ class Column:
             The pd.Series that contains the imputed data. 
             Should not contains null-types or and have the same length as the original pd.Series.
         """
-        self._imputed_data = column_values
+        if self.type is DataType.CATEGORICAL:
+            self._imputed_codes = self._encode(column_values)
+        elif self.type is DataType.DATETIME:
+            self._imputed_data = _to_epoch(column_values)[0]
+        else:
+            self._imputed_data = column_values
+    
+    @property
+    def imputed_codes(self) -> np.ndarray:
+        """Gets the codes of the imputed data of a categorical column.
+        
+        Missing values are filled with the code of the mode if the data has 
+        not been imputed by any strategy yet.
+
+        Returns
+        -------
+            np.ndarray: int32 codes of the imputed data.
+        """
+        if self._imputed_codes is None:
+            self._imputed_codes = self._fill_codes(self.average)
+        return self._imputed_codes
         
     @property
-    def numeric_encoded_imputed_data(self) -> pd.Series:
+    def numeric_encoded_imputed_data(self) -> Union[pd.Series, np.ndarray]:
         """Gets the imputed-then-numerically-encoded data.
         
-        Transforms categorical data types to incrementally labeled integer data.
-        Calls the property getter of self._imputed_data.
+        Categorical data is represented by its codes, so no encoding pass over
+        the labels is needed, and datetime data by its epoch values. Original 
+        data may need average imputation first.
        
         Returns
         -------
-            pd.Series: series containing in imputed data in numerically encoded form.
+            Union[pd.Series, np.ndarray]: imputed data in numerically encoded form.
+        """
+
+        if self.type is DataType.CATEGORICAL:
+            return self.imputed_codes
+        
+        if self._imputed_data is None:
+            self._imputed_data = self.data.fillna(self.average)
+        return self._imputed_data
+    
+    def write_numeric_encoded_imputed_data(self, out: np.ndarray) -> None:
+        """Writes the numerically encoded imputed data into an array.
+        
+        Unlike `numeric_encoded_imputed_data`, the missing values of a column
+        that has not been imputed yet are filled with the average in the array 
+        itself, so the column keeps no average-imputed copy of its data.
+
+        Parameters
+        ----------
+        out : np.ndarray
+            Array of the length of the column, e.g. a column of an EncodedMatrix.
+        """
+        if self._imputed_data is not None or self._imputed_codes is not None:
+            out[:] = self.numeric_encoded_imputed_data
+        elif self.type is DataType.CATEGORICAL:
+            out[:] = self.codes
+            out[self.null_indices[0]] = self._encode(pd.Series([self.average]))[0]
+        else:
+            out[:] = self.data
+            out[self.null_indices[0]] = self.average
+    
+    def fill_missing(self, value) -> pd.Series:
+        """Returns the data with all missing values replaced by the given value.
+
+        Parameters
+        ----------
+        value : Union[str, float]
+            The label or number that replaces missing values.
+
+        Returns
+        -------
+            pd.Series: the filled data, categorical for categorical columns and 
+                epoch values for datetime columns.
+        """
+        if self.type is DataType.CATEGORICAL:
+            return pd.Series(pd.Categorical.from_codes(self._fill_codes(value), self.categories),
+                             index=self.data.index, name=self.name)
+        return self.data.fillna(value)
+
+    @property
+    def imputed_null_values(self) -> pd.Series:
+        """Gets the imputed values at the null indices only, decoded like `imputed_data`.
+
+        Returns
+        -------
+            pd.Series: imputed values indexed by the index labels of the null rows.
+        """
+        null_rows = self.null_indices[0]
+        index = _take_labels(self.data.index, null_rows)
+        if self.type is DataType.CATEGORICAL:
+            return pd.Series(self.categories.take(self.imputed_codes[null_rows]), 
+                             index=index, name=self.name)
+        values = pd.Series(np.asarray(self.numeric_encoded_imputed_data)[null_rows], 
+                           index=index, name=self.name)
+        if self.type is DataType.DATETIME:
+            return _from_epoch(values, self.timezone)
+        return values
+
+    def with_imputed_values(self, values: np.ndarray) -> pd.Series:
+        """Returns the imputed data with the missing values replaced by other imputations.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Numerically encoded values in the order of the null indices, codes
+            for categorical and epoch values for datetime columns.
+
+        Returns
+        -------
+            pd.Series: the imputed data decoded like `imputed_data`.
         """
+        null_rows = self.null_indices[0]
+        if self.type is DataType.CATEGORICAL:
+            codes = self.imputed_codes.copy()
+            codes[null_rows] = values
+            return pd.Series(pd.Categorical.from_codes(codes, self.categories),
+                             index=self.data.index, name=self.name)
 
-        if self.type is DataType.CONTINUOUS:
-            # Uses property getter here. Original data may need average imputation first.
-            return self.imputed_data
+        encoded = np.asarray(self.numeric_encoded_imputed_data, dtype=np.float64).copy()
+        encoded[null_rows] = values
+        if self.type is DataType.DATETIME:
+            return _from_epoch(pd.Series(encoded, index=self.data.index, name=self.name),
+                               self.timezone)
+        if self.is_sparse:
+            encoded = pd.arrays.SparseArray(encoded, fill_value=self.data.sparse.fill_value)
+        return pd.Series(encoded, index=self.data.index, name=self.name)
+
+    def _fill_codes(self, value) -> np.ndarray:
+        """Returns a copy of the codes with missing values replaced by the code of the label."""
+        code = self._encode(pd.Series([value]))[0]
+        codes = self.codes.copy()
+        codes[codes == -1] = code
+        return codes
+    
+    def _encode(self, values: pd.Series) -> np.ndarray:
+        """Encodes labels with the codes of this column, -1 for missing values.
         
-        return self._label_encoder.fit_transform(self.imputed_data)
+        Categorical series with the same categories are encoded without a pass 
+        over the labels. Unseen labels are appended to the categories.
+
+        Returns
+        -------
+            np.ndarray: int32 codes of the values.
+        """
+        if is_categorical_dtype(values.dtype) and values.cat.categories.equals(self.categories):
+            return values.cat.codes.to_numpy(dtype=np.int32)
+        return self._remap_codes(*self._factorize(values))
+    
+    def _remap_codes(self, local_codes: np.ndarray, local_categories: pd.Index) -> np.ndarray:
+        """Translates codes into local categories to codes into the categories of 
+        this column. Only the distinct labels are looked up, unseen labels are 
+        appended to the categories.
+        """
+        mapping = self.categories.get_indexer(local_categories)
+        unseen = mapping == -1
+        if unseen.any():
+            mapping[unseen] = len(self.categories) + np.arange(np.count_nonzero(unseen))
+            self._categories = self.categories.append(local_categories[unseen])
+        # Missing values (-1) pick the appended -1 entry.
+        return np.append(mapping, -1)[local_codes].astype(np.int32)
+    
+    @staticmethod
+    def _factorize(values: pd.Series, sort: bool = False) -> tuple:
+        """Factorizes values into codes and an index of the distinct labels, 
+        keeping the dtype of object labels instead of inferring a numeric one."""
+        if is_object_dtype(values.dtype):
+            codes, uniques = pd.factorize(values.to_numpy(), sort=sort)
+            return codes, pd.Index(uniques, dtype=object)
+        codes, uniques = pd.factorize(values, sort=sort)
+        return codes, pd.Index(uniques)
+    
+    def _count_codes(self, codes: np.ndarray) -> pd.Series:
+        """Counts the occurrences of each category in the given codes."""
+        return pd.Series(np.bincount(codes[codes >= 0], minlength=len(self.categories)),
+                         index=self.categories)
+    
+    @property
+    def unique_value_count(self) -> int:
+        """Gets the number of unique values, counted on first access for sampled columns."""
+        if self._unique_value_count is None:
+            self._unique_value_count = self._count_number_of_unique_values(self.data)
+        return self._unique_value_count
+    
+    @unique_value_count.setter
+    def unique_value_count(self, count: int) -> None:
+        self._unique_value_count = count
+    
+    def compute_exact_statistics(self) -> None:
+        """Replaces the sample-based estimates of the mode and unique count 
+        by exact statistics. Does nothing if the statistics are exact already.
+        """
+        if not self.is_estimated:
+            return
+        self._value_counts = self._count_codes(self.codes)
+        self.unique_value_count = len(self._value_counts)
+        self.average = self._mode_from_value_counts(self._value_counts)
+        self.is_estimated = False
+    
+    @property
+    def statistics(self) -> Dict:
+        """Summary statistics that are used to detect drift of the column data.
+        
+        Returns
+        -------
+            Dict : missing fraction and average, plus the standard deviation for 
+                continuous and the fraction of the mode for categorical columns.
+        """
+        statistics = {
+            'missing_fraction': self.missing_value_count / max(len(self.data), 1),
+            'average': self.average
+        }
+        if self.type is not DataType.CATEGORICAL:
+            statistics['std'] = float(np.sqrt(self._moments.variance))
+        elif self._summary is not None:
+            statistics['mode_fraction'] = self._summary.heavy_hitters.mode_fraction
+        else:
+            # Drift is measured against exact counts, not the estimate from a sample.
+            self.compute_exact_statistics()
+            total = self._value_counts.sum()
+            statistics['mode_fraction'] = float(self._value_counts.max() / total) if total > 0 else 0.0
+        return statistics
+    
+    def append(self, data: pd.Series, imputed_data: pd.Series = None) -> None:
+        """Appends rows to the column and updates its statistics incrementally.
+
+        Parameters
+        ----------
+        data : pd.Series
+            The Pandas Series that contains the new column data.
+            
+        imputed_data : pd.Series (optional)
+            The imputed new column data. If the column holds imputed data, it is 
+            extended with these values, otherwise it is reset.
+        """
+        if self.type is DataType.DATETIME:
+            data = _to_epoch(data)[0]
+            imputed_data = None if imputed_data is None else _to_epoch(imputed_data)[0]
+        old_imputed_data = self._imputed_data
+        old_imputed_codes = self._imputed_codes
+        # Encode before the data is extended, so that lazily factorized codes stay lazy.
+        new_codes = self._encode(data) if self._codes is not None else None
+        
+        old_row_count = len(self.data)
+        self.data = self._extend_data(data)
+        if self._null_indices is not None:
+            # Kept positions stay valid for old rows whose nulls were filled in place.
+            self._null_indices = (np.concatenate([self._null_indices[0], 
+                                                  old_row_count + np.flatnonzero(pd.isnull(data))]),)
+        if new_codes is not None:
+            self._codes = self._extend('codes', self._codes, new_codes)
+            self.missing_value_count += int(np.count_nonzero(new_codes == -1))
+        else:
+            self.missing_value_count += self._count_number_of_missing_values(data)
+        
+        if self._summary is not None:
+            self._summary.update(data)
+            self.unique_value_count = self._summary.unique_value_count
+            self.average = self._compute_average(data, self.type)
+        elif self.type is DataType.CATEGORICAL:
+            if self._value_counts is None:
+                # Sampled column, computes its exact statistics from the codes.
+                self.compute_exact_statistics()
+            else:
+                new_counts = self._count_codes(new_codes)
+                self._value_counts = self._value_counts.add(new_counts[new_counts > 0], fill_value=0) \
+                    .astype(np.int64)
+                self.unique_value_count = len(self._value_counts)
+                self.average = self._mode_from_value_counts(self._value_counts)
+        else:
+            self._moments.update(data)
+            # There is no mergeable exact unique count for continuous data, it is recounted on access.
+            self.unique_value_count = None
+            self.average = self._moments.mean
+        
+        if self.type is DataType.CATEGORICAL:
+            self._imputed_codes = self._extend('imputed', old_imputed_codes, self._encode(imputed_data)) \
+                if old_imputed_codes is not None and imputed_data is not None else None
+        elif old_imputed_data is not None and imputed_data is not None:
+            self._imputed_data = pd.Series(
+                self._extend('imputed', old_imputed_data.to_numpy(), imputed_data.to_numpy()),
+                index=self.data.index, name=self.name)
+        else:
+            self._imputed_data = None
+    
+    def _extend(self, key: str, current: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Appends values to an array of the column through its growable buffer, see `_GrowableArray`."""
+        if _GrowableArray.common_dtype(current.dtype, values.dtype) is None:
+            return np.concatenate([current, values])
+        return self._buffers.setdefault(key, _GrowableArray()).extend(current, values)
+    
+    def _extend_data(self, data: pd.Series) -> pd.Series:
+        """Appends data to the column data, in time proportional to the new rows
+        for NumPy dtypes and contiguous range indexes."""
+        old_index, new_index = self.data.index, data.index
+        if not isinstance(self.data.dtype, np.dtype) or not isinstance(data.dtype, np.dtype) or \
+            _GrowableArray.common_dtype(self.data.dtype, data.dtype) is None or \
+            isinstance(old_index, pd.MultiIndex) or isinstance(new_index, pd.MultiIndex):
+            return pd.concat([self.data, data])
+        
+        if isinstance(old_index, pd.RangeIndex) and isinstance(new_index, pd.RangeIndex) \
+            and old_index.step == new_index.step and new_index.start == old_index.stop:
+            index = pd.RangeIndex(old_index.start, new_index.stop, old_index.step)
+        else:
+            index = pd.Index(self._extend('index', old_index.to_numpy(), new_index.to_numpy()), copy=False)
+        values = self._extend('data', self.data.to_numpy(), data.to_numpy())
+        return pd.Series(values, index=index, name=self.name, copy=False)
+    
+    def inherit_encoding(self, column: 'Column') -> None:
+        """Takes over the average and categories of a fitted column, so that a 
+        partition of a table is encoded like the table it belongs to.
+        
+        Only the distinct labels of the partition are looked up. Labels the 
+        fitted column has not seen get codes after the fitted categories.
+
+        Parameters
+        ----------
+        column : Column
+            The column of the fitted table with the same name.
+        """
+        self.average = column.average
+        self._imputed_data = None
+        self._imputed_codes = None
+        if self.type is DataType.CATEGORICAL and column.type is DataType.CATEGORICAL:
+            local_codes, local_categories = self.codes, self.categories
+            self._categories = column.categories
+            self._codes = self._remap_codes(local_codes, local_categories)
+    
+    def detached(self) -> 'Column':
+        """Returns a copy of the column metadata without its data.
+        
+        Used to ship fitted imputers to workers without the table they were fitted on.
+
+        Returns
+        -------
+            Column : copy of the column with empty data.
+        """
+        detached = copy.copy(self)
+        # Count and encode while the data is still there.
+        detached.unique_value_count = self.unique_value_count
+        if self.type is DataType.CATEGORICAL:
+            detached._codes = self.codes[:0]
+            detached._categories = self.categories
+        detached.data = self.data.iloc[:0]
+        detached._buffers = {}
+        detached._null_indices = None
+        detached._imputed_data = None
+        detached._imputed_codes = None
+        return detached
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether the data is a pandas sparse array, e.g. from a SciPy sparse matrix."""
+        return isinstance(self.data.dtype, pd.SparseDtype)
 
     @property
     def null_indices(self) -> np.ndarray:
@@ -89,11 +639,22 @@ class Column:
         
         Mutually exclusive with the non_null_indices property.
         
+        Kept for dense columns, at a size proportional to the missing values, 
+        because their data may be filled in place, see `impute`. The positions
+        of sparse columns are derived from their sparse index on each access.
+        
         Returns
         -------
             np.ndarray: indexes where a null value is found
         """
-        return np.where(pd.isnull(self.data))
+        if self.is_sparse:
+            return (self._sparse_positions(null=True),)
+        if self._null_indices is None:
+            if self.type is DataType.CATEGORICAL:
+                self._null_indices = np.where(self.codes == -1)
+            else:
+                self._null_indices = np.where(pd.isnull(self.data))
+        return self._null_indices
     
     @property
     def non_null_indices(self) -> np.ndarray:
@@ -101,24 +662,35 @@ class Column:
         
         Mutually exclusive with the null_indices property.
         
+        Derived from the null positions on each access instead of kept, as 
+        there are as many as rows in a mostly observed column.
+        
         Returns
         -------
             np.ndarray: indexes where a non-null value is found
         """
-        return np.where(~pd.isnull(self.data))
+        if self.is_sparse:
+            return (self._sparse_positions(null=False),)
+        is_observed = np.ones(len(self.data), dtype=bool)
+        is_observed[self.null_indices[0]] = False
+        return (np.flatnonzero(is_observed),)
     
-    def _cast_data_if_necessary(self, data: pd.Series, data_type: Union[str, DataType] = None) -> pd.Series:
-        """If given data is numeric as defined in pandas' isnumeric function,
-        and given datatype is categorical, map to pandas object.
-        """
-        
-        if type(data_type) is str and DataType.str_to_data_type(data_type) is DataType.CATEGORICAL:
-            if is_numeric_dtype(data):
-                return data.astype('string')
-            
-        return data
-        
-    def _infer_data_type(self, column_data: pd.Series, data_type: Union[str, DataType] = None) -> DataType:
+    def _sparse_positions(self, null: bool) -> np.ndarray:
+        """Null or non-null positions of sparse data from its stored values and sparse index."""
+        array = self.data.array
+        stored = array.sp_index.indices
+        stored_null = pd.isnull(array.sp_values)
+        if pd.isnull(array.fill_value) != null:
+            # Only stored values are of the requested kind.
+            return stored[stored_null == null].astype(np.int64)
+        is_selected = np.ones(len(array), dtype=bool)
+        is_selected[stored[stored_null != null]] = False
+        return np.flatnonzero(is_selected)
+    
+    @staticmethod
+    def _infer_data_type(column_data: pd.Series, 
+                         data_type: Union[str, DataType] = None,
+                         sample: pd.Series = None) -> DataType:
         """Helper method to infer the imputr-defined data type of a given column.
 
         Parameters
@@ -127,6 +699,8 @@ class Column:
             The column for which the data type must be determined.
         data_type : Union[str, DataType]
             String or DataType enum representing imputr data type.
+        sample : pd.Series (optional)
+            Sample of an object-dtype column whose values are inspected. 
 
         Returns
         -------
@@ -139,9 +713,20 @@ class Column:
         if type(data_type) is DataType:
             return data_type
         
+        if is_datetime64_any_dtype(column_data.dtype):
+            return DataType.DATETIME
+        
         if is_numeric_dtype(column_data.dtype):
             return DataType.CONTINUOUS
         
+        if sample is not None and \
+            pd.api.types.infer_dtype(sample, skipna=True) in {'integer', 'floating', 'mixed-integer-float', 'decimal'}:
+            return DataType.CONTINUOUS
+        
+        if is_object_dtype(column_data.dtype) and Column._looks_like_datetime(
+                column_data.iloc[:1000].dropna().iloc[:100] if sample is None else sample.dropna()):
+            return DataType.DATETIME
+        
         if True in {
             is_object_dtype(column_data.dtype),
             is_string_dtype(column_data.dtype),
@@ -151,6 +736,22 @@ class Column:
             raise TypeError(f'Column data type \'{column_data.dtype}\' is not supported.')
 
 
+    @staticmethod
+    def _looks_like_datetime(probe: pd.Series) -> bool:
+        """Checks whether all values of a probe of an object column are timestamps
+        or strings that parse as timestamps. Numbers and words that parse as dates
+        (like month names) do not count.
+        """
+        if len(probe) == 0:
+            return False
+        inferred = pd.api.types.infer_dtype(probe, skipna=True)
+        if inferred in {'datetime', 'datetime64', 'date'}:
+            return True
+        if inferred != 'string' or not probe.str.contains(r'\d').all() \
+            or pd.to_numeric(probe, errors='coerce').notnull().any():
+            return False
+        return bool(pd.to_datetime(probe, errors='coerce').notnull().all())
+    
     def _count_number_of_unique_values(self, column: pd.Series) -> int:
         """
         Counts the number of unique values in a column. Includes NaN in the count.
@@ -159,6 +760,10 @@ class Column:
         -------
             int : the number of unique values in a column.
         """
+        if self._summary is not None:
+            return self._summary.unique_value_count
+        if self._value_counts is not None:
+            return len(self._value_counts)
         return column.nunique()
 
 
@@ -190,8 +795,26 @@ class Column:
         -------
             Union[str, float] : Either the mode or the mean of the library.
         """
+        if self._summary is not None:
+            average = self._summary.average
+            return average if type is DataType.CATEGORICAL else float(average)
         if type is DataType.CATEGORICAL:
+            if self._value_counts is not None:
+                return self._mode_from_value_counts(self._value_counts)
             # Picks first mode in the List of possible modes
-            return str(column.mode().iloc[0])
+            return column.mode().iloc[0]
         else:
-            return float(column.mean())
\ No newline at end of file
+            if self._moments is not None:
+                return self._moments.mean
+            return float(column.mean())
+    
+    @staticmethod
+    def _mode_from_value_counts(value_counts: pd.Series):
+        """Picks the first mode in sorted order, like pd.Series.mode, from value counts."""
+        if len(value_counts) == 0:
+            return None
+        modes = value_counts.index[value_counts == value_counts.max()]
+        try:
+            return min(modes)
+        except TypeError:
+            return modes[0]
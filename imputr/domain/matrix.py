@@ -0,0 +1,64 @@
+import os
+import tempfile
+from typing import List
+
+import numpy as np
+
+from .column import Column
+
+
+class EncodedMatrix:
+    """Shared float32 matrix of the numerically encoded imputed data of all columns of a table.
+
+    Stored column-major, so that writing back the imputed values of a column
+    is a contiguous write. Optionally backed by an np.memmap file in a scratch
+    directory, so that strategies read their training and prediction rows
+    through the page cache and the table does not need to fit in memory.
+
+    Parameters
+    ----------
+    columns : List[Column]
+        The columns of the table, in matrix column order.
+
+    scratch_dir : str (optional)
+        Directory of the memory-mapped file. Defaults to None, which keeps the
+        matrix in memory.
+    """
+
+    values: np.ndarray
+    path: str
+
+    def __init__(self, columns: List[Column], scratch_dir: str = None):
+        row_count = len(columns[0].data) if len(columns) > 0 else 0
+        shape = (row_count, len(columns))
+        self.path = None
+        # np.memmap cannot map empty files, empty tables stay in memory.
+        if scratch_dir is None or row_count == 0:
+            self.values = np.empty(shape, dtype=np.float32, order='F')
+        else:
+            handle, self.path = tempfile.mkstemp(suffix='.features', dir=scratch_dir)
+            os.close(handle)
+            self.values = np.memmap(self.path, dtype=np.float32, mode='w+', shape=shape, order='F')
+        for position, col in enumerate(columns):
+            # Filled in place, no in-memory imputed copy of the column is kept next to the file.
+            col.write_numeric_encoded_imputed_data(self.values[:, position])
+
+    def write_column(self, position: int, values) -> None:
+        """Overwrites a column in place, e.g. with its imputed values."""
+        self.values[:, position] = np.asarray(values, dtype=np.float32)
+
+    def rows(self, rows: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """Reads the given rows of the columns at the given positions into memory.
+
+        Returns
+        -------
+            np.ndarray : float32 array of shape (len(rows), len(positions)).
+        """
+        return self.values[np.ix_(rows, positions)]
+
+    def close(self) -> None:
+        """Releases the matrix and removes its scratch file."""
+        self.values = None
+        if self.path is not None:
+            os.remove(self.path)
+            self.path = None
@@ -0,0 +1,323 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+from typing import Iterable
+from .types import DataType, _to_epoch
+
+
+class MomentSketch:
+    """Mergeable count, mean and variance of the non-null values of a column.
+
+    Chunks are reduced with vectorized NumPy operations and combined with the
+    parallel variant of Welford's algorithm (Chan et al.).
+    """
+
+    count: int
+    mean: float
+    sum_of_squares: float
+
+    def __init__(self, count: int = 0, mean: float = float('nan'), sum_of_squares: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.sum_of_squares = sum_of_squares
+
+    @classmethod
+    def from_series(cls, data: pd.Series) -> 'MomentSketch':
+        if isinstance(data.dtype, pd.SparseDtype):
+            # Only reduce the stored values, the implicit fill values form one block.
+            array = data.array
+            stored = cls.from_series(pd.Series(array.sp_values))
+            implicit_count = len(array) - array.sp_index.npoints
+            if implicit_count == 0 or pd.isnull(array.fill_value):
+                return stored
+            return stored.merge(cls(implicit_count, float(array.fill_value), 0.0))
+        count = int(data.count())
+        if count == 0:
+            return cls()
+        return cls(count, float(data.mean()), float(data.var(ddof=0)) * count)
+
+    def update(self, data: pd.Series) -> 'MomentSketch':
+        """Adds the non-null values of the chunk to the sketch."""
+        merged = self.merge(MomentSketch.from_series(data))
+        self.count, self.mean, self.sum_of_squares = merged.count, merged.mean, merged.sum_of_squares
+        return self
+
+    def merge(self, other: 'MomentSketch') -> 'MomentSketch':
+        """Returns the sketch of the union of both summarized value sets."""
+        if self.count == 0:
+            return MomentSketch(other.count, other.mean, other.sum_of_squares)
+        if other.count == 0:
+            return MomentSketch(self.count, self.mean, self.sum_of_squares)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        return MomentSketch(count,
+                            self.mean + delta * other.count / count,
+                            self.sum_of_squares + other.sum_of_squares
+                            + delta ** 2 * self.count * other.count / count)
+
+    @property
+    def variance(self) -> float:
+        return self.sum_of_squares / self.count if self.count > 0 else 0.0
+
+
+class HeavyHittersSketch:
+    """Mergeable Misra-Gries summary of the most frequent values of a column.
+
+    Keeps at most `capacity` counters. Every value that occurs more than
+    n / (capacity + 1) times is guaranteed to be kept, so the mode is exact
+    whenever it is frequent enough and approximate otherwise.
+
+    Parameters
+    ----------
+    capacity : int (optional)
+        Maximum number of counters. Defaults to 1024.
+    """
+
+    capacity: int
+    counts: pd.Series
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.total = 0
+
+    def update(self, data: pd.Series) -> 'HeavyHittersSketch':
+        """Adds the non-null values of the chunk to the sketch."""
+        chunk_counts = data.value_counts()
+        self.total += int(chunk_counts.sum())
+        self.counts = self._prune(self.counts.add(chunk_counts, fill_value=0))
+        return self
+
+    def merge(self, other: 'HeavyHittersSketch') -> 'HeavyHittersSketch':
+        """Returns the sketch of the union of both summarized value sets."""
+        merged = HeavyHittersSketch(min(self.capacity, other.capacity))
+        merged.total = self.total + other.total
+        merged.counts = merged._prune(self.counts.add(other.counts, fill_value=0))
+        return merged
+
+    def _prune(self, counts: pd.Series) -> pd.Series:
+        """Subtracts the (capacity + 1)-th largest count and drops non-positive counters."""
+        counts = counts.astype(np.int64).sort_values(ascending=False, kind='stable')
+        if len(counts) > self.capacity:
+            counts = counts - counts.iloc[self.capacity]
+            counts = counts[counts > 0]
+        return counts
+
+    @property
+    def mode(self):
+        """The value with the highest count, first in sorted order on ties."""
+        if len(self.counts) == 0:
+            return None
+        modes = self.counts.index[self.counts == self.counts.max()]
+        try:
+            return min(modes)
+        except TypeError:
+            return modes[0]
+
+    @property
+    def mode_fraction(self) -> float:
+        """Lower bound of the fraction of the values that equal the mode."""
+        return float(self.counts.max() / self.total) if self.total > 0 else 0.0
+
+
+class HyperLogLog:
+    """Mergeable estimate of the number of unique values of a column.
+
+    Parameters
+    ----------
+    precision : int (optional)
+        Number of index bits; uses 2 ** precision one-byte registers and has a
+        relative standard error of about 1.04 / sqrt(2 ** precision). Defaults to 12.
+    """
+
+    precision: int
+    registers: np.ndarray
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, data: pd.Series) -> 'HyperLogLog':
+        """Adds the non-null values of the chunk to the sketch."""
+        data = data.dropna()
+        if is_numeric_dtype(data.dtype):
+            # Integer chunks become float chunks when they contain nulls; hash values alike.
+            data = data.astype(np.float64)
+        hashes = pd.util.hash_pandas_object(data, index=False).to_numpy(dtype=np.uint64)
+        if len(hashes) == 0:
+            return self
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+        remainder = hashes << np.uint64(self.precision)
+        ranks = np.minimum(self._count_leading_zeros(remainder), 64 - self.precision) + 1
+        np.maximum.at(self.registers, index, ranks.astype(np.uint8))
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Returns the sketch of the union of both summarized value sets."""
+        if self.precision != other.precision:
+            raise ValueError('Only HyperLogLog sketches with equal precision can be merged.')
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    @staticmethod
+    def _count_leading_zeros(values: np.ndarray) -> np.ndarray:
+        """Vectorized count of leading zero bits of uint64 values (64 for zero)."""
+        zeros = np.zeros(len(values), dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            top_is_zero = (values >> np.uint64(64 - shift)) == 0
+            zeros += shift * top_is_zero
+            values = np.where(top_is_zero, values << np.uint64(shift), values)
+        return zeros + (values == 0)
+
+    @property
+    def estimate(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        empty_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting for small cardinalities.
+            estimate = m * np.log(m / empty_registers)
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """Mergeable approximate quantiles of the non-null values of a column.
+
+    Keeps at most `capacity` weighted centroids of equal weight, obtained by
+    merging sorted values and centroids and compressing them again.
+
+    Parameters
+    ----------
+    capacity : int (optional)
+        Maximum number of centroids. Defaults to 512.
+    """
+
+    capacity: int
+    values: np.ndarray
+    weights: np.ndarray
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self.values = np.empty(0)
+        self.weights = np.empty(0)
+
+    def update(self, data: pd.Series) -> 'QuantileSketch':
+        """Adds the non-null values of the chunk to the sketch."""
+        values = data.dropna().to_numpy(dtype=np.float64)
+        self.values, self.weights = self._compress(np.concatenate([self.values, values]),
+                                                   np.concatenate([self.weights, np.ones(len(values))]))
+        return self
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Returns the sketch of the union of both summarized value sets."""
+        merged = QuantileSketch(min(self.capacity, other.capacity))
+        merged.values, merged.weights = merged._compress(np.concatenate([self.values, other.values]),
+                                                         np.concatenate([self.weights, other.weights]))
+        return merged
+
+    def _compress(self, values: np.ndarray, weights: np.ndarray) -> tuple:
+        order = np.argsort(values, kind='stable')
+        values, weights = values[order], weights[order]
+        if len(values) <= self.capacity:
+            return values, weights
+        cumulative = np.cumsum(weights) - weights
+        buckets = np.minimum((cumulative / cumulative[-1] * self.capacity).astype(np.int64),
+                             self.capacity - 1)
+        bucket_weights = np.bincount(buckets, weights=weights)
+        bucket_values = np.bincount(buckets, weights=values * weights)
+        non_empty = bucket_weights > 0
+        return bucket_values[non_empty] / bucket_weights[non_empty], bucket_weights[non_empty]
+
+    def quantile(self, q: float) -> float:
+        """Approximates the q-th quantile by interpolating between centroids."""
+        if len(self.values) == 0:
+            return float('nan')
+        positions = np.cumsum(self.weights) - self.weights / 2
+        return float(np.interp(q * self.weights.sum(), positions, self.values))
+
+    @property
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+
+class ColumnSummary:
+    """Mergeable streaming summary of a column that replaces exact full-column scans.
+
+    Built chunk by chunk with `update` and combined across partitions with
+    `merge`. Holds missing and row counts, a HyperLogLog unique count, and
+    moments plus a quantile sketch for continuous and datetime (in epoch 
+    nanoseconds) or a heavy hitters sketch for categorical columns.
+
+    Parameters
+    ----------
+    data_type : DataType
+        The imputr data type of the summarized column.
+    """
+
+    data_type: DataType
+    row_count: int
+    missing_value_count: int
+
+    def __init__(self, data_type: DataType):
+        self.data_type = data_type
+        self.row_count = 0
+        self.missing_value_count = 0
+        self.unique_values = HyperLogLog()
+        if data_type is DataType.CATEGORICAL:
+            self.heavy_hitters = HeavyHittersSketch()
+        else:
+            self.moments = MomentSketch()
+            self.quantiles = QuantileSketch()
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[pd.Series], data_type: DataType) -> 'ColumnSummary':
+        summary = cls(data_type)
+        for chunk in chunks:
+            summary.update(chunk)
+        return summary
+
+    def update(self, data: pd.Series) -> 'ColumnSummary':
+        """Adds a chunk of column data to the summary."""
+        if self.data_type is DataType.DATETIME:
+            data = _to_epoch(data)[0]
+        self.row_count += len(data)
+        self.missing_value_count += int(data.isnull().sum())
+        self.unique_values.update(data)
+        if self.data_type is DataType.CATEGORICAL:
+            self.heavy_hitters.update(data)
+        else:
+            self.moments.update(data)
+            self.quantiles.update(data)
+        return self
+
+    def merge(self, other: 'ColumnSummary') -> 'ColumnSummary':
+        """Returns the summary of both summarized chunks, e.g. of two partitions."""
+        if self.data_type is not other.data_type:
+            raise ValueError('Only summaries of columns with equal data types can be merged.')
+        merged = ColumnSummary(self.data_type)
+        merged.row_count = self.row_count + other.row_count
+        merged.missing_value_count = self.missing_value_count + other.missing_value_count
+        merged.unique_values = self.unique_values.merge(other.unique_values)
+        if self.data_type is DataType.CATEGORICAL:
+            merged.heavy_hitters = self.heavy_hitters.merge(other.heavy_hitters)
+        else:
+            merged.moments = self.moments.merge(other.moments)
+            merged.quantiles = self.quantiles.merge(other.quantiles)
+        return merged
+
+    @property
+    def unique_value_count(self) -> int:
+        return self.unique_values.estimate
+
+    @property
+    def average(self):
+        """Mode for categorical and mean for continuous columns."""
+        if self.data_type is DataType.CATEGORICAL:
+            return self.heavy_hitters.mode
+        return self.moments.mean
+
+    @property
+    def median(self) -> float:
+        return self.quantiles.median
@@ -1,7 +1,14 @@
-from typing import Union, List, Dict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Union, List, Dict, Iterable, Sequence
+import itertools
+import os
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from ..domain import DataType
 from ..domain import Column
+from .matrix import EncodedMatrix
+from .sketches import ColumnSummary
 
 
 class Table:
@@ -13,35 +20,166 @@ class Table:
     data : pd.DataFrame
         The Pandas DataFrame that contains the table data.
         
-    columns : Dict[str, Union[str, DataType]] (optional)
-        Dictionary that has column names as key and the data type as specified
-        in the Column constructor as value.
+    columns : List[Column]
+        The columns of the table in the order of the DataFrame columns.
+        
+    column_index : Dict[str, int]
+        Registry of column names and their position in `columns`.
     
 
     Parameters
     ----------
-    data : pd.DataFrame
-        The Pandas DataFrame that contains the table data.
+    data : Union[pd.DataFrame, sp.spmatrix]
+        The Pandas DataFrame that contains the table data. Columns may be pandas
+        sparse arrays. A SciPy sparse matrix is converted to a DataFrame of sparse 
+        columns named by position, without densifying it.
         
     predefined_datatypes : Dict[str, Union[str, DataType]] (optional)
         Dictionary that has column names as key and the data type as specified
         in the Column constructor as value.
+        
+    summaries : Dict[str, ColumnSummary] (optional)
+        Dictionary that has column names as key and a streaming summary of the 
+        column data as value, see the Column constructor.
+        
+    n_jobs : int (optional)
+        Number of workers that construct the columns in parallel. -1 uses all 
+        CPUs. Defaults to None, which constructs the columns sequentially.
+        
+    executor : str (optional)
+        Either 'thread' or 'process'. Threads suffice as the pandas and NumPy 
+        reductions release the GIL for most of the work. Defaults to 'thread'.
+        
+    sample_size : int (optional)
+        Caps the inference cost per object-dtype column, see the Column constructor.
+        Defaults to None (exact).
     
     """
     
     data: pd.DataFrame
     columns: List[Column]
+    column_index: Dict[str, int]
     
     def __init__(self,
-                 data: pd.DataFrame,
-                 predefined_datatypes: Dict[str, Union[str, DataType]] = None):
-        self.columns = self._construct_columns(data, predefined_datatypes)
+                 data: Union[pd.DataFrame, sp.spmatrix],
+                 predefined_datatypes: Dict[str, Union[str, DataType]] = None,
+                 summaries: Dict[str, ColumnSummary] = None,
+                 n_jobs: int = None,
+                 executor: str = 'thread',
+                 sample_size: int = None):
+        if sp.issparse(data):
+            data = pd.DataFrame.sparse.from_spmatrix(data)
+        self.data = data
+        self.columns = self._construct_columns(self.data, predefined_datatypes, summaries, 
+                                               n_jobs, executor, sample_size)
+        self.column_index = {col.name: index for index, col in enumerate(self.columns)}
+    
+    @property
+    def data(self) -> pd.DataFrame:
+        """Gets the table data. Appended rows are concatenated on first access."""
+        if len(self._appended) > 0:
+            self._data = pd.concat([self._data, *self._appended])
+            self._appended = []
+        return self._data
+    
+    @data.setter
+    def data(self, data: pd.DataFrame) -> None:
+        self._data = data
+        self._appended = []
+    
+    def __len__(self) -> int:
+        """Number of rows of the table, without concatenating appended rows."""
+        return len(self._data) + sum(len(rows) for rows in self._appended)
+    
+    def column(self, name: str) -> Column:
+        """Looks up a column by name in constant time."""
+        return self.columns[self.column_index[name]]
+    
+    def feature_columns(self, name: str) -> 'ColumnView':
+        """Returns a view of all columns except the column with the given name,
+        without copying the list of columns."""
+        return ColumnView(self.columns, self.column_index[name])
+    
+    def encoded_matrix(self, scratch_dir: str = None) -> EncodedMatrix:
+        """Builds the shared float32 matrix of the encoded imputed data of all columns.
+
+        Parameters
+        ----------
+        scratch_dir : str (optional)
+            Directory of the file that backs the matrix. Defaults to None (in memory).
+
+        Returns
+        -------
+            EncodedMatrix : matrix whose columns are in the order of `columns`.
+        """
+        return EncodedMatrix(self.columns, scratch_dir)
+    
+    @classmethod
+    def from_chunks(cls,
+                    chunks: Iterable[pd.DataFrame],
+                    predefined_datatypes: Dict[str, Union[str, DataType]] = None,
+                    n_jobs: int = None,
+                    executor: str = 'thread') -> 'Table':
+        """Constructs a Table from chunks of rows, e.g. `pd.read_csv(..., chunksize=...)`.
+        
+        Column statistics are built chunk by chunk with streaming summaries
+        instead of exact scans over the full columns. The chunks are still
+        concatenated into one in-memory DataFrame.
+
+        Parameters
+        ----------
+        chunks : Iterable[pd.DataFrame]
+            Chunks of rows with the same columns.
+            
+        predefined_datatypes : Dict[str, Union[str, DataType]] (optional)
+            Dictionary that has column names as key and the data type as specified
+            in the Column constructor as value.
+            
+        n_jobs : int (optional)
+            Number of workers that construct the columns, see the Table constructor.
+            
+        executor : str (optional)
+            Either 'thread' or 'process'. Defaults to 'thread'.
+
+        Returns
+        -------
+            Table : table with the concatenated rows of all chunks.
+        """
+        predefined_datatypes = {} if predefined_datatypes is None else predefined_datatypes
+        chunks = list(chunks)
+        data = pd.concat(chunks)
+        summaries = {name: Column._summarize_chunks([chunk[name] for chunk in chunks], data[name],
+                                                    predefined_datatypes.get(name))
+                     for name in data.columns}
+        return cls(data, predefined_datatypes, summaries, n_jobs, executor)
+        
+    def append(self, data: pd.DataFrame, imputed_data: pd.DataFrame = None) -> None:
+        """Appends rows to the table and updates the column statistics incrementally.
+        
+        The rows are only concatenated to the table data when it is accessed.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The Pandas DataFrame that contains the new rows, with the same columns.
+            
+        imputed_data : pd.DataFrame (optional)
+            The imputed new rows. Extends the imputed data of the columns.
+        """
+        for col in self.columns:
+            col.append(data[col.name], None if imputed_data is None else imputed_data[col.name])
+        self._appended.append(data)
         
     def _construct_columns(self, 
                            data: pd.DataFrame,
-                           predefined_datatypes) -> List[Column]:
+                           predefined_datatypes,
+                           summaries: Dict[str, ColumnSummary] = None,
+                           n_jobs: int = None,
+                           executor: str = 'thread',
+                           sample_size: int = None) -> List[Column]:
         """
-        Loops over dataframe columns to construct Column objects.
+        Loops over dataframe columns to construct Column objects, optionally 
+        on a pool of workers.
 
         Parameters
         ----------
@@ -51,12 +189,86 @@ class Table:
         predefined_datatypes : Dict[str, Union[str, DataType]] (optional)
             Dictionary that has column names as key and the data type as specified
             in the Column constructor as value.
+            
+        summaries : Dict[str, ColumnSummary] (optional)
+            Dictionary that has column names as key and the column summary as value.
+            
+        n_jobs : int (optional)
+            Number of workers. -1 uses all CPUs. Defaults to None (sequential).
+            
+        executor : str (optional)
+            Either 'thread' or 'process'. Defaults to 'thread'.
+            
+        sample_size : int (optional)
+            Caps the inference cost per object-dtype column. Defaults to None.
 
         Returns
         -------
             List[Column] : the List of constructed Column objects.
         """
-        return [Column(data.iloc[:, index]) if predefined_datatypes is None 
-                or item not in predefined_datatypes
-                else Column(data.iloc[:, index], predefined_datatypes[item]) 
-                for index, item in enumerate(data.columns)]
\ No newline at end of file
+        predefined_datatypes = {} if predefined_datatypes is None else predefined_datatypes
+        summaries = {} if summaries is None else summaries
+        column_args = [(data.iloc[:, index], predefined_datatypes.get(item), summaries.get(item),
+                        sample_size)
+                       for index, item in enumerate(data.columns)]
+        
+        n_jobs = os.cpu_count() if n_jobs == -1 else n_jobs
+        if n_jobs is None or n_jobs <= 1 or len(column_args) <= 1:
+            return [Column(*args) for args in column_args]
+        
+        if executor == 'thread':
+            pool_cls = ThreadPoolExecutor
+        elif executor == 'process':
+            pool_cls = ProcessPoolExecutor
+        else:
+            raise ValueError(f'Executor \'{executor}\' is not supported, use \'thread\' or \'process\'.')
+        
+        with pool_cls(max_workers=min(n_jobs, len(column_args))) as pool:
+            columns = list(pool.map(Column, *zip(*column_args)))
+        
+        if executor == 'process':
+            # Columns come back with pickled copies of their data, point them to the table again.
+            for column, (column_data, _, _, _) in zip(columns, column_args):
+                if column.data.dtype == column_data.dtype:
+                    column.data = column_data
+        return columns
+
+class ColumnView(Sequence):
+    """Read-only view of the columns of a table without one excluded position.
+    
+    Used as the feature columns of a strategy, so that building the feature 
+    sets of all columns of a wide table takes linear instead of quadratic time.
+
+    Parameters
+    ----------
+    columns : List[Column]
+        The columns of the table.
+        
+    excluded : int
+        Position of the column that is left out.
+    """
+    
+    def __init__(self, columns: List[Column], excluded: int):
+        self._columns = columns
+        self._excluded = excluded
+        
+    def __len__(self) -> int:
+        return len(self._columns) - 1
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Column view index out of range.')
+        return self._columns[index if index < self._excluded else index + 1]
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """Positions of the viewed columns in the table."""
+        return np.delete(np.arange(len(self._columns)), self._excluded)
+    
+    def __iter__(self):
+        return itertools.chain(itertools.islice(self._columns, self._excluded),
+                               itertools.islice(self._columns, self._excluded + 1, None))
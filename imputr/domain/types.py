@@ -1,16 +1,21 @@
 from enum import Enum
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
 
 class DataType(Enum):
     """Enum class that represents the various data types that the library is able to
     impute for and with.
 
-    Currently only contains categorical and continuous.
-    Future releases may contain specific enumertions for discrete, 
-    discrete-ordinal and a separate datetime type.
+    Contains categorical, continuous and datetime. Datetime columns are stored as
+    nanoseconds since the epoch and imputed like continuous columns.
+    Future releases may contain specific enumertions for discrete and 
+    discrete-ordinal.
     """
 
     CATEGORICAL = (1,)
     CONTINUOUS = 2
+    DATETIME = 3
     
     @classmethod
     def str_to_data_type(cls, string_name: str):
@@ -18,8 +23,63 @@ class DataType(Enum):
         
         str_mapping = {
             'cat': cls.CATEGORICAL,
-            'cont': cls.CONTINUOUS
+            'cont': cls.CONTINUOUS,
+            'datetime': cls.DATETIME
         } 
         if string_name not in str_mapping:
             raise ValueError(f'Data type with \'{string_name}\' string representation is not defined.')
-        return str_mapping[string_name]
\ No newline at end of file
+        return str_mapping[string_name]
+
+
+def _to_numeric(data: pd.Series) -> pd.Series:
+    """Converts an object column of numbers to a numeric column.
+
+    Raises
+    ------
+        ValueError : if a value is not a number, instead of turning it into a missing value.
+    """
+    numeric = pd.to_numeric(data, errors='coerce')
+    if numeric.isnull().sum() > data.isnull().sum():
+        raise ValueError(f'Column \'{data.name}\' has values that are not numbers.')
+    return numeric
+
+
+def _to_epoch(data: pd.Series) -> tuple:
+    """Converts timestamps, or strings of timestamps, to nanoseconds since the epoch.
+    
+    The int64 epoch values are returned as float64 so that missing values are NaN.
+    Timezone-aware timestamps are converted to UTC. Numeric data is taken to be 
+    epoch values already.
+
+    Returns
+    -------
+        tuple : the float64 epoch values and the timezone of the data (or None).
+        
+    Raises
+    ------
+        ValueError : if a value is not a timestamp, instead of turning it into a missing value.
+    """
+    if is_numeric_dtype(data.dtype):
+        return data.astype(np.float64), None
+    if not is_datetime64_any_dtype(data.dtype):
+        missing_value_count = data.isnull().sum()
+        data = pd.to_datetime(data, errors='coerce')
+        if not is_datetime64_any_dtype(data.dtype):
+            # Mixed UTC offsets, align them in UTC.
+            data = pd.to_datetime(data, errors='coerce', utc=True)
+        if data.isnull().sum() > missing_value_count:
+            raise ValueError(f'Column \'{data.name}\' has values that are not timestamps.')
+    timezone = getattr(data.dt, 'tz', None)
+    if timezone is not None:
+        data = data.dt.tz_convert('UTC').dt.tz_localize(None)
+    values = data.to_numpy(dtype='datetime64[ns]').view(np.int64).astype(np.float64)
+    values[data.isnull().to_numpy()] = np.nan
+    return pd.Series(values, index=data.index, name=data.name), timezone
+
+
+def _from_epoch(values: pd.Series, timezone=None) -> pd.Series:
+    """Converts nanoseconds since the epoch back to timestamps in the given timezone."""
+    timestamps = pd.to_datetime(values.round(), unit='ns')
+    if timezone is not None:
+        timestamps = timestamps.dt.tz_localize('UTC').dt.tz_convert(timezone)
+    return timestamps
@@ -0,0 +1,2 @@
+from .masking import mask_mcar, mask_mar, mask_pattern
+from .harness import evaluate
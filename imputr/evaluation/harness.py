@@ -0,0 +1,129 @@
+import time
+import tracemalloc
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from ..backend import InProcessBackend
+from ..backend._base import _BaseBackend
+from ..domain import DataType
+from ..imputers import AutoImputer, MeanImputer
+from .masking import mask_mcar, mask_mar, mask_pattern
+
+_MASKINGS = {
+    'mcar': mask_mcar,
+    'mar': mask_mar,
+    'pattern': mask_pattern
+}
+
+_IMPUTERS = {
+    'auto': AutoImputer,
+    'mean': MeanImputer
+}
+
+
+def evaluate(data: pd.DataFrame,
+             candidates: Dict[str, Dict],
+             masking: str = 'mcar',
+             fraction: float = 0.1,
+             backend: _BaseBackend = None,
+             random_state: int = 0) -> pd.DataFrame:
+    """Scores imputer configurations on known cells that are hidden from them.
+
+    Hides a fraction of the known cells, imputes the masked table with every
+    candidate configuration and compares the imputed with the hidden values.
+    Candidates run as tasks on the execution backend, e.g. in parallel on a
+    ProcessPoolBackend.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The table to evaluate on, e.g. one of the bundled `datasets/`.
+
+    candidates : Dict[str, Dict]
+        Dictionary of candidate names and configurations. A configuration holds
+        the imputer constructor arguments, e.g. `predefined_strategies`, plus
+        an optional 'imputer' key that is either 'auto' (default) or 'mean'.
+
+    masking : str (optional)
+        How cells are hidden: 'mcar', 'mar' or 'pattern', see the masking
+        functions. Defaults to 'mcar'.
+
+    fraction : float (optional)
+        Fraction of the known cells (or rows for 'pattern') that is hidden.
+        Defaults to 0.1.
+
+    backend : _BaseBackend (optional)
+        Execution backend that runs the candidates. Defaults to None, which
+        uses the InProcessBackend.
+
+    random_state : int (optional)
+        Seed of the masking. Defaults to 0.
+
+    Returns
+    -------
+        pd.DataFrame : one row per candidate and masked column with the metric
+            ('rmse' or 'accuracy'), its score, the number of hidden cells,
+            fit and predict seconds and the peak traced memory in bytes. The 
+            peak memory is measured in a second, traced pass of the candidate,
+            so that tracing does not slow down the timed pass.
+    """
+    if masking not in _MASKINGS:
+        raise ValueError(f'Masking \'{masking}\' is not supported, use one of {sorted(_MASKINGS)}.')
+
+    masked, mask = _MASKINGS[masking](data, fraction, random_state=random_state)
+    backend = InProcessBackend() if backend is None else backend
+    reports = backend.gather(backend.map(_evaluate_candidate, list(candidates.items()),
+                                         original=backend.broadcast(data),
+                                         masked=backend.broadcast(masked),
+                                         mask=backend.broadcast(mask)))
+    return pd.concat(reports)
+
+
+def _evaluate_candidate(candidate: tuple,
+                        original: pd.DataFrame,
+                        masked: pd.DataFrame,
+                        mask: pd.DataFrame) -> pd.DataFrame:
+    """Fits and scores a single candidate configuration, runs on the workers of a backend."""
+    name, config = candidate
+    config = dict(config)
+    imputer_cls = _IMPUTERS[config.pop('imputer', 'auto')]
+
+    # Tracing slows allocations down, so the timings come from an untraced pass.
+    start = time.perf_counter()
+    imputer = imputer_cls(masked, **config).fit()
+    fit_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    imputed = imputer.transform(masked)
+    predict_seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        imputer_cls(masked, **config).fit().transform(masked)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    rows = []
+    for column_name in mask.columns[mask.any(axis=0).to_numpy()]:
+        hidden = mask[column_name].to_numpy()
+        expected = original[column_name].to_numpy()[hidden]
+        predicted = imputed[column_name].to_numpy()[hidden]
+        if imputer.table.column(column_name).type is DataType.CATEGORICAL:
+            metric, score = 'accuracy', float(np.mean(expected == predicted))
+        else:
+            difference = pd.to_numeric(pd.Series(predicted)) - pd.to_numeric(pd.Series(expected))
+            metric, score = 'rmse', float(np.sqrt(np.mean(np.square(difference.to_numpy(dtype=np.float64)))))
+        rows.append({'candidate': name,
+                     'column': column_name,
+                     'metric': metric,
+                     'score': score,
+                     'masked_cells': int(hidden.sum()),
+                     'fit_seconds': fit_seconds,
+                     'predict_seconds': predict_seconds,
+                     'peak_memory_bytes': peak_memory})
+    return pd.DataFrame(rows, columns=['candidate', 'column', 'metric', 'score', 'masked_cells',
+                                       'fit_seconds', 'predict_seconds', 'peak_memory_bytes']) \
+        .set_index(['candidate', 'column'])
@@ -0,0 +1,129 @@
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def mask_mcar(data: pd.DataFrame,
+              fraction: float = 0.1,
+              columns: List[str] = None,
+              random_state: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Hides observed cells completely at random (MCAR).
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The table whose known cells are hidden.
+        
+    fraction : float (optional)
+        Fraction of the observed cells of each column that is hidden. Defaults to 0.1.
+        
+    columns : List[str] (optional)
+        Columns in which cells are hidden. Defaults to None (all columns).
+        
+    random_state : int (optional)
+        Seed of the masking. Defaults to 0.
+
+    Returns
+    -------
+        Tuple[pd.DataFrame, pd.DataFrame] : the masked table and a boolean 
+            frame that is True for the hidden cells.
+    """
+    rng = np.random.default_rng(random_state)
+    hidden = np.zeros(data.shape, dtype=bool)
+    for name in data.columns if columns is None else columns:
+        position = data.columns.get_loc(name)
+        observed = np.flatnonzero(data[name].notnull().to_numpy())
+        hidden[rng.choice(observed, int(round(fraction * len(observed))), replace=False), position] = True
+    mask = pd.DataFrame(hidden, index=data.index, columns=data.columns)
+    return data.mask(mask), mask
+
+
+def mask_mar(data: pd.DataFrame,
+             fraction: float = 0.1,
+             columns: List[str] = None,
+             random_state: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Hides observed cells at random conditional on another column (MAR).
+
+    For each column another, randomly chosen column drives the missingness:
+    the probability that a cell is hidden grows with the rank of the value 
+    of the driving column in the same row.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The table whose known cells are hidden.
+        
+    fraction : float (optional)
+        Fraction of the observed cells of each column that is hidden. Defaults to 0.1.
+        
+    columns : List[str] (optional)
+        Columns in which cells are hidden. Defaults to None (all columns).
+        
+    random_state : int (optional)
+        Seed of the masking. Defaults to 0.
+
+    Returns
+    -------
+        Tuple[pd.DataFrame, pd.DataFrame] : the masked table and a boolean 
+            frame that is True for the hidden cells.
+    """
+    rng = np.random.default_rng(random_state)
+    hidden = np.zeros(data.shape, dtype=bool)
+    for name in data.columns if columns is None else columns:
+        others = [other for other in data.columns if other != name]
+        if len(others) == 0:
+            raise ValueError('MAR masking needs at least two columns.')
+        driver = data[others[rng.integers(len(others))]]
+        weights = driver.rank(pct=True, method='average').fillna(0.5).to_numpy()
+        observed = np.flatnonzero(data[name].notnull().to_numpy())
+        weights = weights[observed] + 1e-12
+        rows = rng.choice(observed, int(round(fraction * len(observed))), replace=False,
+                          p=weights / weights.sum())
+        hidden[rows, data.columns.get_loc(name)] = True
+    mask = pd.DataFrame(hidden, index=data.index, columns=data.columns)
+    return data.mask(mask), mask
+
+
+def mask_pattern(data: pd.DataFrame,
+                 fraction: float = 0.1,
+                 columns: List[str] = None,
+                 random_state: int = 0) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Hides observed cells with the missingness patterns that occur in the data.
+
+    Rows are drawn and each gets the set of missing columns of a randomly 
+    drawn row with missing values, so that values go missing together like
+    they do in the real data. Falls back to MCAR if no value is missing.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The table whose known cells are hidden.
+        
+    fraction : float (optional)
+        Fraction of the rows that get a missingness pattern. Defaults to 0.1.
+        
+    columns : List[str] (optional)
+        Columns in which cells are hidden. Defaults to None (all columns).
+        
+    random_state : int (optional)
+        Seed of the masking. Defaults to 0.
+
+    Returns
+    -------
+        Tuple[pd.DataFrame, pd.DataFrame] : the masked table and a boolean 
+            frame that is True for the hidden cells.
+    """
+    missing = data.isnull().to_numpy()
+    if columns is not None:
+        missing = missing & data.columns.isin(columns)
+    patterns = missing[missing.any(axis=1)]
+    if len(patterns) == 0:
+        return mask_mcar(data, fraction, columns, random_state)
+    
+    rng = np.random.default_rng(random_state)
+    rows = rng.choice(len(data), int(round(fraction * len(data))), replace=False)
+    hidden = np.zeros(missing.shape, dtype=bool)
+    hidden[rows] = patterns[rng.integers(len(patterns), size=len(rows))]
+    mask = pd.DataFrame(hidden & ~missing, index=data.index, columns=data.columns)
+    return data.mask(mask), mask
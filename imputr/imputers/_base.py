@@ -1,14 +1,24 @@
 from abc import ABC, abstractmethod
 from operator import attrgetter
+import copy
+import time
 
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 
+from ..backend import InProcessBackend
+from ..backend._base import _BaseBackend
 from ..domain import Table, Column, DataType
-from ..strategy._base import _BaseStrategy
-from ..strategy.randomforest import _MultivariateStrategy
-from ..strategy import *
-from ..strategy.mean import _UnivariateStrategy, MeanStrategy
-from typing import Union, Dict, List
+from ..domain.column import _take_labels
+from ..domain.table import ColumnView
+from ..strategy._base import _BaseStrategy, _MultivariateStrategy, _UnivariateStrategy
+from ..strategy.cache import StrategyCache
+from ..strategy.mean import MeanStrategy
+from ..strategy.registry import get_strategy
+from typing import Union, Dict, Iterable, List, Set, Tuple
+from ._cost import _CostModel, _probe_predictability, _stack_probe_rows
+from ._threads import _limit_threads, _resolve_cpu_budget
 
 class _BaseImputer(ABC):
     """Abstract base class for imputer classes.
@@ -19,12 +29,52 @@ class _BaseImputer(ABC):
     
     Parameters
     ----------
-    data : pd.DataFrame
-        The dataframe which undergoes imputation.
+    data : Union[pd.DataFrame, sp.spmatrix, Iterable[pd.DataFrame]]
+        The dataframe which undergoes imputation, a SciPy sparse matrix, or 
+        chunks of its rows.
     
     predefined_datatypes : Dict[str, Union[str, DataType]] (optional)
         Dictionary that has column names as key and the data type as specified
         in the Column constructor as value.
+        
+    memory_budget : int (optional)
+        Maximum number of bytes a strategy may use for its feature buffer.
+        Strategies that would exceed it train on a sample of rows and impute
+        in chunks. Defaults to None (no budget).
+    
+    keep_fitted_models : bool (optional)
+        Flag to indicate whether fitted models are kept after imputation.
+        Defaults to True.
+        
+    cache : StrategyCache (optional)
+        On-disk cache from which fitted models are loaded when the data and
+        configuration of a strategy did not change. Defaults to None.
+        
+    n_jobs : int (optional)
+        Number of threads that construct the table columns in parallel. 
+        -1 uses all CPUs. Defaults to None (sequential).
+        
+    sample_size : int (optional)
+        Caps the type and mode inference cost per object-dtype column by 
+        inspecting a random sample of this many rows. Defaults to None (exact).
+        
+    time_budget : float (optional)
+        Wall-clock seconds that fitting may take. Multivariate strategies whose
+        estimated cost does not fit in the budget fall back to the MeanStrategy,
+        see `fit`. Defaults to None (no budget).
+        
+    scratch_dir : str (optional)
+        Directory in which the encoded feature matrix of the table is memory-mapped
+        during fitting, so that tables larger than memory can be imputed. 
+        Defaults to None (per-strategy feature buffers in memory).
+        
+    cpu_budget : int (optional)
+        Number of CPUs the imputer may use, -1 for all CPUs. The table columns are
+        constructed side by side with the whole budget, and the strategies fit 
+        one at a time, also with the whole budget for the threads of their 
+        estimators and the BLAS pools, see `fit`. An explicit `n_jobs` still 
+        sets the table construction threads. Defaults to None (sequential 
+        construction, thread pools at their defaults).
 
     """
     
@@ -35,19 +85,63 @@ class _BaseImputer(ABC):
     strategies: Dict[str, _BaseStrategy]
     ordered_columns: List[Column]
     include_non_missing: bool
+    memory_budget: int
+    keep_fitted_models: bool
+    cache: StrategyCache
+    n_jobs: int
+    is_fitted: bool
+    refitted_columns: List[str]
+    time_budget: float
+    degraded_columns: List[str]
+    fit_report: pd.DataFrame
+    scratch_dir: str
+    cpu_budget: int
             
     def __init__(self,
                  data: pd.DataFrame,
-                 predefined_datatypes: Dict[str, Union[str, DataType]] = None):
-        self.table = Table(data, predefined_datatypes)
-        
-        
-        
+                 predefined_datatypes: Dict[str, Union[str, DataType]] = None,
+                 memory_budget: int = None,
+                 keep_fitted_models: bool = True,
+                 cache: StrategyCache = None,
+                 n_jobs: int = None,
+                 sample_size: int = None,
+                 time_budget: float = None,
+                 scratch_dir: str = None,
+                 cpu_budget: int = None):
+        if cpu_budget is not None and n_jobs is None:
+            # Columns are constructed before anything else runs, they get the whole budget.
+            n_jobs = _resolve_cpu_budget(cpu_budget)
+        if isinstance(data, pd.DataFrame) or sp.issparse(data):
+            self.table = Table(data, predefined_datatypes, n_jobs=n_jobs, sample_size=sample_size)
+        else:
+            self.table = Table.from_chunks(data, predefined_datatypes, n_jobs=n_jobs)
+        self.n_jobs = n_jobs
+        self.predefined_datatypes = {} if predefined_datatypes is None else predefined_datatypes
+        self.is_fitted = False
+        self.memory_budget = memory_budget
+        self.keep_fitted_models = keep_fitted_models
+        self.cache = cache
+        self.time_budget = time_budget
+        self.scratch_dir = scratch_dir
+        self.cpu_budget = cpu_budget
+        self.degraded_columns = []
+        self.fit_report = None
+        # Only a caller's DataFrame can be imputed in place, see `impute`.
+        self._data_is_caller_frame = isinstance(data, pd.DataFrame)
 
     @abstractmethod
-    def impute(self) -> pd.DataFrame:
+    def impute(self, inplace: bool = False, delta: bool = False) -> pd.DataFrame:
         """Imputes dataset as configured in the framework.
 
+        Parameters
+        ----------
+        inplace : bool (optional)
+            Flag to write the imputed values into the given DataFrame and return
+            None. Defaults to False.
+            
+        delta : bool (optional)
+            Flag to return only the imputed cells. Defaults to False.
+
         Returns
         -------
             pd.DataFrame: Imputed dataset.
@@ -57,7 +151,8 @@ class _BaseImputer(ABC):
     def _determine_order(self, 
                         columns: List[Column],
                         predefined_strategies: Dict[str, _BaseStrategy],
-                        predefined_order: Dict[str, int] = None) -> List[Column]:
+                        predefined_order: Dict[str, int] = None,
+                        cost_model: _CostModel = None) -> List[Column]:
         """
         Determines the imputation order based on the predefined order, imputation
         strategy type and the number of missing values. The algorithm looks at predefined
@@ -77,6 +172,10 @@ class _BaseImputer(ABC):
         predefined_order : Dict[str, int] (optional)
             Dictionary of predefined order in which the imputation must be done.
             
+        cost_model : _CostModel (optional)
+            If given, multivariate strategies are ranked by estimated cost instead,
+            cheapest first, so that a time budget covers as many columns as possible.
+            
         Returns
         -------
             List[Column] : returns List of Column references in imputation order.
@@ -88,7 +187,7 @@ class _BaseImputer(ABC):
         if predefined_order is not None:
             columns_tup_with_ranking = []
             for e in predefined_order.items():
-                tup = (next(filter(lambda x: x.name == e[0], columns)), e)
+                tup = (self.table.column(e[0]), e)
                 columns_tup_with_ranking.append(tup)
             columns_tup_with_ranking = sorted(columns_tup_with_ranking, 
                                                 key=lambda x: x[1][1])
@@ -102,9 +201,13 @@ class _BaseImputer(ABC):
         
         multivariate_strat_cols = filter(lambda x: 
                 isinstance(predefined_strategies[x.name], _MultivariateStrategy), columns)
-        multivariate_strat_cols = sorted(multivariate_strat_cols, 
-                                         key=attrgetter('missing_value_count'),
-                                         reverse=True)
+        if cost_model is not None:
+            multivariate_strat_cols = sorted(multivariate_strat_cols, 
+                                             key=lambda x: cost_model.estimate(predefined_strategies[x.name]))
+        else:
+            multivariate_strat_cols = sorted(multivariate_strat_cols, 
+                                             key=attrgetter('missing_value_count'),
+                                             reverse=True)
         
         univariate_strat_cols = filter(lambda x: 
                 isinstance(predefined_strategies[x.name], _UnivariateStrategy), columns)
@@ -169,7 +272,7 @@ class _BaseImputer(ABC):
         constructed_strategies: Dict[str, _BaseStrategy] = {}
         
         for col in self.included_columns:
-            feature_columns = list(filter(lambda x: x.name != col.name, self.table.columns))
+            feature_columns = self.table.feature_columns(col.name)
             if col.name in predefined_strategies:
                 strategy_kwargs = predefined_strategies[col.name]
                 # Get strategy class to be constructed from string mapping
@@ -195,8 +298,64 @@ class _BaseImputer(ABC):
                         
         return constructed_strategies
 
+    def _select_strategies(self, 
+                           predefined_strategies: Dict[str, Dict] = None) -> Dict[str, float]:
+        """Replaces multivariate strategies that do not pay off by the MeanStrategy.
+        
+        Columns that were not given a strategy are filled univariately when 
+        hardly any of their values are missing, or when a cheap probe shows that 
+        the other columns barely predict them.
+
+        Parameters
+        ----------
+        predefined_strategies : Dict[str, Dict] (optional)
+            Contains name - Dict as defined in public API. These columns keep their strategy.
+
+        Returns:
+            Dict[str, float]: predictability probe score per probed column.
+        """
+        
+        predefined_strategies = {} if predefined_strategies is None else predefined_strategies
+        predictability = {}
+        probe = None
+        for col in self.included_columns:
+            strategy = self.strategies[col.name]
+            if col.name in predefined_strategies or not isinstance(strategy, _MultivariateStrategy):
+                continue
+            if col.missing_value_count < _CostModel.MIN_MISSING_FRACTION * len(col.data):
+                self.strategies[col.name] = MeanStrategy(col)
+                continue
+            if probe is None:
+                probe = _stack_probe_rows(self.table.columns)
+            predictability[col.name] = _probe_predictability(col, self._feature_positions(strategy), *probe)
+            if predictability[col.name] < _CostModel.MIN_PREDICTABILITY:
+                self.strategies[col.name] = MeanStrategy(col)
+        return predictability
+
+    def _schedule_memory_budget(self) -> None:
+        """Limits the buffer rows of multivariate strategies whose full feature
+        buffer would exceed the memory budget.
+        
+        Buffers are released after each column, so the budget applies per strategy.
+        Forests with limited buffer rows train on a sample of that many rows, see 
+        `training_fraction` in `fit_report`, and impute in chunks of that many rows.
+        """
+        
+        if self.memory_budget is None:
+            return
+        
+        for strategy in self.strategies.values():
+            if not isinstance(strategy, _MultivariateStrategy):
+                continue
+            if strategy.estimated_buffer_bytes() > self.memory_budget:
+                bytes_per_row = max(len(strategy.feature_columns), 1) * 8
+                strategy.max_buffer_rows = max(self.memory_budget // bytes_per_row, 1)
+
     def str_to_strategy(self, string_name: str) -> _BaseStrategy:
         """Returns the strategy class type for given string abbreviation.
+        
+        Names are resolved through the strategy registry, see `get_strategy`,
+        which imports the strategy module on first use.
 
         Parameters
         ----------
@@ -208,37 +367,612 @@ class _BaseImputer(ABC):
             _BaseStrategy : the imputation strategy class type.
         """
         
+        return get_strategy(string_name)
+
+
+    def compact(self, max_depth: int = None, quantize_leaves: bool = False) -> pd.DataFrame:
+        """Compacts the fitted strategies to reduce memory usage of the imputer.
+
+        Strategies without fitted models (e.g. MeanStrategy) are left untouched.
+
+        Parameters
+        ----------
+        max_depth : int (optional)
+            Depth to which tree-based models are pruned. Defaults to None (no pruning).
+
+        quantize_leaves : bool (optional)
+            Flag to quantize leaf values of tree-based models to uint8. Defaults to False.
+
+        Returns:
+            pd.DataFrame: report with size and held-out score before and after
+                compaction, indexed by column name.
+        """
+
+        report = {}
+        for col in self.ordered_columns:
+            strategy_report = self.strategies[col.name].compact(max_depth=max_depth,
+                                                                quantize_leaves=quantize_leaves)
+            self.strategies[col.name].release_buffers()
+            if strategy_report is not None:
+                report[col.name] = strategy_report
+
+        return pd.DataFrame.from_dict(report, orient='index',
+                                      columns=['metric', 'bytes_before', 'bytes_after',
+                                               'score_before', 'score_after'])
+
+    def fit(self) -> '_BaseImputer':
+        """Fits the strategies in imputation order and imputes the table columns.
         
-        str_to_strategy_mapping = {
-            'rf': RandomForestStrategy,
-            'mean': MeanStrategy,
-            # 'median': MedianStrategy,
-            # 'mode': ModeStrategy,
-        }
+        Each strategy is fitted on the data imputed by the strategies before it.
         
-        if string_name not in str_to_strategy_mapping:
-                raise ValueError(f'Strategy with \'{string_name}\' string representation is not defined.')
-        return str_to_strategy_mapping[string_name]
-
+        With a time budget, the cost of each strategy is estimated from the number 
+        of rows, features and missing values. The budget is first spent on the 
+        multivariate strategies that impute the most missing values per estimated 
+        second, the others are replaced by the MeanStrategy. Strategies that 
+        would still overrun the budget during fitting are replaced as well. The 
+        names of the replaced columns are stored in `degraded_columns`.
+        
+        Strategies of the same class first prepare shared state together, e.g.
+        linear strategies are solved from one shared Gram matrix.
+        
+        Per-column timings are stored in `fit_report`, next to the fraction of the
+        observed rows each model was trained on, which is below 1 for forests that
+        trained on a sample of rows to stay within the memory budget.
+        
+        With a CPU budget, the strategies fit one at a time as each depends on the
+        columns imputed before it, so the whole budget goes to the threads of their
+        estimators and the BLAS pools.
+        
+        With a scratch directory, multivariate strategies read their feature rows
+        from a shared memory-mapped matrix of the encoded table, into which the
+        imputed values of each column are written back.
 
-    def impute(self) -> pd.DataFrame:
-        """Imputes dataframe with specified strategies.
+        Returns:
+            _BaseImputer: the fitted imputer.
+        """
         
-        Overwrite this method if you wish to implement different imputation behavior.
+        return self._fit()
+    
+    def _fit(self, inplace: bool = False) -> '_BaseImputer':
+        """Fits the strategies as described in `fit`.
+        
+        In place, the imputed values of each column are written into the table
+        data as soon as the column is imputed, see `_write_imputed_column`.
+        """
+        
+        cost_model = _CostModel()
+        kept_columns = None if self.time_budget is None else self._plan_time_budget(cost_model)
+        self.degraded_columns = []
+        report = {}
+        start = time.perf_counter()
+        
+        threads = self._inner_threads()
+        column_digests = {}
+        by_class = {}
+        for col in self.ordered_columns:
+            self.strategies[col.name].n_jobs = threads
+            by_class.setdefault(type(self.strategies[col.name]), []).append(self.strategies[col.name])
+        
+        with _limit_threads(threads):
+            for strategy_cls, strategies in by_class.items():
+                strategy_cls.fit_together(strategies)
+            
+            feature_matrix = None if self.scratch_dir is None else self.table.encoded_matrix(self.scratch_dir)
+            try:
+                for col in self.ordered_columns:
+                    strategy = self.strategies[col.name]
+                    estimate = cost_model.estimate(strategy)
+                    if kept_columns is not None and isinstance(strategy, _MultivariateStrategy) and \
+                        (col.name not in kept_columns or time.perf_counter() - start + estimate > self.time_budget):
+                        strategy = self._degrade(col)
+                        estimate = cost_model.estimate(strategy)
+            
+                    column_start = time.perf_counter()
+                    if feature_matrix is not None and isinstance(strategy, _MultivariateStrategy):
+                        strategy.use_feature_matrix(feature_matrix, self._feature_positions(strategy))
+                    self._fit_strategy(strategy, column_digests)
+                    imputed_series = strategy.impute_column()
+            
+                    #TODO Measure time the complexity of this operation
+                    col.imputed_data = imputed_series
+                    # Hold no reference while the next column fits, the column may read its
+                    # imputed data from the table data instead.
+                    del imputed_series
+                    if inplace:
+                        self._write_imputed_column(self.table, col)
+                    if feature_matrix is not None:
+                        feature_matrix.write_column(self.table.column_index[col.name], 
+                                                    col.numeric_encoded_imputed_data)
+            
+                    strategy.release_buffers()
+                    if not self.keep_fitted_models:
+                        strategy.release_model()
+            
+                    seconds = time.perf_counter() - column_start
+                    cost_model.observe(strategy, seconds)
+                    report[col.name] = {'strategy': type(strategy).__name__, 
+                                        'estimated_seconds': estimate,
+                                        'seconds': seconds,
+                                        'degraded': col.name in self.degraded_columns,
+                                        'training_fraction': strategy.training_fraction}
+            finally:
+                if feature_matrix is not None:
+                    feature_matrix.close()
+        
+        self.fit_report = pd.DataFrame.from_dict(report, orient='index',
+                                                 columns=['strategy', 'estimated_seconds', 
+                                                          'seconds', 'degraded', 'training_fraction'])
+        self._fit_statistics = {col.name: col.statistics for col in self.ordered_columns}
+        self._fit_scores = {}
+        self.is_fitted = self.keep_fitted_models
+        return self
+    
+    def _inner_threads(self) -> int:
+        """Threads of the estimators and BLAS pools for strategies that run one at a time.
+        
+        Forests parallelize over their trees, so all CPUs of the budget are used
+        whatever the number of rows.
 
         Returns:
-            pd.DataFrame: imputed dataset.
+            int: number of threads, None without CPU budget.
         """
         
-        imputed_df = pd.DataFrame()
+        if self.cpu_budget is None:
+            return None
+        return _resolve_cpu_budget(self.cpu_budget)
+    
+    def _feature_positions(self, strategy: _MultivariateStrategy) -> np.ndarray:
+        """Positions of the feature columns of the strategy in the table."""
+        
+        if isinstance(strategy.feature_columns, ColumnView):
+            return strategy.feature_columns.positions
+        return np.asarray([self.table.column_index[col.name] for col in strategy.feature_columns],
+                          dtype=np.int64)
+    
+    def _plan_time_budget(self, cost_model: _CostModel) -> Set[str]:
+        """Greedily picks the multivariate strategies that fit in the time budget,
+        by missing values imputed per estimated second.
+
+        Returns:
+            Set[str]: names of the columns that keep their multivariate strategy.
+        """
         
+        remaining = self.time_budget
+        candidates = []
         for col in self.ordered_columns:
             strategy = self.strategies[col.name]
+            if isinstance(strategy, _MultivariateStrategy):
+                fallback_estimate = cost_model.estimate(MeanStrategy(col))
+                remaining -= fallback_estimate
+                candidates.append((col, cost_model.estimate(strategy) - fallback_estimate))
+            else:
+                remaining -= cost_model.estimate(strategy)
+        
+        candidates.sort(key=lambda x: x[0].missing_value_count / max(x[1], 1e-9), reverse=True)
+        kept_columns = set()
+        for col, extra_seconds in candidates:
+            if extra_seconds <= remaining:
+                kept_columns.add(col.name)
+                remaining -= extra_seconds
+        return kept_columns
+    
+    def _degrade(self, col: Column) -> _BaseStrategy:
+        """Replaces the strategy of the column by the MeanStrategy."""
+        
+        strategy = MeanStrategy(col)
+        self.strategies[col.name] = strategy
+        self.degraded_columns.append(col.name)
+        return strategy
+    
+    def _fit_strategy(self, strategy: _BaseStrategy, column_digests: Dict[str, Tuple] = None) -> None:
+        """Fits the strategy, or loads its fitted model from the cache if configured.
+        
+        The column digests of the cache are shared between the strategies of one fit.
+        """
+        if self.cache is None:
             strategy.fit()
-            imputed_series = strategy.impute_column()
+        else:
+            self.cache.fit(strategy, column_digests)
+    
+    def append(self, new_rows: pd.DataFrame, drift_threshold: float = 0.1) -> pd.DataFrame:
+        """Appends rows to the fitted imputer and imputes them.
+        
+        The new rows are imputed with the fitted strategies and the column 
+        statistics are updated incrementally. Only columns whose statistics or
+        model error drifted beyond the threshold since fitting are refitted on
+        the whole table, which also re-imputes their earlier rows.
+        
+        A column has drifted when:
+        
+        - its missing fraction changed by more than `drift_threshold`
+        - its mean moved by more than `drift_threshold` standard deviations (continuous)
+        - its mode changed or the fraction of the mode changed by more than `drift_threshold` (categorical)
+        - its model error on the observed new values is relatively `drift_threshold` worse than
+          its out-of-sample error on the fitted rows, see `validation_score` of the strategies
+        
+        The names of the refitted columns are stored in `refitted_columns`.
+
+        Parameters
+        ----------
+        new_rows : pd.DataFrame
+            The rows to append, with the same columns as the table.
+            
+        drift_threshold : float (optional)
+            Threshold on the drift measures above which a column is refitted.
+            Defaults to 0.1.
+
+        Returns:
+            pd.DataFrame: the imputed new rows.
+        """
+        
+        if not self.is_fitted:
+            raise ValueError('Imputer must be fitted with fitted models kept before append.')
+        
+        old_row_count = len(self.table)
+        for col in self.ordered_columns:
+            if col.name not in self._fit_scores:
+                # Out-of-sample, like the score on the new rows it is compared with.
+                self._fit_scores[col.name] = self.strategies[col.name].validation_score()
+                # Feature data read for the score does not cover the new rows.
+                self.strategies[col.name].release_buffers()
+        
+        imputed_new_rows = self.transform(new_rows)
+        self.table.append(new_rows, imputed_new_rows)
+        self._data_is_caller_frame = False
+        self._schedule_memory_budget()
+        
+        new_row_positions = np.arange(old_row_count, len(self.table))
+        self.refitted_columns = []
+        column_digests = {}
+        with _limit_threads(self._inner_threads()):
+            for col in self.ordered_columns:
+                strategy = self.strategies[col.name]
+                drifted = self._has_drifted(col, strategy, new_row_positions, drift_threshold)
+                strategy.release_buffers()
+                if not drifted:
+                    continue
+                
+                self._fit_strategy(strategy, column_digests)
+                col.imputed_data = strategy.impute_column()
+                strategy.release_buffers()
+                
+                self._fit_statistics[col.name] = col.statistics
+                self._fit_scores.pop(col.name)
+                self.refitted_columns.append(col.name)
+        
+        # Only refitted columns re-imputed the new rows.
+        return pd.DataFrame({col.name: col.imputed_data.to_numpy()[old_row_count:] 
+                             if col.name in self.refitted_columns else imputed_new_rows[col.name].to_numpy()
+                             for col in self.table.columns},
+                            index=new_rows.index)
+    
+    def _score_on_observed_rows(self, 
+                                col: Column, 
+                                rows: np.ndarray, 
+                                max_rows: int = 10000) -> float:
+        """Scores the strategy of the column on (a sample of) the given rows 
+        where the column is observed."""
+        
+        observed_rows = rows[~pd.isnull(col.data.iloc[rows]).to_numpy()]
+        if len(observed_rows) > max_rows:
+            rng = np.random.default_rng(0)
+            observed_rows = np.sort(rng.choice(observed_rows, max_rows, replace=False))
+        return self.strategies[col.name].score(observed_rows)
+    
+    def _has_drifted(self, 
+                     col: Column, 
+                     strategy: _BaseStrategy,
+                     new_row_positions: np.ndarray,
+                     drift_threshold: float) -> bool:
+        """Determines whether the column drifted since its strategy was fitted.
+        
+        See `append` for the drift measures."""
+        
+        fitted = self._fit_statistics[col.name]
+        current = col.statistics
+        
+        if abs(current['missing_fraction'] - fitted['missing_fraction']) > drift_threshold:
+            return True
+        
+        if col.type is DataType.CATEGORICAL:
+            if current['average'] != fitted['average'] or \
+                abs(current['mode_fraction'] - fitted['mode_fraction']) > drift_threshold:
+                return True
+        elif abs(current['average'] - fitted['average']) > drift_threshold * fitted['std']:
+            return True
+        
+        fitted_score = self._fit_scores[col.name]
+        if fitted_score is None or np.isnan(fitted_score):
+            return False
+        new_score = self._score_on_observed_rows(col, new_row_positions)
+        if new_score is None or np.isnan(new_score):
+            return False
+        if col.type is DataType.CATEGORICAL:
+            return new_score < fitted_score * (1 - drift_threshold)
+        return new_score > fitted_score * (1 + drift_threshold)
+
+    def impute(self, inplace: bool = False, delta: bool = False) -> pd.DataFrame:
+        """Imputes dataframe with specified strategies.
+        
+        Overwrite this method if you wish to implement different imputation behavior.
+        
+        In place, the imputed values of each column are written into its null 
+        positions in the DataFrame the imputer was constructed with as soon as 
+        the column is imputed, so that no imputed copy of the table is allocated. 
+        Imputed continuous columns then share their data with the DataFrame, only
+        the null positions of each column are kept next to it.
+
+        Parameters
+        ----------
+        inplace : bool (optional)
+            Flag to write the imputed values into the given DataFrame and return
+            None. Defaults to False.
             
-            #TODO Measure time the complexity of this operation
-            col.imputed_data = imputed_series
-            imputed_df[col.name] = imputed_series
+        delta : bool (optional)
+            Flag to return only the imputed cells, see `_create_delta_from_imputed_columns`,
+            so that the output scales with the number of missing values. Defaults to False.
+
+        Returns:
+            pd.DataFrame: imputed dataset, or the imputed cells if delta. None if
+                imputed in place without delta.
+        """
+        
+        if inplace and not self._data_is_caller_frame:
+            raise ValueError('Only imputers constructed with a DataFrame can impute in place.')
         
-        return imputed_df.reindex(list(map(lambda x: x.name, self.table.columns)), axis=1)
\ No newline at end of file
+        self._fit(inplace=inplace)
+        if delta:
+            return self._create_delta_from_imputed_columns(self.table)
+        if inplace:
+            return None
+        return self._create_df_from_imputed_columns(self.table)
+    
+    def _write_imputed_column(self, table: Table, col: Column) -> None:
+        """Writes the imputed values of the column into its null positions in the table data.
+        
+        Imputed continuous float64 columns then read their imputed data from the
+        table data, so that no imputed copy of the column is kept. Categorical
+        columns keep their imputed codes, which later strategies use as features.
+        """
+        
+        # Dense columns keep their null positions, their data may share memory with the frame.
+        null_rows = col.null_indices[0]
+        if len(null_rows) == 0:
+            return
+        frame = table.data
+        position = table.column_index[col.name]
+        if col.is_sparse:
+            # Sparse arrays are immutable, only the imputed column is replaced.
+            frame[col.name] = col.imputed_data.array
+            return
+        frame.iloc[null_rows, position] = col.imputed_null_values.array
+        if col.type is DataType.CONTINUOUS and frame.dtypes.iloc[position] == np.float64:
+            col.imputed_data = frame.iloc[:, position]
+
+    def impute_multiple(self,
+                        m: int = 20,
+                        random_state: int = 0,
+                        stacked: bool = False) -> Union[Iterable[pd.DataFrame], np.ndarray]:
+        """Imputes the dataframe m times for multiple imputation, fitting each strategy once.
+
+        The strategies are fitted as in `impute`, after which every strategy draws
+        m stochastic imputations of its missing values, e.g. from the predictions
+        of single trees or the class probabilities of a forest. Deterministic
+        strategies like the MeanStrategy impute the same values in every dataset.
+
+        Parameters
+        ----------
+        m : int (optional)
+            Number of imputed datasets. Defaults to 20.
+
+        random_state : int (optional)
+            Seed of the draws. Defaults to 0.
+
+        stacked : bool (optional)
+            Flag to return one array instead of a generator of dataframes.
+            Defaults to False.
+
+        Returns:
+            Union[Iterable[pd.DataFrame], np.ndarray]: generator of m imputed datasets,
+                or an array of shape (m, rows, columns) if stacked.
+        """
+
+        if not self.keep_fitted_models:
+            raise ValueError('Multiple imputation needs the fitted models, set keep_fitted_models.')
+
+        self.fit()
+        rng = np.random.default_rng(random_state)
+        with _limit_threads(self._inner_threads()):
+            draws = {col.name: self.strategies[col.name].draw(m, rng) for col in self.ordered_columns}
+        for strategy in self.strategies.values():
+            strategy.release_buffers()
+
+        datasets = self._draw_datasets(draws, m)
+        if stacked:
+            return np.stack([dataset.to_numpy() for dataset in datasets])
+        return datasets
+
+    def _draw_datasets(self, draws: Dict[str, np.ndarray], m: int) -> Iterable[pd.DataFrame]:
+        """Yields the imputed datasets with the drawn values of each imputation."""
+
+        for index in range(m):
+            columns = {}
+            for col in self.table.columns:
+                series = col.with_imputed_values(draws[col.name][index]) if col.name in draws \
+                    else col.imputed_data
+                columns[col.name] = series.array if col.is_sparse else series.to_numpy()
+            yield pd.DataFrame(columns, index=self.table.data.index)
+
+    def transform(self, data: pd.DataFrame, delta: bool = False) -> pd.DataFrame:
+        """Imputes new data, e.g. a partition of a larger table, with the fitted strategies.
+        
+        The data must have the columns of the table the imputer was fitted on.
+        Categorical columns are encoded like the fitted table and columns 
+        without strategy are filled with the average of the fitted table.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The dataframe which undergoes imputation.
+            
+        delta : bool (optional)
+            Flag to return only the imputed cells, see `impute`. Defaults to False.
+
+        Returns:
+            pd.DataFrame: imputed dataset, or the imputed cells if delta.
+        """
+        
+        if not self.is_fitted:
+            raise ValueError('Imputer must be fitted with fitted models kept before transform.')
+        
+        table = Table(data, {col.name: self.predefined_datatypes.get(col.name, col.type)
+                             for col in self.table.columns})
+        for col in table.columns:
+            col.inherit_encoding(self.table.column(col.name))
+        
+        with _limit_threads(self._inner_threads()):
+            for fitted_col in self.ordered_columns:
+                col = table.column(fitted_col.name)
+                strategy = self.strategies[col.name].bind(col, table.feature_columns(col.name))
+                col.imputed_data = strategy.impute_column()
+        
+        if delta:
+            return self._create_delta_from_imputed_columns(table)
+        return self._create_df_from_imputed_columns(table)
+    
+    def transform_partitions(self, 
+                             partitions: Iterable, 
+                             backend: _BaseBackend = None) -> List:
+        """Imputes each partition with the fitted strategies on an execution backend.
+        
+        The fitted imputer is broadcast to the workers without the data it
+        was fitted on, after which each partition is imputed where it lives.
+
+        Parameters
+        ----------
+        partitions : Iterable
+            Partitions as pd.DataFrame or as handles supported by the backend.
+            
+        backend : _BaseBackend (optional)
+            Execution backend that runs the imputation. Defaults to None, which 
+            uses the InProcessBackend.
+
+        Returns:
+            List: imputed partitions (or backend handles to them) in partition order.
+        """
+        
+        backend = InProcessBackend() if backend is None else backend
+        return backend.map(_transform_partition, partitions, 
+                           imputer=backend.broadcast(self._detached()))
+    
+    @classmethod
+    def from_partitions(cls, 
+                        partitions: Iterable,
+                        backend: _BaseBackend = None,
+                        sample_fraction: float = 0.1,
+                        random_state: int = 0,
+                        **kwargs: Dict) -> '_BaseImputer':
+        """Constructs and fits an imputer on a sample of the rows of each partition.
+        
+        Use `transform_partitions` afterwards to impute the partitions.
+
+        Parameters
+        ----------
+        partitions : Iterable
+            Partitions as pd.DataFrame or as handles supported by the backend.
+            
+        backend : _BaseBackend (optional)
+            Execution backend that draws the samples. Defaults to None, which 
+            uses the InProcessBackend.
+            
+        sample_fraction : float (optional)
+            Fraction of the rows of each partition to fit on. Defaults to 0.1.
+            
+        random_state : int (optional)
+            Seed from which the row sampling seed of each partition is spawned. 
+            Defaults to 0.
+            
+        kwargs : Dict
+            Other arguments of the imputer constructor.
+
+        Returns:
+            _BaseImputer: the fitted imputer.
+        """
+        
+        backend = InProcessBackend() if backend is None else backend
+        partitions = list(partitions)
+        # Partitions that share a seed would sample the same row positions.
+        seeds = [int(seed.generate_state(1)[0]) 
+                 for seed in np.random.SeedSequence(random_state).spawn(len(partitions))]
+        samples = backend.gather(backend.map(_sample_partition, partitions, seeds,
+                                             fraction=sample_fraction))
+        sample = pd.concat(samples, ignore_index=True)
+        return cls(sample, **kwargs).fit()
+    
+    def _detached(self) -> '_BaseImputer':
+        """Returns a copy of the fitted imputer without the data of its table.
+
+        Returns:
+            _BaseImputer: imputer copy with detached columns and strategies.
+        """
+        
+        detached = copy.copy(self)
+        columns = {col.name: col.detached() for col in self.table.columns}
+        detached.table = copy.copy(self.table)
+        detached.table.data = self.table.data.iloc[:0]
+        detached.table.columns = list(columns.values())
+        detached.included_columns = [columns[col.name] for col in self.included_columns]
+        detached.ordered_columns = [columns[col.name] for col in self.ordered_columns]
+        detached.strategies = {
+            name: strategy.bind(columns[name], 
+                                detached.table.feature_columns(name) 
+                                if isinstance(strategy, _MultivariateStrategy) else None)
+            for name, strategy in self.strategies.items()}
+        return detached
+    
+    def _create_df_from_imputed_columns(self, table: Table) -> pd.DataFrame:
+        """Creates pd.DataFrame from the imputed data of all columns of the table.
+
+        Returns:
+            pd.DataFrame: imputed data with the index of the table data.
+        """
+        
+        # Sparse columns stay sparse in the output.
+        return pd.DataFrame({col.name: col.imputed_data.array if col.is_sparse else col.imputed_data.to_numpy() 
+                             for col in table.columns},
+                            index=table.data.index)
+    
+    def _create_delta_from_imputed_columns(self, table: Table) -> pd.DataFrame:
+        """Creates a long pd.DataFrame with only the imputed cells of the table.
+
+        Built from the null positions and imputed values of each column, so that 
+        writing imputations back to e.g. a database scales with the number of 
+        missing values instead of the size of the table.
+
+        Returns:
+            pd.DataFrame: one row per imputed cell with its row position ('row'), 
+                index label ('index'), column name ('column', categorical) and 
+                imputed value ('value'), in column order.
+        """
+        
+        columns = [col for col in table.columns if len(col.null_indices[0]) > 0]
+        rows = [col.null_indices[0] for col in columns]
+        positions = np.concatenate(rows) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+        names = pd.Categorical.from_codes(np.repeat(np.arange(len(columns)), [len(r) for r in rows]),
+                                          categories=[col.name for col in columns])
+        values = pd.concat([col.imputed_null_values for col in columns], ignore_index=True) \
+            if len(columns) > 0 else pd.Series([], dtype=object)
+        return pd.DataFrame({'row': positions, 
+                             'index': _take_labels(table.data.index, positions),
+                             'column': names,
+                             'value': values.array})
+
+
+def _transform_partition(partition: pd.DataFrame, imputer: _BaseImputer) -> pd.DataFrame:
+    """Imputes a single partition, runs on the workers of an execution backend."""
+    return imputer.transform(partition)
+
+
+def _sample_partition(partition: pd.DataFrame, random_state: int, fraction: float) -> pd.DataFrame:
+    """Samples rows of a single partition, runs on the workers of an execution backend."""
+    return partition.sample(frac=fraction, random_state=random_state)
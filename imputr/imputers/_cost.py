@@ -0,0 +1,178 @@
+import math
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..domain import Column, DataType
+from ..strategy._base import _BaseStrategy, _MultivariateStrategy
+from ..strategy.randomforest import RandomForestStrategy
+
+
+class _CostModel:
+    """Estimates the wall-clock seconds a strategy takes to fit and impute its column.
+
+    The estimate is a fixed overhead plus an amount of work, derived from the
+    number of rows, features and missing values, times the seconds per unit
+    of work. The seconds per unit start at a default for the strategy class
+    and are recalibrated with every observed timing, so that estimates adapt
+    to the machine during a fit.
+    """
+
+    # Default seconds per unit of work and fixed overhead, measured for sklearn forests.
+    SECONDS_PER_UNIT: float = 2.5e-8
+    # Weight of the default in units of work, so a few tiny timings do not dominate.
+    PRIOR_UNITS: float = 1e7
+    OVERHEAD_SECONDS: Dict[str, float] = {'multivariate': 2e-2, 'univariate': 1e-4}
+    # Automatic strategy selection fills columns below these thresholds univariately.
+    MIN_MISSING_FRACTION: float = 0.01
+    MIN_PREDICTABILITY: float = 0.05
+
+    def __init__(self):
+        self._observed_units: Dict[type, float] = {}
+        self._observed_seconds: Dict[type, float] = {}
+
+    def work(self, strategy: _BaseStrategy) -> float:
+        """Returns the amount of work of the strategy in abstract units."""
+        column = strategy.target_column
+        rows = len(column.data)
+        if isinstance(strategy, RandomForestStrategy):
+            features = len(strategy.feature_columns)
+            train_rows = rows - column.missing_value_count
+            if strategy.max_buffer_rows is not None:
+                train_rows = min(train_rows, strategy.max_buffer_rows)
+            if isinstance(strategy.max_features, str):
+                split_features = math.sqrt(features) if strategy.max_features == 'sqrt' \
+                    else math.log2(max(features, 1))
+            elif isinstance(strategy.max_features, float):
+                split_features = strategy.max_features * features
+            else:
+                split_features = features if strategy.max_features is None else strategy.max_features
+            leaves = train_rows / max(strategy.min_samples_leaf, 1)
+            if strategy.max_leaf_nodes is not None:
+                leaves = min(leaves, strategy.max_leaf_nodes)
+            if strategy.max_depth is not None:
+                leaves = min(leaves, 2 ** strategy.max_depth)
+            depth = math.log2(max(leaves, 2))
+            return strategy.n_estimators * (train_rows * max(split_features, 1) * depth
+                                            + column.missing_value_count * depth) \
+                + rows * features
+        if isinstance(strategy, _MultivariateStrategy):
+            return rows * max(len(strategy.feature_columns), 1)
+        return rows
+
+    def estimate(self, strategy: _BaseStrategy) -> float:
+        """Returns the estimated seconds to fit the strategy and impute its column."""
+        kind = 'multivariate' if isinstance(strategy, _MultivariateStrategy) else 'univariate'
+        return self.OVERHEAD_SECONDS[kind] + self.work(strategy) * self._seconds_per_unit(type(strategy))
+
+    def observe(self, strategy: _BaseStrategy, seconds: float) -> None:
+        """Recalibrates the seconds per unit of work of the strategy class with a timing."""
+        kind = 'multivariate' if isinstance(strategy, _MultivariateStrategy) else 'univariate'
+        strategy_cls = type(strategy)
+        self._observed_units[strategy_cls] = self._observed_units.get(strategy_cls, 0.0) \
+            + self.work(strategy)
+        self._observed_seconds[strategy_cls] = self._observed_seconds.get(strategy_cls, 0.0) \
+            + max(seconds - self.OVERHEAD_SECONDS[kind], 0.0)
+
+    def _seconds_per_unit(self, strategy_cls: type) -> float:
+        units = self._observed_units.get(strategy_cls, 0.0)
+        seconds = self._observed_seconds.get(strategy_cls, 0.0)
+        return (seconds + self.PRIOR_UNITS * self.SECONDS_PER_UNIT) / (units + self.PRIOR_UNITS)
+
+
+def _stack_probe_rows(columns: Sequence[Column], max_rows: int = 4000) -> Tuple[np.ndarray, np.ndarray]:
+    """Stacks the encoded imputed values of a random sample of rows of all columns.
+
+    Built once and shared by the probes of all target columns, so that probing
+    takes time linear in the number of columns. Only the sampled rows of sparse 
+    columns are densified.
+
+    Parameters
+    ----------
+    columns : Sequence[Column]
+        The columns of the table.
+        
+    max_rows : int (optional)
+        Maximum number of sampled rows. Defaults to 4000.
+
+    Returns
+    -------
+        Tuple[np.ndarray, np.ndarray] : positions of the sampled rows in random 
+            order and the float32 matrix of their values, one column per column.
+    """
+    rows = np.random.default_rng(0).permutation(len(columns[0].data))[:max_rows]
+    matrix = np.empty((len(rows), len(columns)), dtype=np.float32)
+    for position, col in enumerate(columns):
+        data = col.numeric_encoded_imputed_data
+        matrix[:, position] = np.asarray(data.iloc[rows] if isinstance(data, pd.Series) else data[rows])
+    return rows, matrix
+
+
+def _probe_predictability(target_column: Column, 
+                          feature_positions: np.ndarray,
+                          probe_rows: np.ndarray,
+                          probe_matrix: np.ndarray,
+                          max_rows: int = 2000,
+                          max_features: int = 64) -> float:
+    """Cheaply measures how well the features predict the observed target values.
+    
+    Fits a shallow decision tree on half of the observed rows of the probe sample
+    and scores it on the other half against predicting the average. Wide tables
+    are probed with a random subset of the features, so that probing all columns
+    does not take time quadratic in their number.
+
+    Parameters
+    ----------
+    target_column : Column
+        The column which needs imputation.
+        
+    feature_positions : np.ndarray
+        Positions of the predictor columns in the probe matrix.
+        
+    probe_rows : np.ndarray
+        Positions of the sampled rows, see `_stack_probe_rows`.
+        
+    probe_matrix : np.ndarray
+        Encoded values of the sampled rows, see `_stack_probe_rows`.
+        
+    max_rows : int (optional)
+        Maximum number of observed rows in the sample. Defaults to 2000.
+        
+    max_features : int (optional)
+        Maximum number of features the tree is fitted on. Defaults to 64.
+
+    Returns
+    -------
+        float : R² for continuous and the relative error reduction over the mode 
+            for categorical targets, clipped to [0, 1]. 0 if there are too few rows.
+    """
+    from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
+    
+    if target_column.type is DataType.CATEGORICAL:
+        target = target_column.codes[probe_rows]
+        observed = np.flatnonzero(target != -1)[:max_rows]
+    else:
+        target = np.asarray(target_column.data.iloc[probe_rows], dtype=np.float64)
+        observed = np.flatnonzero(~np.isnan(target))[:max_rows]
+    if len(observed) < 20 or len(feature_positions) == 0:
+        return 0.0
+    if len(feature_positions) > max_features:
+        feature_positions = np.random.default_rng(0).choice(feature_positions, max_features, replace=False)
+    features = probe_matrix[np.ix_(observed, feature_positions)]
+    target = target[observed]
+    half = len(observed) // 2
+    
+    if target_column.type is DataType.CATEGORICAL:
+        tree = DecisionTreeClassifier(max_depth=4, random_state=0).fit(features[:half], target[:half])
+        error = np.mean(tree.predict(features[half:]) != target[half:])
+        mode = np.bincount(target[:half]).argmax()
+        baseline_error = np.mean(target[half:] != mode)
+    else:
+        tree = DecisionTreeRegressor(max_depth=4, random_state=0).fit(features[:half], target[:half])
+        error = np.mean((tree.predict(features[half:]) - target[half:]) ** 2)
+        baseline_error = np.mean((target[half:] - target[:half].mean()) ** 2)
+    
+    if baseline_error <= 0:
+        return 0.0
+    return float(np.clip(1 - error / baseline_error, 0.0, 1.0))
@@ -0,0 +1,63 @@
+import os
+from contextlib import nullcontext
+from typing import ContextManager, Tuple
+
+import numpy as np
+
+# Rows per thread below which an estimator spends more time dispatching and
+# synchronizing threads than it gains from them.
+MIN_ROWS_PER_THREAD: int = 10000
+
+
+def _resolve_cpu_budget(cpu_budget: int) -> int:
+    """Number of CPUs of the budget, -1 for all CPUs."""
+    if cpu_budget == -1:
+        return os.cpu_count() or 1
+    if cpu_budget < 1:
+        raise ValueError(f'CPU budget must be -1 or at least 1, got {cpu_budget}.')
+    return cpu_budget
+
+
+def _split_cpu_budget(cpu_budget: int, task_count: int, row_count: int) -> Tuple[int, int]:
+    """Splits a CPU budget between outer workers over independent tasks, e.g. columns,
+    and inner threads per task, used by the estimators and the BLAS and OpenMP pools.
+
+    Each task gets as many inner threads as its rows keep busy, see
+    `MIN_ROWS_PER_THREAD`, and the remaining CPUs run tasks side by side. Wide tables
+    of few rows are therefore processed column-parallel, and long tables that only
+    have a few tasks at a time get multi-threaded estimators. The product of both
+    never exceeds the budget, so the pools do not oversubscribe the CPUs.
+
+    Parameters
+    ----------
+    cpu_budget : int
+        Number of CPUs to use, -1 for all CPUs.
+
+    task_count : int
+        Number of tasks that can run side by side.
+
+    row_count : int
+        Number of rows each task processes.
+
+    Returns:
+        Tuple[int, int]: number of outer workers and of inner threads per worker.
+    """
+    cpus = _resolve_cpu_budget(cpu_budget)
+    inner = int(np.clip(row_count // MIN_ROWS_PER_THREAD, 1, cpus))
+    outer = max(1, min(task_count, cpus // inner))
+    return outer, inner
+
+
+def _limit_threads(threads: int) -> ContextManager:
+    """Limits the BLAS and OpenMP thread pools of the process within the context.
+
+    Requires the optional `threadpoolctl` package, without it (or without a limit)
+    the pools keep their defaults.
+    """
+    if threads is None:
+        return nullcontext()
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return nullcontext()
+    return threadpool_limits(limits=threads)
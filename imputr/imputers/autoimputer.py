@@ -1,9 +1,12 @@
 from ..domain import Column, DataType
 from ._base import _BaseImputer
 import pandas as pd
+import scipy.sparse as sp
 from ..strategy._base import _BaseStrategy
+from ..strategy.cache import StrategyCache
 from ..strategy.randomforest import RandomForestStrategy
-from typing import Union, Dict, List
+from ._cost import _CostModel
+from typing import Union, Dict, Iterable, List
 
 
 class AutoImputer(_BaseImputer):
@@ -26,8 +29,10 @@ class AutoImputer(_BaseImputer):
     
     Parameters
     ----------
-    data : pd.DataFrame
-        The dataframe which undergoes imputation.
+    data : Union[pd.DataFrame, sp.spmatrix, Iterable[pd.DataFrame]]
+        The dataframe which undergoes imputation, a SciPy sparse matrix (CSR/CSC),
+        or chunks of its rows, e.g. `pd.read_csv(..., chunksize=...)`. Sparse 
+        columns are passed to the forests as sparse matrices.
         
     predefined_order : Dict[int, str] (optional)
         Dictionary of column names and their order for imputation. 
@@ -43,23 +48,83 @@ class AutoImputer(_BaseImputer):
     include_non_missing : bool (optional)
         Flag to indicate whether columns without missing value need fitting 
         of strategies. Default is set to False.
+        
+    memory_budget : int (optional)
+        Maximum number of bytes a strategy may use for its feature buffer.
+        Strategies that would exceed it train on a sample of rows and impute
+        in chunks. Defaults to None (no budget).
+    
+    keep_fitted_models : bool (optional)
+        Flag to indicate whether fitted models are kept after imputation. 
+        Set to False if the imputer is not reused. Defaults to True.
+        
+    cache : StrategyCache (optional)
+        On-disk cache from which fitted models are loaded when the data and
+        configuration of a strategy did not change. Defaults to None.
+        
+    n_jobs : int (optional)
+        Number of threads that construct the table columns in parallel. 
+        -1 uses all CPUs. Defaults to None (sequential).
+        
+    sample_size : int (optional)
+        Caps the type and mode inference cost per object-dtype column by 
+        inspecting a random sample of this many rows. Defaults to None (exact).
+        
+    time_budget : float (optional)
+        Wall-clock seconds that fitting may take. Random forests of the columns
+        where they matter least fall back to the MeanStrategy when their estimated
+        cost exceeds the budget. The fallbacks are listed in `degraded_columns` and 
+        per-column timings in `fit_report`. Defaults to None (no budget).
+        
+    auto_select : bool (optional)
+        Flag to choose strategies automatically from a cost/benefit model. Columns 
+        without predefined strategy are filled with the MeanStrategy when hardly
+        any values are missing or a cheap probe shows little predictability, 
+        and random forests are ordered cheapest first. Probe scores are stored 
+        in `predictability`. Defaults to False.
+        
+    scratch_dir : str (optional)
+        Directory in which the encoded feature matrix of the table is memory-mapped
+        during fitting. Random forests read their training and prediction rows from 
+        it, so combine it with a `memory_budget` to impute tables larger than 
+        memory. Defaults to None (feature buffers in memory).
+        
+    cpu_budget : int (optional)
+        Number of CPUs the imputer may use, -1 for all CPUs. The table columns are
+        constructed side by side within the budget, and the forests fit one at a 
+        time with the whole budget for their trees and the BLAS pools. Defaults 
+        to None (sequential construction, thread pools at their defaults).
 
     """
     
     strategies: Dict[str, _BaseStrategy]
     ordered_columns: List[Column]
     included_columns: List[Column]
+    predictability: Dict[str, float]
     
     def __init__(self, 
-                 data: pd.DataFrame,
+                 data: Union[pd.DataFrame, sp.spmatrix, Iterable[pd.DataFrame]],
                  predefined_order: Dict[str, int] = None,
                  predefined_strategies: Dict[str, Dict] = None,
                  predefined_datatypes: Dict[str, Union[str, DataType]] = None,
                  include_non_missing: bool = False,
+                 memory_budget: int = None,
+                 keep_fitted_models: bool = True,
+                 cache: StrategyCache = None,
+                 n_jobs: int = None,
+                 sample_size: int = None,
+                 time_budget: float = None,
+                 auto_select: bool = False,
+                 scratch_dir: str = None,
+                 cpu_budget: int = None,
                  ):
-        super().__init__(data, predefined_datatypes)
+        super().__init__(data, predefined_datatypes, memory_budget, keep_fitted_models, cache, 
+                         n_jobs, sample_size, time_budget, scratch_dir, cpu_budget)
         self.included_columns = self._determine_list_of_included_columns(predefined_strategies, 
                                                                         predefined_order, 
                                                                         include_non_missing)
         self.strategies = self._construct_strategies(RandomForestStrategy, predefined_strategies)
-        self.ordered_columns = self._determine_order(self.included_columns, self.strategies, predefined_order)
\ No newline at end of file
+        self.predictability = self._select_strategies(predefined_strategies) if auto_select else {}
+        self._schedule_memory_budget()
+        self.ordered_columns = self._determine_order(self.included_columns, self.strategies, predefined_order,
+                                                     _CostModel() if auto_select else None)
\ No newline at end of file
@@ -3,8 +3,9 @@ from ..domain import Column, DataType
 from ._base import _BaseImputer
 import pandas as pd
 from ..strategy._base import _BaseStrategy
+from ..strategy.cache import StrategyCache
 from ..strategy.mean import MeanStrategy
-from typing import Union, Dict, List
+from typing import Union, Dict, Iterable, List
 
 class MeanImputer(_BaseImputer):
     """Simple imputation class that uses average imputation
@@ -14,8 +15,9 @@ class MeanImputer(_BaseImputer):
     
     Parameters
     ----------
-    data : pd.DataFrame
-        The dataframe which undergoes imputation.
+    data : Union[pd.DataFrame, Iterable[pd.DataFrame]]
+        The dataframe which undergoes imputation, or chunks of its rows, 
+        e.g. `pd.read_csv(..., chunksize=...)`.
         
     predefined_order : Dict[int, str] (optional)
         Dictionary of column names and their order for imputation. 
@@ -31,6 +33,32 @@ class MeanImputer(_BaseImputer):
     include_non_missing : bool (optional)
         Flag to indicate whether columns without missing value need fitting 
         of strategies. Default is set to False.
+        
+    memory_budget : int (optional)
+        Maximum number of bytes a strategy may use for its feature buffer.
+        Strategies that would exceed it train on a sample of rows and impute
+        in chunks. Defaults to None (no budget).
+    
+    keep_fitted_models : bool (optional)
+        Flag to indicate whether fitted models are kept after imputation. 
+        Set to False if the imputer is not reused. Defaults to True.
+        
+    cache : StrategyCache (optional)
+        On-disk cache from which fitted models are loaded when the data and
+        configuration of a strategy did not change. Defaults to None.
+        
+    n_jobs : int (optional)
+        Number of threads that construct the table columns in parallel. 
+        -1 uses all CPUs. Defaults to None (sequential).
+        
+    sample_size : int (optional)
+        Caps the type and mode inference cost per object-dtype column by 
+        inspecting a random sample of this many rows. Defaults to None (exact).
+        
+    cpu_budget : int (optional)
+        Number of CPUs the imputer may use, -1 for all CPUs. The table columns are
+        constructed side by side within the budget. Defaults to None (sequential 
+        construction).
     """
     
     predefined_order: Dict[str, int]
@@ -40,15 +68,23 @@ class MeanImputer(_BaseImputer):
     include_non_missing: bool
     
     def __init__(self, 
-                 data: pd.DataFrame,
+                 data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
                  predefined_order: Dict[str, int] = None,
                  predefined_strategies: Dict[str, Dict] = None,
                  predefined_datatypes: Dict[str, Union[str, DataType]] = None,
                  include_non_missing: bool = False,
+                 memory_budget: int = None,
+                 keep_fitted_models: bool = True,
+                 cache: StrategyCache = None,
+                 n_jobs: int = None,
+                 sample_size: int = None,
+                 cpu_budget: int = None,
                  ):
-        super().__init__(data, predefined_datatypes)
+        super().__init__(data, predefined_datatypes, memory_budget, keep_fitted_models, cache, 
+                         n_jobs, sample_size, cpu_budget=cpu_budget)
         self.included_columns = self._determine_list_of_included_columns(predefined_strategies, 
                                                                         predefined_order, 
                                                                         include_non_missing)
         self.strategies = self._construct_strategies(MeanStrategy, predefined_strategies)
         self.ordered_columns = self._determine_order(self.included_columns, self.strategies, predefined_order)
+        self._schedule_memory_budget()
@@ -1,2 +1,25 @@
-from .randomforest import RandomForestStrategy
-from .mean import MeanStrategy
\ No newline at end of file
+import importlib
+from .registry import register_strategy, get_strategy, available_strategies
+
+# Strategy modules are imported on first access, so that e.g. scikit-learn is
+# not imported by users of the MeanImputer only.
+_LAZY_ATTRIBUTES = {
+    'RandomForestStrategy': '.randomforest',
+    'LinearStrategy': '.linear',
+    'FillStrategy': '.grouped',
+    'GroupStatisticStrategy': '.grouped',
+    'MeanStrategy': '.mean',
+    'StrategyCache': '.cache',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + ['register_strategy', 'get_strategy', 'available_strategies']
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f'module \'{__name__}\' has no attribute \'{name}\'')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+import copy
+import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 from ..domain import DataType, Column
-from typing import Dict, List
+from ..domain.matrix import EncodedMatrix
+from typing import Dict, List, Union
 
 class _BaseStrategy(ABC):
     """Abstract base class for strategy classes.
@@ -16,6 +20,13 @@ class _BaseStrategy(ABC):
     """
 
     target_column: Column
+    cacheable: bool = False
+    # Threads the strategy may use for its estimator, set by the imputer from its
+    # CPU budget. None uses the default of the estimator.
+    n_jobs: int = None
+    # Fraction of the observed rows the model was trained on, below 1 if the
+    # strategy trained on a sample of rows to stay within a memory budget.
+    training_fraction: float = 1.0
 
     def __init__(self, target_column: Column):
         self.target_column = target_column     
@@ -48,6 +59,20 @@ class _BaseStrategy(ABC):
         return 
         
 
+    @classmethod
+    def fit_together(cls, strategies: List['_BaseStrategy']) -> None:
+        """Prepares state that is shared by the strategies of this class before
+        they are fitted one by one, e.g. a factorization they are all solved from.
+
+        The default implementation shares nothing and does nothing.
+
+        Parameters
+        ----------
+        strategies : List[_BaseStrategy]
+            The strategies of this class that are about to be fitted.
+        """
+        return
+
     @abstractmethod
     def fit(self) -> None:
         """Executes the necessary preparation steps for imputation.
@@ -67,6 +92,123 @@ class _BaseStrategy(ABC):
             pd.Series : The Pandas Series that contains that has the imputed column values.
         """
         return
+
+    def draw(self, m: int, rng: np.random.Generator) -> np.ndarray:
+        """Draws m stochastic imputations of the missing values from the fitted strategy.
+
+        Called after the target column was imputed. The default implementation
+        is deterministic and repeats the imputed values m times.
+
+        Parameters
+        ----------
+        m : int
+            Number of imputations.
+
+        rng : np.random.Generator
+            Random generator of the draws.
+
+        Returns:
+            np.ndarray : array of shape (m, number of missing values) with numerically
+                encoded values, codes for categorical and epoch values for datetime columns.
+        """
+        null_rows = self.target_column.null_indices[0]
+        imputed = np.asarray(self.target_column.numeric_encoded_imputed_data)[null_rows]
+        return np.tile(imputed, (m, 1))
+
+    @property
+    def params(self) -> Dict:
+        """The parameters the strategy was constructed with, as passed to `from_dict`.
+
+        Returns:
+            Dict : parameter names and values.
+        """
+        return {}
+
+    def get_fitted_state(self):
+        """Returns the fitted model of the strategy, e.g. to store it in a cache.
+        
+        Only needs an implementation for strategies that set `cacheable`.
+        """
+        return None
+
+    def load_fitted_state(self, state) -> None:
+        """Loads a fitted model as returned by `get_fitted_state` instead of fitting.
+        
+        Only needs an implementation for strategies that set `cacheable`.
+        """
+        return
+
+    def score(self, rows: np.ndarray) -> float:
+        """Scores the fitted model on observed values of the target column.
+        
+        The default implementation has no model to score and returns None.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Positions of rows where the target column is not null.
+
+        Returns:
+            float : accuracy for categorical and RMSE for continuous columns.
+        """
+        return None
+
+    def validation_score(self) -> float:
+        """Out-of-sample score of the fitted model on the observed values it was 
+        fitted on, comparable with `score` on rows the model has not seen.
+        
+        The default implementation has no model to score and returns None.
+
+        Returns:
+            float : accuracy for categorical and RMSE for continuous columns.
+        """
+        return None
+
+    def bind(self, target_column: Column, feature_columns: List[Column] = None) -> '_BaseStrategy':
+        """Returns a copy of the fitted strategy that imputes another column.
+        
+        Used to impute a new partition of the table with the fitted models.
+
+        Parameters
+        ----------
+        target_column : Column
+            Column with the same name and type as the original target column.
+            
+        feature_columns : List[Column] (optional)
+            Ignored by univariate strategies.
+
+        Returns:
+            _BaseStrategy : shallow copy of the strategy bound to the given column.
+        """
+        bound = copy.copy(self)
+        bound.target_column = target_column
+        bound.release_buffers()
+        return bound
+
+    def compact(self, **kwargs: Dict) -> Dict:
+        """Reduces the memory footprint of the fitted strategy.
+
+        Strategies that hold fitted models overwrite this method. The default
+        implementation has nothing to compact and returns None.
+
+        Returns:
+            Dict : size and accuracy figures before and after compaction.
+        """
+        return None
+
+    def release_buffers(self) -> None:
+        """Frees transient buffers that are only needed during fitting and imputation.
+
+        The default implementation holds no buffers and does nothing.
+        """
+        return
+
+    def release_model(self) -> None:
+        """Discards the fitted model when no further imputation is needed.
+
+        The default implementation holds no model and does nothing.
+        """
+        return
     
 class _MultivariateStrategy(_BaseStrategy):
     """
@@ -75,14 +217,24 @@ class _MultivariateStrategy(_BaseStrategy):
     """
     
     feature_columns: List[Column]
+    max_buffer_rows: int
+    feature_matrix: EncodedMatrix
     _feature_df: pd.DataFrame
     
+    # Data types of the feature columns the strategy can use, None for all types.
+    supported_feature_types: List = None
+    
     def __init__(self, 
                  target_column: Column, 
                  feature_columns: List[Column]
                  ):
         super().__init__(target_column)
-        self.feature_columns = feature_columns
+        self.feature_columns = self._supported_features(feature_columns)
+        self.max_buffer_rows = None
+        self.feature_matrix = None
+        self._feature_df = None
+        self._feature_arrays = None
+        self._feature_sparse = None
         
     @classmethod   
     @abstractmethod
@@ -92,20 +244,137 @@ class _MultivariateStrategy(_BaseStrategy):
                   **kwargs: Dict):
         return
     
+    def bind(self, target_column: Column, feature_columns: List[Column] = None) -> '_MultivariateStrategy':
+        bound = super().bind(target_column)
+        bound.feature_columns = self._supported_features(feature_columns)
+        return bound
+    
+    def _supported_features(self, feature_columns: List[Column]) -> List[Column]:
+        """Drops the feature columns of data types the strategy cannot use."""
+        if feature_columns is None or self.supported_feature_types is None:
+            return feature_columns
+        return [col for col in feature_columns if col.type in self.supported_feature_types]
+    
+    def use_feature_matrix(self, feature_matrix: EncodedMatrix, positions: np.ndarray) -> None:
+        """Reads the feature data from the shared encoded matrix of the table
+        instead of building a feature buffer.
+
+        Parameters
+        ----------
+        feature_matrix : EncodedMatrix
+            The encoded matrix of the table the feature columns belong to.
+            
+        positions : np.ndarray
+            Positions of the feature columns in the matrix.
+        """
+        self.feature_matrix = feature_matrix
+        self._feature_positions = positions
+        self._feature_names = [col.name for col in self.feature_columns]
+    
     def _create_df_from_num_encoded_feature_columns(self, feature_columns: 
-                                                List[Column]) -> pd.DataFrame:
+                                                List[Column]) -> Union[pd.DataFrame, sp.csr_matrix]:
         """Creates pd.DataFrame from pd.Series objects that contain
         the numerically encoded imputed data for the respective column.
+        
+        The columns are joined by position, the indexes of the imputed data
+        need not match, e.g. after rows with overlapping labels were appended.
+        
+        If any feature column is sparse, a SciPy CSR matrix is created instead, 
+        see `_create_sparse_matrix_from_num_encoded_feature_columns`.
 
         Returns:
-            pd.DataFrame : joined dataframe of num-encoded and imputed data.
+            Union[pd.DataFrame, sp.csr_matrix] : joined num-encoded and imputed data.
         """
         
+        if any(col.is_sparse for col in feature_columns):
+            return self._create_sparse_matrix_from_num_encoded_feature_columns(feature_columns)
+        
         df_dict = {}
         for col in feature_columns:
-            df_dict[col.name] = col.numeric_encoded_imputed_data
+            df_dict[col.name] = np.asarray(col.numeric_encoded_imputed_data)
         return pd.DataFrame(df_dict)
     
+    @staticmethod
+    def _create_sparse_matrix_from_num_encoded_feature_columns(feature_columns: 
+                                                               List[Column]) -> sp.csr_matrix:
+        """Creates a SciPy CSR matrix from the numerically encoded imputed data 
+        of the columns without materializing the dense matrix.
+        
+        Sparse columns with a zero fill value contribute their stored values, 
+        other columns their non-zero values.
+
+        Returns:
+            sp.csr_matrix : joined num-encoded and imputed data.
+        """
+        
+        indices, data = [], []
+        row_count = 0
+        for col in feature_columns:
+            values = col.numeric_encoded_imputed_data
+            row_count = len(values)
+            if isinstance(values.dtype, pd.SparseDtype) and values.sparse.fill_value == 0:
+                indices.append(values.array.sp_index.indices)
+                data.append(values.array.sp_values)
+            else:
+                dense = np.asarray(values, dtype=np.float64)
+                nonzero = np.flatnonzero(dense)
+                indices.append(nonzero)
+                data.append(dense[nonzero])
+        indptr = np.concatenate([[0], np.cumsum([len(x) for x in indices])])
+        matrix = sp.csc_matrix((np.concatenate(data) if data else np.empty(0),
+                                np.concatenate(indices) if indices else np.empty(0, dtype=np.int64),
+                                indptr),
+                               shape=(row_count, len(feature_columns)))
+        return matrix.tocsr()
+    
+    def _feature_rows(self, rows: np.ndarray) -> Union[pd.DataFrame, sp.csr_matrix]:
+        """Gets the num-encoded and imputed feature data for the given row positions.
+        
+        Slices the full feature buffer if it is held, otherwise only 
+        materializes the requested rows. Sparse feature data is returned as 
+        a SciPy CSR matrix.
+
+        Returns:
+            Union[pd.DataFrame, sp.csr_matrix] : num-encoded and imputed feature data of the given rows.
+        """
+        
+        if self._feature_df is not None:
+            if sp.issparse(self._feature_df):
+                return self._feature_df[rows]
+            return self._feature_df.iloc[rows]
+        
+        if any(col.is_sparse for col in self.feature_columns):
+            if self._feature_sparse is None:
+                # Built once per fit, only its rows are sliced per chunk.
+                self._feature_sparse = self._create_sparse_matrix_from_num_encoded_feature_columns(
+                    self.feature_columns)
+            return self._feature_sparse[rows]
+        
+        if self.feature_matrix is not None:
+            return pd.DataFrame(self.feature_matrix.rows(rows, self._feature_positions),
+                                columns=self._feature_names)
+        
+        if self._feature_arrays is None:
+            # Encoded once per fit, views of the imputed data for dense columns.
+            self._feature_arrays = [np.asarray(col.numeric_encoded_imputed_data) for col in self.feature_columns]
+        return pd.DataFrame({col.name: values[rows]
+                             for col, values in zip(self.feature_columns, self._feature_arrays)})
+    
+    def estimated_buffer_bytes(self) -> int:
+        """Estimates the size of the full feature buffer of this strategy.
+
+        Returns:
+            int : number of bytes of the float64 feature data of all rows.
+        """
+        return len(self.target_column.data) * len(self.feature_columns) * 8
+    
+    def release_buffers(self) -> None:
+        """Frees the feature buffer and detaches the shared feature matrix."""
+        self._feature_df = None
+        self._feature_arrays = None
+        self._feature_sparse = None
+        self.feature_matrix = None
+    
 class _UnivariateStrategy(_BaseStrategy):
     """
     The abstract class that contains the interface for univariate imputation
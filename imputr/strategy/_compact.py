@@ -0,0 +1,181 @@
+import numpy as np
+import scipy.sparse as sp
+from typing import List
+
+# Marker for leaf nodes in the compact node arrays, mirrors scikit-learn's TREE_UNDEFINED.
+_LEAF = -2
+
+
+class _CompactForest:
+    """Compact, prediction-only representation of a fitted scikit-learn forest.
+
+    Stores the nodes of all trees in flat arrays: int32 children and features,
+    float32 thresholds and leaf values that are either float32 or quantized to
+    uint8 with a linear codebook. Leaves store an index into the leaf value
+    array in the `left` array. All sklearn-only bookkeeping (impurities, sample
+    counts, estimator parameters, internal node values) is dropped.
+
+    Parameters
+    ----------
+    forest : Union[RandomForestRegressor, RandomForestClassifier]
+        The fitted scikit-learn forest that is compacted.
+
+    max_depth : int (optional)
+        Depth at which trees are pruned. Nodes at this depth become leaves that
+        predict the value of the node. Defaults to None, which keeps full trees.
+
+    quantize_leaves : bool (optional)
+        Flag to indicate whether leaf values are quantized to uint8.
+        Defaults to False, which stores leaf values as float32.
+    """
+
+    roots: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    feature: np.ndarray
+    threshold: np.ndarray
+    values: np.ndarray
+    classes_: np.ndarray
+
+    def __init__(self, forest, max_depth: int = None, quantize_leaves: bool = False):
+        self.is_classifier = hasattr(forest, 'classes_')
+        self.classes_ = forest.classes_ if self.is_classifier else None
+        self.n_features_in_ = forest.n_features_in_
+
+        roots, left, right, feature, threshold, values = [], [], [], [], [], []
+        node_offset, leaf_offset = 0, 0
+        for estimator in forest.estimators_:
+            tree = self._compact_tree(estimator.tree_, max_depth)
+            roots.append(node_offset)
+            tree_left, tree_right, tree_feature, tree_threshold, tree_values = tree
+            is_leaf = tree_feature == _LEAF
+            left.append(np.where(is_leaf, tree_left + leaf_offset, tree_left + node_offset))
+            right.append(np.where(is_leaf, tree_right, tree_right + node_offset))
+            feature.append(tree_feature)
+            threshold.append(tree_threshold)
+            values.append(tree_values)
+            node_offset += len(tree_feature)
+            leaf_offset += len(tree_values)
+
+        self.roots = np.asarray(roots, dtype=np.int32)
+        self.left = np.concatenate(left).astype(np.int32)
+        self.right = np.concatenate(right).astype(np.int32)
+        self.feature = np.concatenate(feature).astype(np.int32)
+        self.threshold = np.concatenate(threshold).astype(np.float32)
+        values = np.concatenate(values).astype(np.float64)
+
+        self.quantized = quantize_leaves
+        if quantize_leaves:
+            self._offset = float(values.min())
+            self._scale = float(values.max() - values.min()) / 255 or 1.0
+            self.values = np.round((values - self._offset) / self._scale).astype(np.uint8)
+        else:
+            self.values = values.astype(np.float32)
+
+    @staticmethod
+    def _compact_tree(tree, max_depth: int = None) -> tuple:
+        """Collects the reachable nodes of a sklearn tree in depth-first order,
+        cutting the tree off at max_depth.
+
+        Returns
+        -------
+            tuple : left, right, feature and threshold arrays of the nodes and the
+                value array of the leaves.
+        """
+        node_values = tree.value[:, 0, :]
+        if node_values.shape[1] > 1:
+            # Classifier node values are (weighted) class counts; normalize to fractions.
+            node_values = node_values / node_values.sum(axis=1, keepdims=True)
+
+        left, right, feature, threshold, leaf_values = [], [], [], [], []
+        # Stack of (sklearn node id, depth, compact parent id, is left child)
+        stack = [(0, 0, -1, False)]
+        while stack:
+            node, depth, parent, is_left = stack.pop()
+            compact_id = len(feature)
+            if parent >= 0:
+                if is_left:
+                    left[parent] = compact_id
+                else:
+                    right[parent] = compact_id
+
+            is_leaf = tree.children_left[node] == -1 or \
+                (max_depth is not None and depth >= max_depth)
+            if is_leaf:
+                left.append(len(leaf_values))
+                right.append(-1)
+                feature.append(_LEAF)
+                threshold.append(0.0)
+                leaf_values.append(node_values[node])
+            else:
+                left.append(-1)
+                right.append(-1)
+                feature.append(tree.feature[node])
+                threshold.append(tree.threshold[node])
+                stack.append((tree.children_right[node], depth + 1, compact_id, False))
+                stack.append((tree.children_left[node], depth + 1, compact_id, True))
+
+        return (np.asarray(left), np.asarray(right), np.asarray(feature),
+                np.asarray(threshold), np.asarray(leaf_values))
+
+    @property
+    def n_estimators(self) -> int:
+        return len(self.roots)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.feature)
+
+    def leaf_values(self, leaves: np.ndarray) -> np.ndarray:
+        """Returns the float leaf values for the given leaf indices."""
+        values = self.values[leaves]
+        if self.quantized:
+            return values.astype(np.float64) * self._scale + self._offset
+        return values.astype(np.float64)
+
+    def apply(self, X) -> np.ndarray:
+        """Returns the leaf index reached in every tree for each sample.
+
+        Returns
+        -------
+            np.ndarray : array of shape (n_samples, n_estimators) with leaf indices.
+        """
+        # Sparse rows are densified per prediction chunk only.
+        X = X.toarray() if sp.issparse(X) else X
+        X = np.asarray(X, dtype=np.float32)
+        nodes = np.tile(self.roots, (X.shape[0], 1))
+        rows = np.arange(X.shape[0])[:, None]
+
+        active = self.feature[nodes] != _LEAF
+        while active.any():
+            features = np.where(active, self.feature[nodes], 0)
+            go_left = X[rows, features] <= self.threshold[nodes]
+            nodes = np.where(active,
+                             np.where(go_left, self.left[nodes], self.right[nodes]),
+                             nodes)
+            active = self.feature[nodes] != _LEAF
+        return self.left[nodes]
+
+    def predict_per_tree(self, X) -> np.ndarray:
+        """Returns the values predicted by each tree separately.
+
+        Returns
+        -------
+            np.ndarray : array of shape (n_samples, n_estimators, n_values).
+        """
+        return self.leaf_values(self.apply(X))
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Averages class fractions over all trees."""
+        probabilities = self.predict_per_tree(X).mean(axis=1)
+        return probabilities / probabilities.sum(axis=1, keepdims=True)
+
+    def predict(self, X) -> np.ndarray:
+        """Predicts with the same semantics as the original forest.
+
+        Classifiers return the class with the highest average fraction,
+        regressors return the mean over all trees.
+        """
+        if self.is_classifier:
+            return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+        return self.predict_per_tree(X)[:, :, 0].mean(axis=1)
@@ -0,0 +1,161 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import pandas as pd
+from typing import Dict, List, Tuple
+from ._base import _BaseStrategy, _MultivariateStrategy
+
+
+class StrategyCache:
+    """On-disk, content-addressed cache of fitted strategy models.
+
+    Entries are keyed by a fingerprint of the target column data, the 
+    num-encoded imputed feature data, the strategy class and its parameters.
+    When the cache exceeds its maximum size, the least recently used entries
+    are evicted. Only strategies that set `cacheable` are cached.
+
+    Parameters
+    ----------
+    directory : str
+        The directory in which the cache entries are stored. Created if it does not exist.
+        
+    max_bytes : int (optional)
+        Maximum total size of the cache entries. Defaults to 1 GiB.
+    """
+    
+    directory: str
+    max_bytes: int
+    
+    _suffix = '.pkl'
+
+    def __init__(self, directory: str, max_bytes: int = 1 << 30):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def fit(self, strategy: _BaseStrategy, column_digests: Dict[str, Tuple] = None) -> bool:
+        """Loads the fitted model of the strategy from the cache, or fits the 
+        strategy and stores its model if it is not cached yet.
+
+        Parameters
+        ----------
+        strategy : _BaseStrategy
+            The strategy that needs fitting.
+            
+        column_digests : Dict[str, Tuple] (optional)
+            Digests of feature columns, see `fingerprint`.
+
+        Returns
+        -------
+            bool : True if the fitted model was loaded from the cache.
+        """
+        if not strategy.cacheable:
+            strategy.fit()
+            return False
+        
+        key = self.fingerprint(strategy, column_digests)
+        state = self.get(key)
+        if state is not None:
+            strategy.load_fitted_state(state)
+            return True
+        
+        strategy.fit()
+        self.put(key, strategy.get_fitted_state())
+        return False
+
+    def fingerprint(self, strategy: _BaseStrategy, column_digests: Dict[str, Tuple] = None) -> str:
+        """Computes the cache key of a strategy from the data and configuration 
+        it is fitted with.
+
+        Parameters
+        ----------
+        strategy : _BaseStrategy
+            The strategy to compute the key of.
+            
+        column_digests : Dict[str, Tuple] (optional)
+            Digests of the encoded feature columns by column name, shared by the 
+            strategies of one fit so that each column is hashed once instead of 
+            once per strategy. Filled by this method. Defaults to None (no sharing).
+
+        Returns
+        -------
+            str : hexadecimal sha256 digest.
+        """
+        digest = hashlib.sha256()
+        digest.update(f'{type(strategy).__module__}.{type(strategy).__qualname__}'.encode())
+        digest.update(repr(sorted(strategy.params.items())).encode())
+        
+        target_column = strategy.target_column
+        digest.update(repr((target_column.name, target_column.type)).encode())
+        digest.update(pd.util.hash_pandas_object(target_column.data, index=False).values.tobytes())
+        
+        if isinstance(strategy, _MultivariateStrategy):
+            digest.update(repr(strategy.max_buffer_rows).encode())
+            column_digests = {} if column_digests is None else column_digests
+            for col in strategy.feature_columns:
+                digest.update(repr(col.name).encode())
+                digest.update(self._column_digest(col, column_digests))
+        
+        return digest.hexdigest()
+
+    @staticmethod
+    def _column_digest(col, column_digests: Dict[str, Tuple]) -> bytes:
+        """Digest of the encoded imputed data of a column, reused while the data is unchanged."""
+        encoded = col.numeric_encoded_imputed_data
+        cached = column_digests.get(col.name)
+        # Imputing a column replaces its encoded data, which invalidates the digest.
+        if cached is not None and cached[0] is encoded:
+            return cached[1]
+        column_digest = hashlib.sha256(
+            pd.util.hash_pandas_object(pd.Series(encoded), index=False).values.tobytes()).digest()
+        column_digests[col.name] = (encoded, column_digest)
+        return column_digest
+
+    def get(self, key: str):
+        """Returns the cached model for the key, or None if it is not cached."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        # Marks the entry as recently used for eviction.
+        os.utime(path)
+        return state
+
+    def put(self, key: str, state) -> None:
+        """Stores a fitted model under the key and evicts least recently used entries."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def clear(self) -> None:
+        """Removes all cache entries."""
+        for path in self._entries():
+            os.remove(path)
+
+    @property
+    def size(self) -> int:
+        """Total number of bytes of the cache entries."""
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self._suffix)
+
+    def _entries(self) -> List[str]:
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                if name.endswith(self._suffix)]
+
+    def _evict(self) -> None:
+        """Removes least recently used entries until the cache fits in max_bytes."""
+        entries = sorted(((os.stat(path), path) for path in self._entries()),
+                         key=lambda entry: entry[0].st_mtime_ns)
+        total = sum(stat.st_size for stat, _ in entries)
+        for stat, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= stat.st_size
@@ -0,0 +1,326 @@
+from typing import Dict, List, Union
+import numpy as np
+import pandas as pd
+from ..domain import Column, DataType
+from ._base import _MultivariateStrategy
+
+
+class _KeyedStrategy(_MultivariateStrategy):
+    """Base class for strategies that impute a column from its own values within
+    groups of key columns, and optionally along the order of a sort key column.
+
+    The key columns are the feature columns of these strategies. They are picked
+    by name from the feature columns the strategy is constructed or bound with,
+    so that a fitted strategy can be bound to the columns of a new partition.
+
+    Parameters
+    ----------
+    target_column : Column
+        The column which needs imputation.
+
+    feature_columns : List[Column]
+        The columns from which the key columns are picked by name.
+
+    group_by : Union[str, List[str]] (optional)
+        Name(s) of the columns that define the groups. Defaults to None (one group).
+
+    order_by : str (optional)
+        Name of the sort key column. Defaults to None (row order).
+    """
+
+    def __init__(self,
+                 target_column: Column,
+                 feature_columns: List[Column],
+                 group_by: Union[str, List[str]] = None,
+                 order_by: str = None
+                 ):
+        if target_column.type not in self.supported_data_types:
+            raise ValueError(f'Data type {target_column.type} not supported by {type(self).__name__}.')
+
+        self.group_by = [] if group_by is None else [group_by] if isinstance(group_by, str) else list(group_by)
+        self.order_by = order_by
+        super().__init__(target_column, feature_columns)
+        self.feature_columns = self._key_columns(feature_columns)
+
+    def _key_columns(self, feature_columns: List[Column]) -> List[Column]:
+        """Picks the group and sort key columns by name, in that order."""
+        names = self.group_by + ([] if self.order_by is None else [self.order_by])
+        by_name = {col.name: col for col in feature_columns} if feature_columns is not None else {}
+        missing = [name for name in names if name not in by_name]
+        if len(missing) > 0:
+            raise ValueError(f'Key column(s) {missing} of column \'{self.target_column.name}\' not found.')
+        return [by_name[name] for name in names]
+
+    def bind(self, target_column: Column, feature_columns: List[Column] = None) -> '_KeyedStrategy':
+        bound = super().bind(target_column, feature_columns)
+        bound.feature_columns = bound._key_columns(feature_columns)
+        return bound
+
+    @property
+    def params(self) -> Dict:
+        return {
+            'group_by': self.group_by,
+            'order_by': self.order_by
+        }
+
+    def estimated_buffer_bytes(self) -> int:
+        return 0
+
+    def _encoded_target(self) -> np.ndarray:
+        """Copy of the target values as float64 with NaN for missing values, codes for categorical columns."""
+        if self.target_column.type is DataType.CATEGORICAL:
+            return np.where(self.target_column.codes == -1, np.nan, self.target_column.codes)
+        return self.target_column.data.to_numpy(dtype=np.float64, copy=True)
+
+    def _group_keys(self) -> List[np.ndarray]:
+        """Encoded values of the group key columns."""
+        return [np.asarray(col.numeric_encoded_imputed_data) for col in self.feature_columns[:len(self.group_by)]]
+
+    def _group_ids(self) -> np.ndarray:
+        """Dense group number of every row, computed in one groupby pass."""
+        keys = self._group_keys()
+        if len(keys) == 0:
+            return np.zeros(len(self.target_column.data), dtype=np.int64)
+        return pd.DataFrame(dict(enumerate(keys))).groupby(list(range(len(keys))), sort=False) \
+            .ngroup().to_numpy()
+
+    def _create_series(self, values: np.ndarray) -> pd.Series:
+        """Decodes codes of categorical columns, other columns stay float (epoch for datetime)."""
+        if self.target_column.type is DataType.CATEGORICAL:
+            return pd.Series(pd.Categorical.from_codes(values.astype(np.int32), self.target_column.categories),
+                             name=self.target_column.name)
+        if self.target_column.is_sparse:
+            values = pd.arrays.SparseArray(values, fill_value=self.target_column.data.sparse.fill_value)
+        return pd.Series(values, name=self.target_column.name)
+
+    def _fallback(self) -> float:
+        """Encoded average of the column for rows that have no value to derive one from."""
+        if self.target_column.type is DataType.CATEGORICAL:
+            return float(self.target_column._encode(pd.Series([self.average]))[0])
+        return self.average
+
+
+class FillStrategy(_KeyedStrategy):
+    """
+    Strategy that fills missing values from the neighbouring values along a sort key,
+    within groups, e.g. of time-ordered measurements per entity.
+
+    Fully vectorized: rows are sorted once by group and sort key, after which
+    the last and next observed value of every row within its group are found
+    with cumulative maxima and minima.
+
+    Parameters
+    ----------
+    target_column : Column
+        The column which needs imputation.
+
+    feature_columns : List[Column]
+        The columns from which the key columns are picked by name.
+
+    method : str (optional)
+        'ffill' takes the last observed value, 'bfill' the next observed value and
+        'interpolate' interpolates linearly between both along the sort key
+        (continuous and datetime columns only). Rows without a value on the
+        preferred side take the value on the other side. Defaults to 'ffill'.
+
+    group_by : Union[str, List[str]] (optional)
+        Name(s) of the columns that define the groups. Defaults to None (one group).
+
+    order_by : str (optional)
+        Name of the sort key column. Defaults to None (row order).
+    """
+
+    supported_data_types: List = [
+        DataType.CATEGORICAL,
+        DataType.CONTINUOUS,
+        DataType.DATETIME
+        ]
+    methods: List[str] = ['ffill', 'bfill', 'interpolate']
+
+    def __init__(self,
+                 target_column: Column,
+                 feature_columns: List[Column],
+                 method: str = 'ffill',
+                 group_by: Union[str, List[str]] = None,
+                 order_by: str = None
+                 ):
+        if method not in self.methods:
+            raise ValueError(f'Fill method \'{method}\' is not supported, use one of {self.methods}.')
+        if method == 'interpolate' and target_column.type is DataType.CATEGORICAL:
+            raise ValueError(f'Categorical column \'{target_column.name}\' cannot be interpolated.')
+        self.method = method
+        super().__init__(target_column, feature_columns, group_by, order_by)
+
+    @classmethod
+    def from_dict(cls,
+                  target_column: Column,
+                  feature_columns: List[Column],
+                  **kwargs: Dict):
+        return cls(
+            target_column,
+            feature_columns,
+            method = kwargs.get('method', 'ffill'),
+            group_by = kwargs.get('group_by'),
+            order_by = kwargs.get('order_by')
+        )
+
+    @property
+    def params(self) -> Dict:
+        return {'method': self.method, **super().params}
+
+    def fit(self) -> None:
+        """Stores the average of the column for groups without observed values."""
+        self.average = self.target_column.average
+
+    def impute_column(self) -> pd.Series:
+        """Fills all null values from their neighbours within their group.
+
+        Returns
+        -------
+            pd.Series: fully imputed data column.
+        """
+        values = self._encoded_target()
+        row_count = len(values)
+        group_ids = self._group_ids()
+        positions = np.arange(row_count)
+        sort_key = positions if self.order_by is None \
+            else np.asarray(self.feature_columns[-1].numeric_encoded_imputed_data, dtype=np.float64)
+        order = np.lexsort((positions, sort_key, group_ids))
+
+        sorted_values = values[order]
+        sorted_keys = sort_key[order].astype(np.float64)
+        observed = ~np.isnan(sorted_values)
+        is_start = np.ones(row_count, dtype=bool)
+        is_start[1:] = group_ids[order][1:] != group_ids[order][:-1]
+        group_start = np.maximum.accumulate(np.where(is_start, positions, 0))
+        is_end = np.roll(is_start, -1)
+        group_end = np.minimum.accumulate(np.where(is_end, positions, row_count - 1)[::-1])[::-1]
+
+        # Positions of the last and next observed value, if they are in the same group.
+        previous = np.maximum.accumulate(np.where(observed, positions, -1))
+        has_previous = previous >= group_start
+        following = np.minimum.accumulate(np.where(observed, positions, row_count)[::-1])[::-1]
+        has_following = following <= group_end
+        previous = np.where(has_previous, previous, 0)
+        following = np.where(has_following, following, 0)
+
+        if self.method == 'interpolate':
+            span = sorted_keys[following] - sorted_keys[previous]
+            weight = np.divide(sorted_keys - sorted_keys[previous], span,
+                               out=np.zeros(row_count), where=span != 0)
+            filled = sorted_values[previous] + weight * (sorted_values[following] - sorted_values[previous])
+            filled = np.where(has_previous & has_following, filled,
+                              np.where(has_previous, sorted_values[previous], sorted_values[following]))
+        else:
+            first, second = (previous, following) if self.method == 'ffill' else (following, previous)
+            has_first, has_second = (has_previous, has_following) if self.method == 'ffill' \
+                else (has_following, has_previous)
+            filled = np.where(has_first, sorted_values[first], sorted_values[second])
+        filled = np.where(has_previous | has_following, filled, self._fallback())
+
+        values[order[~observed]] = filled[~observed]
+        return self._create_series(values)
+
+
+class GroupStatisticStrategy(_KeyedStrategy):
+    """
+    Strategy that fills missing values with the mean, median or mode of the
+    observed values in their group, computed in one groupby pass.
+
+    Groups without observed values, also in new partitions, are filled with the
+    average of the column.
+
+    Parameters
+    ----------
+    target_column : Column
+        The column which needs imputation.
+
+    feature_columns : List[Column]
+        The columns from which the group key columns are picked by name.
+
+    group_by : Union[str, List[str]]
+        Name(s) of the columns that define the groups.
+
+    statistic : str (optional)
+        'mean' or 'median' (continuous and datetime columns) or 'mode'.
+        Defaults to None, which is the mode for categorical and the mean for
+        other columns.
+    """
+
+    supported_data_types: List = [
+        DataType.CATEGORICAL,
+        DataType.CONTINUOUS,
+        DataType.DATETIME
+        ]
+    statistics: List[str] = ['mean', 'median', 'mode']
+
+    def __init__(self,
+                 target_column: Column,
+                 feature_columns: List[Column],
+                 group_by: Union[str, List[str]],
+                 statistic: str = None
+                 ):
+        if group_by is None or len(group_by) == 0:
+            raise ValueError(f'Group strategy of column \'{target_column.name}\' needs group_by columns.')
+        if statistic is None:
+            statistic = 'mode' if target_column.type is DataType.CATEGORICAL else 'mean'
+        if statistic not in self.statistics or \
+            (target_column.type is DataType.CATEGORICAL and statistic != 'mode'):
+            raise ValueError(f'Statistic \'{statistic}\' is not supported for column \'{target_column.name}\'.')
+        self.statistic = statistic
+        super().__init__(target_column, feature_columns, group_by)
+
+    @classmethod
+    def from_dict(cls,
+                  target_column: Column,
+                  feature_columns: List[Column],
+                  **kwargs: Dict):
+        return cls(
+            target_column,
+            feature_columns,
+            group_by = kwargs.get('group_by'),
+            statistic = kwargs.get('statistic')
+        )
+
+    @property
+    def params(self) -> Dict:
+        return {'group_by': self.group_by, 'statistic': self.statistic}
+
+    def get_fitted_state(self):
+        return self.group_values, self.average
+
+    def load_fitted_state(self, state) -> None:
+        self.group_values, self.average = state
+
+    def fit(self) -> None:
+        """Computes the statistic of the observed values per group key."""
+        self.average = self.target_column.average
+        observed = self.target_column.non_null_indices[0]
+        keys = {name: key[observed] for name, key in zip(self.group_by, self._group_keys())}
+        values = self._encoded_target()[observed]
+
+        if self.statistic == 'mode':
+            counts = pd.DataFrame({**keys, '_value': values}).value_counts(sort=True)
+            modes = counts.reset_index().drop_duplicates(subset=self.group_by, keep='first')
+            self.group_values = modes.set_index(self.group_by)['_value']
+        else:
+            self.group_values = pd.Series(values).groupby([pd.Series(key) for key in keys.values()],
+                                                          sort=False).agg(self.statistic)
+            self.group_values.index.names = self.group_by
+
+    def impute_column(self) -> pd.Series:
+        """Fills all null values with the statistic of their group.
+
+        Returns
+        -------
+            pd.Series: fully imputed data column.
+        """
+        values = self._encoded_target()
+        null_rows = self.target_column.null_indices[0]
+        keys = [key[null_rows] for key in self._group_keys()]
+        index = pd.MultiIndex.from_arrays(keys) if len(keys) > 1 else pd.Index(keys[0])
+        positions = self.group_values.index.get_indexer(index)
+        values[null_rows] = np.where(positions >= 0,
+                                     self.group_values.to_numpy(dtype=np.float64)[positions],
+                                     self._fallback())
+        return self._create_series(values)
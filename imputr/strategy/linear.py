@@ -0,0 +1,311 @@
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from ..domain import Column, DataType
+from ._base import _MultivariateStrategy
+
+# Rows per block when accumulating the Gram matrix, bounds the dense buffer.
+_GRAM_CHUNK_ROWS = 8192
+
+
+def _solve(matrix: np.ndarray, right_hand_side: np.ndarray) -> np.ndarray:
+    """Solves the linear system, by least squares if it is singular (e.g. without ridge penalty)."""
+    try:
+        return np.linalg.solve(matrix, right_hand_side)
+    except np.linalg.LinAlgError:
+        return np.linalg.lstsq(matrix, right_hand_side, rcond=None)[0]
+
+
+class _GramSystem:
+    """Centered ridge Gram matrix of the encoded imputed data of a set of columns and its inverse.
+
+    Every column of the system can be regressed on the other columns from the
+    same matrices, so that k targets cost one pass over the data instead of k
+    model fits. The rows where a target is missing only hold a placeholder and
+    are removed before the target is solved. The rows are read again when the
+    target is solved, nothing per target is stored: with fewer missing rows 
+    than columns they are removed from the shared inverse with a low-rank 
+    (Woodbury) downdate, otherwise the Gram matrix of the observed rows is 
+    accumulated from them and solved directly.
+
+    The columns are shifted by the mean of their first rows before accumulating
+    and the matrices are scaled to a unit diagonal before inversion, so that 
+    columns of very different magnitude, e.g. datetimes in epoch nanoseconds,
+    do not lose the precision of the other columns.
+
+    Parameters
+    ----------
+    columns : List[Column]
+        The target and feature columns of the system.
+
+    alpha : float
+        Ridge penalty added to the diagonal.
+    """
+
+    index: Dict[str, int]
+    alpha: float
+    row_count: int
+    shift: np.ndarray
+    sums: np.ndarray
+    raw_gram: np.ndarray
+    mean: np.ndarray
+    scale: np.ndarray
+    gram: np.ndarray
+    precision: np.ndarray
+
+    def __init__(self, columns: List[Column], alpha: float):
+        self.index = {col.name: position for position, col in enumerate(columns)}
+        self.alpha = alpha
+        self.row_count = len(columns[0].data)
+        # References to the encoded data, not copies, while the system is alive.
+        self._encoded = [np.asarray(col.numeric_encoded_imputed_data) for col in columns]
+        self._null_rows = {col.name: col.null_indices[0] for col in columns}
+        self.shift = np.array([values[:_GRAM_CHUNK_ROWS].astype(np.float64).mean() if len(values) > 0 else 0.0
+                               for values in self._encoded])
+
+        self.sums = np.zeros(len(columns))
+        self.raw_gram = np.zeros((len(columns), len(columns)))
+        for start in range(0, self.row_count, _GRAM_CHUNK_ROWS):
+            block = self._rows(np.arange(start, min(start + _GRAM_CHUNK_ROWS, self.row_count)))
+            self.sums += block.sum(axis=0)
+            self.raw_gram += block.T @ block
+
+        self.mean, gram = self._centered(self.sums, self.raw_gram, self.row_count)
+        # Scaled to unit diagonal, which the ridge penalty keeps positive.
+        self.scale = 1 / np.sqrt(np.where(np.diag(gram) > 0, np.diag(gram), 1.0))
+        self.gram = gram * np.outer(self.scale, self.scale)
+        self.precision = np.linalg.pinv(self.gram, hermitian=True)
+
+    def _rows(self, rows: np.ndarray) -> np.ndarray:
+        """Shifted encoded data of all columns at the given row positions."""
+        return np.column_stack([values[rows] for values in self._encoded]).astype(np.float64) - self.shift
+
+    def _centered(self, sums: np.ndarray, raw_gram: np.ndarray, row_count: int) -> tuple:
+        """Column means and the centered Gram matrix with the ridge penalty on its diagonal."""
+        mean = sums / max(row_count, 1)
+        gram = raw_gram - row_count * np.outer(mean, mean)
+        gram[np.diag_indices_from(gram)] += self.alpha
+        return self.shift + mean, gram
+
+    def coefficients(self, target_column: Column, feature_columns: List[Column]) -> tuple:
+        """Solves the ridge regression of the target on the feature columns,
+        over the rows where the target is observed.
+
+        Returns
+        -------
+            tuple: coefficients in feature column order and the intercept.
+        """
+        target = self.index[target_column.name]
+        features = np.asarray([self.index[col.name] for col in feature_columns], dtype=np.int64)
+        null_rows = self._null_rows[target_column.name]
+        if len(null_rows) >= self.row_count:
+            return np.zeros(len(features)), self.mean[target]
+        
+        if len(null_rows) < len(self.index):
+            mean, scaled = self._solve_downdated(null_rows, target, features)
+        else:
+            mean, scaled = self._solve_observed(null_rows, target, features)
+        coefficients = self.scale[features] * scaled / self.scale[target]
+        intercept = mean[target] - mean[features] @ coefficients
+        return coefficients, intercept
+
+    def _solve_downdated(self, null_rows: np.ndarray, target: int, features: np.ndarray) -> tuple:
+        """Solves the scaled system without the null rows of the target by a 
+        Woodbury downdate of the shared inverse, in time proportional to them.
+
+        Returns
+        -------
+            tuple: means of the observed rows and the scaled coefficients.
+        """
+        if len(null_rows) == 0:
+            mean, factor = self.mean, np.empty((len(self.index), 0))
+        else:
+            block = self._rows(null_rows)
+            observed_count = self.row_count - len(null_rows)
+            mean = self.shift + (self.sums - block.sum(axis=0)) / observed_count
+            block_mean = block.mean(axis=0)
+            # Centered Gram of the observed rows = gram - factor @ factor.T
+            weight = np.sqrt(self.row_count * len(null_rows) / observed_count)
+            factor = np.column_stack([(block - block_mean).T, 
+                                      weight * (block_mean - self.sums / self.row_count)])
+            factor *= self.scale[:, None]
+        
+        if len(features) == len(self.index) - 1:
+            # The coefficients on all other columns are a scaled column of the inverse.
+            precision_factor = self.precision @ factor
+            capacitance = np.eye(factor.shape[1]) - factor.T @ precision_factor
+            column = self.precision[:, target]
+            if factor.shape[1] > 0:
+                column = column + \
+                    precision_factor @ _solve(capacitance, precision_factor[target])
+            return mean, -column[features] / column[target]
+        
+        gram = self.gram[np.ix_(features, features)] - factor[features] @ factor[features].T
+        right_hand_side = self.gram[features, target] - factor[features] @ factor[target]
+        return mean, _solve(gram, right_hand_side)
+
+    def _solve_observed(self, null_rows: np.ndarray, target: int, features: np.ndarray) -> tuple:
+        """Solves the scaled system of the observed rows of the target, accumulated 
+        by subtracting its null rows in blocks.
+
+        Returns
+        -------
+            tuple: means of the observed rows and the scaled coefficients.
+        """
+        sums, raw_gram = self.sums.copy(), self.raw_gram.copy()
+        for start in range(0, len(null_rows), _GRAM_CHUNK_ROWS):
+            block = self._rows(null_rows[start:start + _GRAM_CHUNK_ROWS])
+            sums -= block.sum(axis=0)
+            raw_gram -= block.T @ block
+        mean, gram = self._centered(sums, raw_gram, self.row_count - len(null_rows))
+        gram *= np.outer(self.scale, self.scale)
+        return mean, _solve(gram[np.ix_(features, features)], gram[features, target])
+
+
+class LinearStrategy(_MultivariateStrategy):
+    """
+    Strategy implementation for ridge regression imputation of continuous columns.
+
+    All linear strategies of an imputer are solved together from one shared
+    Gram matrix of the imputed table and its inverse, see `fit_together`, which 
+    makes this a cheap alternative to the RandomForestStrategy for wide 
+    continuous tables. Each target is trained on the rows where it is observed, 
+    with the feature values that were imputed when fitting starts (e.g. the mean).
+    Only continuous and datetime columns are used as features, the codes of
+    categorical columns have no linear meaning.
+
+    Parameters
+    ----------
+    target_column : Column
+        The column which needs imputation.
+
+    feature_columns : List[Column]
+        The predictor columns of the regression.
+
+    alpha : float (optional)
+        Ridge penalty on the coefficients. Defaults to 1.0.
+    """
+
+    supported_data_types: List = [
+        DataType.CONTINUOUS
+        ]
+    supported_feature_types: List = [
+        DataType.CONTINUOUS,
+        DataType.DATETIME
+        ]
+
+    def __init__(self,
+                 target_column: Column,
+                 feature_columns: List[Column],
+                 alpha: float = 1.0
+                 ):
+        super().__init__(target_column, feature_columns)
+
+        if target_column.type not in self.supported_data_types:
+            raise ValueError(f'Data type {target_column.type} not supported by the linear strategy.')
+
+        self.alpha = alpha
+        self._solution = None
+
+    @classmethod
+    def from_dict(cls,
+                  target_column: Column,
+                  feature_columns: List[Column],
+                  **kwargs: Dict):
+        return cls(
+            target_column,
+            feature_columns,
+            alpha = kwargs.get('alpha', 1.0)
+        )
+
+    @classmethod
+    def fit_together(cls, strategies: List['LinearStrategy']) -> None:
+        """Builds one Gram system per ridge penalty over the union of the target
+        and feature columns of the strategies and solves each of them from it.
+        
+        The solutions are taken over by `fit`, the system is discarded afterwards,
+        so that it holds no references to data that is imputed while fitting.
+        """
+        by_alpha = {}
+        for strategy in strategies:
+            by_alpha.setdefault(strategy.alpha, []).append(strategy)
+
+        for alpha, group in by_alpha.items():
+            columns = {}
+            for strategy in group:
+                for col in [strategy.target_column, *strategy.feature_columns]:
+                    columns.setdefault(col.name, col)
+            system = _GramSystem(list(columns.values()), alpha)
+            for strategy in group:
+                strategy._solution = system.coefficients(strategy.target_column, strategy.feature_columns)
+
+    @property
+    def params(self) -> Dict:
+        return {
+            'alpha': self.alpha
+        }
+
+    def get_fitted_state(self):
+        return self.coef_, self.intercept_
+
+    def load_fitted_state(self, state) -> None:
+        self.coef_, self.intercept_ = state
+
+    def fit(self) -> None:
+        """Takes over the solution from the shared Gram system, or solves the 
+        ridge regression from a system of its own columns when fitted on its own.
+        """
+        solution = self._solution
+        if solution is None:
+            system = _GramSystem([self.target_column, *self.feature_columns], self.alpha)
+            solution = system.coefficients(self.target_column, self.feature_columns)
+        self.coef_, self.intercept_ = solution
+        self._solution = None
+
+    def _predict(self, rows: np.ndarray) -> np.ndarray:
+        """Predicts the target at the given row positions, in chunks of at most max_buffer_rows rows."""
+        if len(rows) == 0:
+            return np.empty(0)
+        chunk_size = len(rows) if self.max_buffer_rows is None else max(self.max_buffer_rows, 1)
+        return np.concatenate([
+            np.asarray(self._feature_rows(rows[start:start + chunk_size]) @ self.coef_).ravel()
+            + self.intercept_
+            for start in range(0, len(rows), chunk_size)])
+
+    def score(self, rows: np.ndarray) -> float:
+        if len(rows) == 0:
+            return np.nan
+        target = self.target_column.data.to_numpy(dtype=np.float64)[rows]
+        return float(np.sqrt(np.mean((self._predict(rows) - target) ** 2)))
+
+    def validation_score(self) -> float:
+        """RMSE on the observed rows, corrected for the degrees of freedom of the fit."""
+        rows = self.target_column.non_null_indices[0]
+        degrees_of_freedom = len(rows) - len(self.feature_columns) - 1
+        if degrees_of_freedom <= 0:
+            return None
+        return self.score(rows) * np.sqrt(len(rows) / degrees_of_freedom)
+
+    def release_model(self) -> None:
+        """Discards the fitted coefficients."""
+        if hasattr(self, 'coef_'):
+            del self.coef_, self.intercept_
+
+    def release_buffers(self) -> None:
+        """Frees the feature buffer and the solution of the shared Gram system."""
+        super().release_buffers()
+        self._solution = None
+
+    def impute_column(self) -> pd.Series:
+        """Imputes all null values with the linear predictions and unions with non-null values.
+
+        Returns
+        -------
+            pd.Series: fully imputed data column.
+        """
+        null_rows = self.target_column.null_indices[0]
+        values = self.target_column.data.to_numpy(dtype=np.float64, copy=True)
+        values[null_rows] = self._predict(null_rows)
+        if self.target_column.is_sparse:
+            values = pd.arrays.SparseArray(values, fill_value=self.target_column.data.sparse.fill_value)
+        return pd.Series(values, name=self.target_column.name)
@@ -13,7 +13,8 @@ class MeanStrategy(_UnivariateStrategy):
 
     supported_data_types: List = [
         DataType.CATEGORICAL,
-        DataType.CONTINUOUS
+        DataType.CONTINUOUS,
+        DataType.DATETIME
         ]
 
     def __init__(self,
@@ -41,4 +42,4 @@ class MeanStrategy(_UnivariateStrategy):
         -------
             pd.Series: fully imputed data column.
         """
-        return self.target_column.data.fillna(self.mean)
\ No newline at end of file
+        return self.target_column.fill_missing(self.mean)
\ No newline at end of file
@@ -1,10 +1,15 @@
 from abc import  abstractmethod
-from typing import Union, Dict, List
-from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+from typing import Union, Dict, List, Tuple
 import pandas as pd
 from ..domain import Column, DataType
 from ._base import _MultivariateStrategy
+from ._compact import _CompactForest
 import numpy as np
+import scipy.sparse as sp
+import pickle
+
+# Class that stands in for the collapsed long tail of a high-cardinality target.
+_OTHER_CODE = -2
 
 
 class RandomForestStrategy(_MultivariateStrategy):
@@ -43,13 +48,22 @@ class RandomForestStrategy(_MultivariateStrategy):
         
     max_leaf_nodes : int (optional)
         Max number of nodes at leaves of the decision trees. Please refer...
+        
+    max_classes : int (optional)
+        Maximum number of classes of the classifier for categorical targets. 
+        Above it, only the most frequent categories are kept as classes and the 
+        long tail is collapsed into one "other" class. Rows predicted as "other" 
+        are imputed by sampling tail categories weighted by their frequency.
+        Defaults to 256, None always trains on all categories.
     
     """
     
     supported_data_types: List = [
         DataType.CATEGORICAL,
-        DataType.CONTINUOUS
+        DataType.CONTINUOUS,
+        DataType.DATETIME
         ]
+    cacheable: bool = True
 
     def __init__(self, 
                  target_column: Column, 
@@ -60,7 +74,8 @@ class RandomForestStrategy(_MultivariateStrategy):
                  min_samples_leaf: int = 128,
                  min_weight_fraction_leaf: float = 0.35,
                  max_features: Union[str, float] = "sqrt",
-                 max_leaf_nodes: int = 32
+                 max_leaf_nodes: int = 32,
+                 max_classes: int = 256
                  ):
         super().__init__(target_column, feature_columns)
         
@@ -74,7 +89,11 @@ class RandomForestStrategy(_MultivariateStrategy):
         self.min_weight_fraction_leaf = min_weight_fraction_leaf
         self.max_features = max_features
         self.max_leaf_nodes = max_leaf_nodes
+        self.max_classes = max_classes
         self.data_type = target_column.type
+        self._tail_codes = None
+        self._tail_weights = None
+        self._validation_score = None
        
     @classmethod
     def from_dict(cls, 
@@ -90,37 +109,286 @@ class RandomForestStrategy(_MultivariateStrategy):
             min_samples_leaf = kwargs.get('min_samples_leaf', 128),
             min_weight_fraction_leaf = kwargs.get('min_weight_fraction_leaf', 0.35),
             max_features = kwargs.get('max_features', 'sqrt'),
-            max_leaf_nodes = kwargs.get('max_leaf_nodes', 32)
+            max_leaf_nodes = kwargs.get('max_leaf_nodes', 32),
+            max_classes = kwargs.get('max_classes', 256)
         )
 
+    @property
+    def params(self) -> Dict:
+        return {
+            'n_estimators': self.n_estimators,
+            'max_depth': self.max_depth,
+            'min_sample_split': self.min_sample_split,
+            'min_samples_leaf': self.min_samples_leaf,
+            'min_weight_fraction_leaf': self.min_weight_fraction_leaf,
+            'max_features': self.max_features,
+            'max_leaf_nodes': self.max_leaf_nodes,
+            'max_classes': self.max_classes
+        }
+
+    def get_fitted_state(self):
+        return self.impute_strategy, self._tail_codes, self._tail_weights
+
+    def load_fitted_state(self, state) -> None:
+        self.impute_strategy, self._tail_codes, self._tail_weights = state
+        self._validation_score = None
+        if hasattr(self.impute_strategy, 'n_jobs'):
+            # Cached forests predict with the threads of this fit, not of the one that stored them.
+            self.impute_strategy.n_jobs = self.n_jobs
+
     def fit(self) -> None:
-        """Fits RandomForest to make ready for imputation.
+        """Fits RandomForest to make ready for imputation, see `_new_estimator`."""
+        self.impute_strategy = self._new_estimator()
+        self._validation_score = None
+        
+        # Train on rows where target column is not null. Without a row limit the
+        # full feature DF is kept for imputation (unless the rows are read from the 
+        # shared feature matrix), otherwise a sample of rows is used.
+        train_rows = self.target_column.non_null_indices[0]
+        self.training_fraction = 1.0
+        if self.max_buffer_rows is None and self.feature_matrix is None:
+            self._feature_df = self._create_df_from_num_encoded_feature_columns(self.feature_columns)
+        elif self.max_buffer_rows is not None and len(train_rows) > self.max_buffer_rows:
+            rng = np.random.default_rng(0)
+            self.training_fraction = self.max_buffer_rows / len(train_rows)
+            train_rows = np.sort(rng.choice(train_rows, self.max_buffer_rows, replace=False))
+        
+        self._tail_codes, self._tail_weights = None, None
+        if self.data_type == DataType.CATEGORICAL:
+            self._collapse_tail(self.target_column.codes[self.target_column.non_null_indices[0]])
+        
+        feature_df_where_not_null = self._feature_rows(train_rows)
+        target_where_not_null = self._collapsed(self._target_values(train_rows))
+        self.impute_strategy.fit(feature_df_where_not_null, target_where_not_null)
+    
+    def _new_estimator(self):
+        """Creates an unfitted forest with the parameters of the strategy.
         
         Looks at DataType to determine if it needs a Regressor or Classifier. 
-        The scikit APIs are the same for both models, which is why we use the 
-        `estimator_cls` variable.
+        The scikit APIs are the same for both models.
         """
-        if self.data_type == DataType.CONTINUOUS:
+        # scikit-learn is imported on first fit, it dominates the import time of imputr.
+        from sklearn.ensemble import RandomForestRegressor, RandomForestClassifier
+        
+        # Datetime targets are regressed on their epoch values.
+        if self.data_type in (DataType.CONTINUOUS, DataType.DATETIME):
             estimator_cls = RandomForestRegressor
 
         if self.data_type == DataType.CATEGORICAL:
             estimator_cls = RandomForestClassifier
 
-        self.impute_strategy = estimator_cls(n_estimators=self.n_estimators,
-                                          max_depth=self.max_depth,
-                                          min_samples_leaf=self.min_samples_leaf,
-                                          min_samples_split=self.min_sample_split,
-                                          min_weight_fraction_leaf=self.min_weight_fraction_leaf,
-                                          max_features=self.max_features,
-                                          max_leaf_nodes=self.max_leaf_nodes
-                                          )
+        return estimator_cls(n_estimators=self.n_estimators,
+                             max_depth=self.max_depth,
+                             min_samples_leaf=self.min_samples_leaf,
+                             min_samples_split=self.min_sample_split,
+                             min_weight_fraction_leaf=self.min_weight_fraction_leaf,
+                             max_features=self.max_features,
+                             max_leaf_nodes=self.max_leaf_nodes,
+                             n_jobs=self.n_jobs)
+    
+    def _fit_held_out(self, max_rows: int = 10000) -> Tuple[object, np.ndarray]:
+        """Fits a forest with the parameters of the strategy on the observed rows 
+        except a random quarter (of at most max_rows rows) that is held out.
+
+        Returns
+        -------
+            Tuple[object, np.ndarray]: the fitted forest and the positions of the held-out rows.
+        """
+        rng = np.random.default_rng(0)
+        observed_rows = rng.permutation(self.target_column.non_null_indices[0])
+        held_out_count = min(len(observed_rows) // 4, max_rows)
+        held_out_rows = np.sort(observed_rows[:held_out_count])
+        train_rows = np.sort(observed_rows[held_out_count:])
+        if self.max_buffer_rows is not None and len(train_rows) > self.max_buffer_rows:
+            train_rows = np.sort(rng.choice(train_rows, self.max_buffer_rows, replace=False))
         
-        # Get full feature DF, train on rows where target column is not null.
-        self._feature_df = self._create_df_from_num_encoded_feature_columns(self.feature_columns)
+        estimator = self._new_estimator()
+        estimator.fit(self._feature_rows(train_rows), self._collapsed(self._target_values(train_rows)))
+        return estimator, held_out_rows
+    
+    def _collapse_tail(self, codes: np.ndarray) -> None:
+        """Keeps the max_classes - 1 most frequent categories as classes and 
+        remembers the remaining categories with their frequencies.
+        """
+        counts = np.bincount(codes, minlength=len(self.target_column.categories))
+        observed = np.flatnonzero(counts)
+        if self.max_classes is None or len(observed) <= self.max_classes:
+            return
+        by_frequency = observed[np.argsort(-counts[observed], kind='stable')]
+        tail = np.sort(by_frequency[max(self.max_classes, 2) - 1:])
+        self._tail_codes = tail.astype(np.int32)
+        self._tail_weights = counts[tail] / counts[tail].sum()
+    
+    def _collapsed(self, codes: np.ndarray) -> np.ndarray:
+        """Replaces codes of tail categories by the "other" class."""
+        if self._tail_codes is None:
+            return codes
+        return np.where(np.isin(codes, self._tail_codes), _OTHER_CODE, codes)
+    
+    def _predict(self, features: pd.DataFrame, rng: np.random.Generator, estimator=None) -> np.ndarray:
+        """Predicts with the fitted model, or the given forest, and draws a tail 
+        category for predictions of the "other" class.
         
-        feature_df_where_not_null = self._feature_df.iloc[self.target_column.non_null_indices]
-        target_where_not_null = self.target_column.data.iloc[self.target_column.non_null_indices]
-        self.impute_strategy.fit(feature_df_where_not_null, target_where_not_null)
+        The generator is shared by the chunks of one prediction, so that the 
+        draws do not repeat per chunk or depend on the chunk size.
+        """
+        estimator = self.impute_strategy if estimator is None else estimator
+        predictions = estimator.predict(features)
+        if self._tail_codes is not None:
+            is_other = predictions == _OTHER_CODE
+            predictions[is_other] = rng.choice(self._tail_codes, np.count_nonzero(is_other), 
+                                               p=self._tail_weights)
+        return predictions
+    
+    def draw(self, m: int, rng: np.random.Generator) -> np.ndarray:
+        """Draws m imputations of the missing values from the fitted forest.
+
+        Continuous and datetime values are the predictions of a tree drawn at
+        random per value, categorical values are sampled from the class
+        probabilities of the forest. The features are read once for all draws.
+
+        Parameters
+        ----------
+        m : int
+            Number of imputations.
+
+        rng : np.random.Generator
+            Random generator of the draws.
+
+        Returns
+        -------
+            np.ndarray: array of shape (m, number of missing values) with codes
+                for categorical and float values for other columns.
+        """
+        null_rows = self.target_column.null_indices[0]
+        is_categorical = self.data_type == DataType.CATEGORICAL
+        draws = np.empty((m, len(null_rows)), dtype=np.int32 if is_categorical else np.float64)
+        chunk_size = max(len(null_rows) if self.max_buffer_rows is None else self.max_buffer_rows, 1)
+        for start in range(0, len(null_rows), chunk_size):
+            features = self._feature_rows(null_rows[start:start + chunk_size])
+            if is_categorical:
+                chunk_draws = self._draw_classes(features, m, rng)
+            else:
+                chunk_draws = self._draw_trees(features, m, rng)
+            draws[:, start:start + chunk_draws.shape[1]] = chunk_draws
+        return draws
+
+    def _draw_trees(self, features: pd.DataFrame, m: int, rng: np.random.Generator) -> np.ndarray:
+        """Picks the prediction of a random tree for every row in every draw."""
+        if isinstance(self.impute_strategy, _CompactForest):
+            per_tree = self.impute_strategy.predict_per_tree(features)[:, :, 0]
+        else:
+            # The trees of a sklearn forest are fitted on arrays without feature names.
+            features = features if sp.issparse(features) else np.asarray(features, dtype=np.float32)
+            per_tree = np.column_stack([tree.predict(features)
+                                        for tree in self.impute_strategy.estimators_])
+        trees = rng.integers(0, per_tree.shape[1], size=(m, per_tree.shape[0]))
+        return per_tree[np.arange(per_tree.shape[0]), trees]
+
+    def _draw_classes(self, features: pd.DataFrame, m: int, rng: np.random.Generator) -> np.ndarray:
+        """Samples a class from the predicted probabilities for every row in every draw,
+        with a frequency-weighted tail category for the "other" class.
+        """
+        cumulative = np.cumsum(self.impute_strategy.predict_proba(features), axis=1)
+        classes = self.impute_strategy.classes_
+        draws = np.empty((m, cumulative.shape[0]), dtype=np.int32)
+        for index in range(m):
+            picks = (rng.random((cumulative.shape[0], 1)) > cumulative).sum(axis=1)
+            draws[index] = classes[np.minimum(picks, len(classes) - 1)]
+        if self._tail_codes is not None:
+            is_other = draws == _OTHER_CODE
+            draws[is_other] = rng.choice(self._tail_codes, np.count_nonzero(is_other),
+                                         p=self._tail_weights)
+        return draws
+
+    def compact(self, max_depth: int = None, quantize_leaves: bool = False) -> Dict:
+        """Replaces the fitted forest with a compact, prediction-only forest.
+
+        Thresholds and leaf values are stored as float32 (or uint8-quantized leaf
+        values) and all sklearn-only bookkeeping is dropped. Trees can optionally
+        be pruned to a maximum depth.
+
+        Parameters
+        ----------
+        max_depth : int (optional)
+            Depth to which the trees are pruned. Defaults to None (no pruning).
+
+        quantize_leaves : bool (optional)
+            Flag to quantize leaf values to uint8. Defaults to False.
+
+        Returns
+        -------
+            Dict : pickled size in bytes and score (RMSE for continuous, accuracy 
+                for categorical columns) before and after compaction. The scores are
+                measured on observed rows held out from a forest with the same 
+                parameters, see `_fit_held_out`, that is compacted the same way, 
+                because the fitted forest has seen all observed rows.
+        """
+        if not hasattr(self, 'impute_strategy'):
+            raise ValueError(f'Strategy for column \'{self.target_column.name}\' must be fitted before compaction.')
+        if isinstance(self.impute_strategy, _CompactForest):
+            raise ValueError(f'Strategy for column \'{self.target_column.name}\' is already compacted.')
+        
+        original = self.impute_strategy
+        compacted = _CompactForest(original, max_depth=max_depth, quantize_leaves=quantize_leaves)
+        
+        held_out_forest, held_out_rows = self._fit_held_out()
+        held_out_compacted = _CompactForest(held_out_forest, max_depth=max_depth, quantize_leaves=quantize_leaves)
+        target_held_out = self._collapsed(self._target_values(held_out_rows))
+        if len(held_out_rows) > 0:
+            features_held_out = self._feature_rows(held_out_rows)
+            score_before = self._score(held_out_forest.predict(features_held_out), target_held_out)
+            score_after = self._score(held_out_compacted.predict(features_held_out), target_held_out)
+        else:
+            score_before, score_after = np.nan, np.nan
+        
+        report = {
+            'metric': 'accuracy' if self.data_type == DataType.CATEGORICAL else 'rmse',
+            'bytes_before': len(pickle.dumps(original)),
+            'bytes_after': len(pickle.dumps(compacted)),
+            'score_before': score_before,
+            'score_after': score_after,
+        }
+        
+        self.impute_strategy = compacted
+        return report
+    
+    def score(self, rows: np.ndarray) -> float:
+        predictions = self._predict(self._feature_rows(rows), np.random.default_rng(0)) if len(rows) > 0 \
+            else np.empty(0)
+        return self._score(predictions, self._target_values(rows))
+    
+    def validation_score(self) -> float:
+        """Score on observed rows held out from training, see `_fit_held_out`.
+        
+        Computed on first call, which fits a second forest that is discarded 
+        afterwards, so that fits that never need the score do not pay for it.
+        """
+        if self._validation_score is None:
+            estimator, held_out_rows = self._fit_held_out()
+            predictions = self._predict(self._feature_rows(held_out_rows), np.random.default_rng(0), estimator) \
+                if len(held_out_rows) > 0 else np.empty(0)
+            self._validation_score = self._score(predictions, self._target_values(held_out_rows))
+        return self._validation_score
+    
+    def release_model(self) -> None:
+        """Discards the fitted forest."""
+        if hasattr(self, 'impute_strategy'):
+            del self.impute_strategy
+    
+    def _target_values(self, rows: np.ndarray) -> np.ndarray:
+        """Target values at the given row positions, codes for categorical targets."""
+        if self.data_type == DataType.CATEGORICAL:
+            return self.target_column.codes[rows]
+        return self.target_column.data.to_numpy()[rows]
+    
+    def _score(self, predictions: np.ndarray, target: np.ndarray) -> float:
+        """Accuracy for categorical and RMSE for continuous targets."""
+        if len(target) == 0:
+            return np.nan
+        if self.data_type == DataType.CATEGORICAL:
+            return float(np.mean(predictions == target))
+        return float(np.sqrt(np.mean((predictions - target) ** 2)))
     
     def impute_column(self) -> pd.Series:
         """Imputes all null values with the Random Forest and unions with non-null values.
@@ -132,25 +400,27 @@ class RandomForestStrategy(_MultivariateStrategy):
             pd.Series: fully imputed data column.
         """
         
-        feature_df_where_null = self._feature_df.iloc[self.target_column.null_indices]
-        if len(feature_df_where_null) == 0:
+        null_rows = self.target_column.null_indices[0]
+        if len(null_rows) == 0:
             predictions_ndarray = np.empty(0)
         else:
-            predictions_ndarray = self.impute_strategy.predict(feature_df_where_null)
+            # Predict in chunks of at most max_buffer_rows rows to bound the feature buffer.
+            chunk_size = len(null_rows) if self.max_buffer_rows is None else max(self.max_buffer_rows, 1)
+            rng = np.random.default_rng(0)
+            predictions_ndarray = np.concatenate([
+                self._predict(self._feature_rows(null_rows[start:start + chunk_size]), rng)
+                for start in range(0, len(null_rows), chunk_size)])
                     
-        # Create data frame from predictions (single column dataframe)
-        predictions_frame = pd.DataFrame(predictions_ndarray, columns=[self.target_column.name])
-        predictions_frame['index'] = self.target_column.null_indices[0]
-        predictions_frame.set_index('index', inplace=True)
-        
-        # Create data frame from existing non-null values (single column dataframe)
-        target_where_not_null = self.target_column.data.iloc[self.target_column.non_null_indices]
-        target_column_where_not_null_frame = pd.DataFrame(target_where_not_null.to_numpy(), 
-                                                          columns=[self.target_column.name])
-        target_column_where_not_null_frame['index'] = self.target_column.non_null_indices[0]
-        target_column_where_not_null_frame.set_index('index', inplace=True)
-        
-        # Union data together and return pd.Series containing fully imputed data.
-        concatenated_frame = pd.concat([target_column_where_not_null_frame, predictions_frame]) \
-            .sort_index(axis=0)
-        return concatenated_frame[self.target_column.name]
\ No newline at end of file
+        # Categorical predictions are codes, fill them in and decode on output.
+        if self.data_type == DataType.CATEGORICAL:
+            codes = self.target_column.codes.copy()
+            codes[null_rows] = predictions_ndarray
+            return pd.Series(pd.Categorical.from_codes(codes, self.target_column.categories),
+                             name=self.target_column.name)
+        
+        values = self.target_column.data.to_numpy(dtype=np.float64, copy=True)
+        values[null_rows] = predictions_ndarray
+        if self.target_column.is_sparse:
+            # Keep sparse columns sparse as features of the next strategies.
+            values = pd.arrays.SparseArray(values, fill_value=self.target_column.data.sparse.fill_value)
+        return pd.Series(values, name=self.target_column.name)
@@ -0,0 +1,98 @@
+import importlib
+from typing import Dict, List, Union
+
+# Entry point group through which other packages register strategies, e.g. in pyproject.toml:
+# [tool.poetry.plugins."imputr.strategies"]
+# "knn" = "my_package.strategies:KNNStrategy"
+ENTRY_POINT_GROUP = 'imputr.strategies'
+
+# Built-in strategies by name, as 'module:class' so that they are only imported when used.
+_BUILTIN_STRATEGIES: Dict[str, str] = {
+    'rf': 'imputr.strategy.randomforest:RandomForestStrategy',
+    'linear': 'imputr.strategy.linear:LinearStrategy',
+    'fill': 'imputr.strategy.grouped:FillStrategy',
+    'group': 'imputr.strategy.grouped:GroupStatisticStrategy',
+    'mean': 'imputr.strategy.mean:MeanStrategy',
+}
+
+_registered: Dict[str, Union[str, type]] = {}
+_entry_points: Dict[str, object] = None
+
+
+def register_strategy(name: str, strategy: Union[str, type]) -> None:
+    """Registers a strategy under a name, for use as `'strategy'` in `predefined_strategies`.
+
+    Parameters
+    ----------
+    name : str
+        The string representation of the strategy.
+
+    strategy : Union[str, type]
+        The strategy class, or its import path as 'module:class' to import it
+        only when it is used. Overrides built-in and entry point strategies.
+    """
+    _registered[name] = strategy
+
+
+def available_strategies() -> List[str]:
+    """Returns the names of all built-in, registered and entry point strategies,
+    without importing them.
+    """
+    return sorted(set(_BUILTIN_STRATEGIES) | set(_registered) | set(_load_entry_points()))
+
+
+def get_strategy(name: str) -> type:
+    """Resolves a strategy class by name, importing its module on first use.
+
+    Registered strategies take precedence over the built-in strategies, which
+    take precedence over entry points of the 'imputr.strategies' group. Entry
+    points are only read for names that are not built in.
+
+    Parameters
+    ----------
+    name : str
+        The string representation of the strategy.
+
+    Returns
+    -------
+        type : the imputation strategy class type.
+    """
+    if name in _registered:
+        strategy = _registered[name]
+        if isinstance(strategy, str):
+            strategy = _registered[name] = _import(strategy)
+        return strategy
+
+    if name in _BUILTIN_STRATEGIES:
+        return _import(_BUILTIN_STRATEGIES[name])
+
+    entry_points = _load_entry_points()
+    if name in entry_points:
+        strategy = _registered[name] = entry_points[name].load()
+        return strategy
+
+    raise ValueError(f'Strategy with \'{name}\' string representation is not defined.')
+
+
+def _import(path: str) -> type:
+    """Imports a class from a 'module:class' path."""
+    module_name, class_name = path.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _load_entry_points() -> Dict[str, object]:
+    """Reads the strategy entry points of the installed packages once, without loading them."""
+    global _entry_points
+    if _entry_points is None:
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            # Python 3.7 uses the backport.
+            from importlib_metadata import entry_points
+        found = entry_points()
+        if hasattr(found, 'select'):
+            found = found.select(group=ENTRY_POINT_GROUP)
+        else:
+            found = found.get(ENTRY_POINT_GROUP, [])
+        _entry_points = {entry_point.name: entry_point for entry_point in found}
+    return _entry_points
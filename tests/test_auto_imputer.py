@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from imputr.domain.types import DataType
 from imputr.imputers.autoimputer import AutoImputer
@@ -190,4 +191,56 @@ def test_predefined_datatype():
     
     atk_col = [x for x in imputer.table.columns if x.name == 'Lv50 Atk'][0]
     
-    assert atk_col.type == DataType.CATEGORICAL
\ No newline at end of file
+    assert atk_col.type == DataType.CATEGORICAL
+
+
+def test_impute_datetime_column():
+    dt_df = df.copy()
+    dt_df['Released'] = pd.to_datetime(['2001-01-01', None, '2003-03-03', None, '2005-05-05'])
+    
+    imputed_df = AutoImputer(dt_df).impute()
+    
+    assert pd.api.types.is_datetime64_any_dtype(imputed_df['Released'].dtype)
+    assert imputed_df['Released'].notnull().all()
+    assert imputed_df['Released'].iloc[0] == pd.Timestamp('2001-01-01')
+
+
+def test_auto_select_strategies():
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=2000)
+    auto_df = pd.DataFrame({'signal': signal,
+                            'predictable': signal * 2 + rng.normal(scale=0.1, size=2000),
+                            'noise': rng.normal(size=2000),
+                            'almost_complete': rng.normal(size=2000)})
+    auto_df.loc[rng.choice(2000, 400, replace=False), ['predictable', 'noise']] = np.nan
+    auto_df.loc[0, 'almost_complete'] = np.nan
+    
+    imputer = AutoImputer(auto_df, auto_select=True)
+    
+    assert isinstance(imputer.strategies['predictable'], RandomForestStrategy)
+    assert isinstance(imputer.strategies['noise'], MeanStrategy)
+    assert isinstance(imputer.strategies['almost_complete'], MeanStrategy)
+    assert imputer.predictability['predictable'] > 0.5
+    assert 'almost_complete' not in imputer.predictability
+    assert imputer.ordered_columns[-1].name == 'predictable'
+    assert imputer.impute().isnull().values.any() == False
+
+
+def test_auto_select_stacks_probe_rows_once(monkeypatch):
+    import imputr.imputers._base as base
+    stacked = []
+    stack_probe_rows = base._stack_probe_rows
+    monkeypatch.setattr(base, '_stack_probe_rows', lambda columns: stacked.append(columns) or stack_probe_rows(columns))
+    rng = np.random.default_rng(0)
+    signal = rng.normal(size=2000)
+    auto_df = pd.DataFrame({'signal': signal,
+                            'predictable': signal * 2 + rng.normal(scale=0.1, size=2000),
+                            'sparse': np.where(rng.random(2000) < 0.8, 0.0, signal)})
+    auto_df.loc[rng.choice(2000, 400, replace=False), ['predictable', 'sparse']] = np.nan
+    auto_df['sparse'] = auto_df['sparse'].astype(pd.SparseDtype(float, 0.0))
+    
+    imputer = AutoImputer(auto_df, auto_select=True)
+    
+    assert len(stacked) == 1
+    assert imputer.predictability['predictable'] > 0.5
+    assert imputer.impute().isnull().values.any() == False
@@ -0,0 +1,97 @@
+"""
+Tests for execution backends and partitioned imputation.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from imputr import AutoImputer, MeanImputer
+from imputr.backend import InProcessBackend, ProcessPoolBackend
+
+df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+df.loc[::7, 'Lv50 Atk'] = np.nan
+df.loc[::5, 'Stage'] = np.nan
+
+partitions = np.array_split(df, 3)
+
+
+def test_transform_before_fit_raises():
+    imputer = MeanImputer(df)
+    
+    with pytest.raises(ValueError):
+        imputer.transform(df)
+
+
+def test_transform_matches_impute_for_mean_imputer():
+    imputer = MeanImputer(df)
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.equals(imputer.transform(df))
+    assert imputed_df['Number'].equals(df['Number'])
+
+
+def test_from_partitions_in_process():
+    imputer = AutoImputer.from_partitions(partitions, sample_fraction=0.5)
+    
+    assert imputer.is_fitted
+    assert len(imputer.table.data) == sum(round(len(p) * 0.5) for p in partitions)
+    
+    imputed_partitions = imputer.transform_partitions(partitions, InProcessBackend())
+    
+    assert len(imputed_partitions) == 3
+    for partition, imputed_partition in zip(partitions, imputed_partitions):
+        assert imputed_partition.index.equals(partition.index)
+        assert imputed_partition.isnull().values.any() == False
+        assert set(imputed_partition['Stage']) <= set(df['Stage'].dropna())
+
+
+def test_transform_partitions_process_pool():
+    imputer = AutoImputer.from_partitions(partitions, sample_fraction=0.5)
+    expected = imputer.transform_partitions(partitions)
+    
+    with ProcessPoolBackend(n_workers=2) as backend:
+        imputed_partitions = imputer.transform_partitions(partitions, backend)
+    
+    for expected_partition, imputed_partition in zip(expected, imputed_partitions):
+        assert imputed_partition.equals(expected_partition)
+
+
+class _CountingPickles:
+    pickles = 0
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __getstate__(self):
+        type(self).pickles += 1
+        return self.__dict__
+
+
+def _add_broadcast(partition, obj):
+    return partition + obj.value
+
+
+def test_process_pool_ships_broadcasts_once_per_worker():
+    with ProcessPoolBackend(n_workers=2) as backend:
+        obj = backend.broadcast(_CountingPickles(10))
+        
+        assert backend.map(_add_broadcast, range(8), obj=obj) == list(range(10, 18))
+        assert _CountingPickles.pickles <= 2
+        
+        other = backend.broadcast(_CountingPickles(20))
+        _CountingPickles.pickles = 0
+        
+        # The restarted pool holds only the broadcast of its map.
+        assert backend.map(_add_broadcast, range(3), obj=other) == [20, 21, 22]
+        assert _CountingPickles.pickles <= 2
+        assert backend._executor_keys == {other.key}
+        assert backend.map(_add_broadcast, range(3), obj=obj) == [10, 11, 12]
+
+
+def test_from_partitions_samples_each_partition_with_its_own_seed():
+    same_partitions = [df.reset_index(drop=True)] * 3
+    imputer = MeanImputer.from_partitions(same_partitions, sample_fraction=0.1)
+    samples = np.array_split(imputer.table.data, 3)
+    
+    assert not samples[0].reset_index(drop=True).equals(samples[1].reset_index(drop=True))
+    assert imputer.table.data.equals(MeanImputer.from_partitions(same_partitions, sample_fraction=0.1).table.data)
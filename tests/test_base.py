@@ -1,5 +1,9 @@
+import gc
+import tracemalloc
 import pandas as pd
-from imputr import AutoImputer
+import pytest
+import scipy.sparse as sp
+from imputr import AutoImputer, MeanImputer
 from imputr.strategy import MeanStrategy
 import numpy as np
 
@@ -51,4 +55,309 @@ def test_determine_order_univariate_and_multivariate_and_predefined_order():
     assert order[0].name == 'Attribute'
     assert order[1].name == 'Type'
     assert order[2].name == 'Number'
-    
\ No newline at end of file
+    
+
+def test_release_buffers_after_impute():
+    imputer = AutoImputer(df, include_non_missing=True)
+    imputer.impute()
+    
+    for strategy in imputer.strategies.values():
+        assert strategy._feature_df is None
+        assert hasattr(strategy, 'impute_strategy') is True
+        
+def test_discard_fitted_models():
+    imputer = AutoImputer(df, include_non_missing=True, keep_fitted_models=False)
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    for strategy in imputer.strategies.values():
+        assert hasattr(strategy, 'impute_strategy') is False
+    
+def test_memory_budget_limits_buffer_rows():
+    # 8 feature columns of 8 bytes each, so 128 bytes allow 2 buffer rows.
+    imputer = AutoImputer(df, include_non_missing=True, memory_budget=128)
+    
+    for strategy in imputer.strategies.values():
+        assert strategy.max_buffer_rows == 2
+    
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    assert (imputer.fit_report['training_fraction'] < 1).all()
+    
+def test_append_imputes_new_rows_and_refits_drifted_columns():
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Lv50 Def'] = np.nan
+    
+    imputer = MeanImputer(full_df.iloc[:200])
+    
+    with pytest.raises(ValueError):
+        imputer.append(full_df.iloc[200:])
+    
+    imputer.fit()
+    new_rows = full_df.iloc[200:].copy()
+    new_rows['Lv50 Atk'] = new_rows['Lv50 Atk'] * 10
+    imputed_rows = imputer.append(new_rows, drift_threshold=0.5)
+    
+    assert imputer.refitted_columns == ['Lv50 Atk']
+    assert imputed_rows.index.equals(new_rows.index)
+    assert imputed_rows.isnull().values.any() == False
+    assert len(imputer.table.data) == len(full_df)
+    
+    atk_average = next(filter(lambda x: x.name == 'Lv50 Atk', imputer.table.columns)).average
+    assert atk_average == pytest.approx(pd.concat([full_df.iloc[:200]['Lv50 Atk'], 
+                                                   new_rows['Lv50 Atk']]).mean())
+    assert (imputed_rows.loc[new_rows['Lv50 Atk'].isnull(), 'Lv50 Atk'] == atk_average).all()
+    
+def test_append_compares_model_error_out_of_sample():
+    rng = np.random.default_rng(0)
+    synthetic_df = pd.DataFrame(rng.normal(size=(3000, 3)), columns=['a', 'b', 'c'])
+    synthetic_df['y'] = synthetic_df['a'] + synthetic_df['b'] + 0.5 * rng.normal(size=3000)
+    synthetic_df.loc[rng.random(3000) < 0.2, 'y'] = np.nan
+    # Fully grown trees fit their training rows much better than new rows.
+    params = {'min_samples_leaf': 1, 'min_sample_split': 2, 'min_weight_fraction_leaf': 0.0,
+              'max_leaf_nodes': None, 'max_depth': None, 'max_features': 1.0}
+    
+    imputer = AutoImputer(synthetic_df.iloc[:2000], predefined_strategies={'y': {'strategy': 'rf', 'params': params}})
+    imputer.fit()
+    imputer.append(synthetic_df.iloc[2000:])
+    
+    assert imputer.strategies['y'].validation_score() > 0.5
+    assert imputer.refitted_columns == []
+    
+def test_append_twice():
+    rows = pd.DataFrame({'x': [1.0, 2, None, 4, 5, 6] * 50, 'y': [1.0, None, 3, 4, 5, 6] * 50})
+    imputer = AutoImputer(rows)
+    imputer.fit()
+    
+    imputer.append(rows.iloc[:10])
+    imputed_rows = imputer.append(rows.iloc[:10])
+    
+    assert len(imputer.table) == 320
+    assert imputed_rows.isnull().values.any() == False
+    
+def test_append_rows_with_overlapping_index():
+    rng = np.random.default_rng(0)
+    rows = pd.DataFrame({'x': rng.normal(size=250), 'y': rng.normal(size=250), 
+                         'c': rng.choice(['a', 'b'], 250), 'd': pd.date_range('2020', periods=250)})
+    rows.loc[::7, 'x'] = np.nan
+    rows.loc[::9, 'y'] = np.nan
+    rows.loc[::5, 'c'] = np.nan
+    
+    linear = {'x': {'strategy': 'linear'}, 'y': {'strategy': 'linear'}}
+    for frame, strategies in ((rows, None), (rows.drop(columns='d'), linear)):
+        imputer = AutoImputer(frame.iloc[:200], predefined_strategies=strategies)
+        imputer.fit()
+        new_rows = frame.iloc[200:].reset_index(drop=True)
+        # Refits every column on the rows with duplicate labels.
+        imputed_rows = imputer.append(new_rows, drift_threshold=-1)
+        
+        assert sorted(imputer.refitted_columns) == ['c', 'x', 'y']
+        assert imputed_rows.index.equals(new_rows.index)
+        assert imputed_rows.isnull().values.any() == False
+    
+def test_time_budget_degrades_to_mean_strategy():
+    imputer = AutoImputer(df, time_budget=0)
+    imputed_df = imputer.impute()
+    
+    assert sorted(imputer.degraded_columns) == sorted(imputer.strategies.keys())
+    for strategy in imputer.strategies.values():
+        assert isinstance(strategy, MeanStrategy)
+    assert imputer.fit_report['degraded'].all()
+    assert imputed_df.isnull().values.any() == False
+    
+def test_time_budget_keeps_models_that_fit():
+    imputer = AutoImputer(df, time_budget=3600)
+    imputer.fit()
+    
+    assert imputer.degraded_columns == []
+    assert list(imputer.fit_report.index) == [col.name for col in imputer.ordered_columns]
+    assert (imputer.fit_report['strategy'] == 'RandomForestStrategy').all()
+    assert (imputer.fit_report['seconds'] >= 0).all()
+    assert (imputer.fit_report['training_fraction'] == 1).all()
+    
+def test_fit_reads_features_from_memory_mapped_matrix(tmp_path):
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Type'] = np.nan
+    
+    imputer = AutoImputer(full_df, scratch_dir=str(tmp_path), memory_budget=4096)
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    assert list(tmp_path.iterdir()) == []
+    for strategy in imputer.strategies.values():
+        assert strategy.feature_matrix is None
+    
+def test_fit_reads_features_from_memory_mapped_matrix_without_memory_budget(tmp_path):
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    
+    imputer = AutoImputer(full_df, scratch_dir=str(tmp_path))
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    assert list(tmp_path.iterdir()) == []
+    
+def test_impute_sparse_matrix():
+    matrix = sp.random(300, 20, density=0.1, format='csr', random_state=0)
+    matrix.data[::5] = np.nan
+    imputer = AutoImputer(matrix)
+    
+    strategy = imputer.strategies[0]
+    assert sp.issparse(strategy._create_df_from_num_encoded_feature_columns(strategy.feature_columns))
+    
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.shape == (300, 20)
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in imputed_df.dtypes)
+    assert imputed_df.isnull().values.any() == False
+    observed = ~np.isnan(matrix.toarray())
+    assert np.array_equal(imputed_df.sparse.to_dense().to_numpy()[observed], matrix.toarray()[observed])
+    
+def test_sparse_feature_matrix_is_built_once_per_fit(monkeypatch):
+    matrix = sp.random(300, 20, density=0.1, format='csr', random_state=0)
+    matrix.data[::5] = np.nan
+    # 19 feature columns of 8 bytes each, so the budget allows chunks of 10 rows.
+    imputer = AutoImputer(matrix, memory_budget=19 * 8 * 10)
+    strategy = imputer.strategies[0]
+    
+    builds = []
+    build = strategy._create_sparse_matrix_from_num_encoded_feature_columns
+    monkeypatch.setattr(strategy, '_create_sparse_matrix_from_num_encoded_feature_columns',
+                        lambda columns: builds.append(columns) or build(columns))
+    strategy.fit()
+    strategy.impute_column()
+    
+    assert len(builds) == 1
+    
+def test_impute_multiple_draws_from_one_fit():
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Type'] = np.nan
+    
+    params = {'min_samples_leaf': 1, 'min_weight_fraction_leaf': 0.0, 'min_sample_split': 2}
+    imputer = AutoImputer(full_df, predefined_strategies={'Lv50 Atk': {'strategy': 'rf', 'params': params}})
+    datasets = list(imputer.impute_multiple(m=4))
+    
+    assert len(datasets) == 4
+    missing = full_df['Lv50 Atk'].isnull()
+    for dataset in datasets:
+        assert dataset.isnull().values.any() == False
+        assert dataset.index.equals(full_df.index)
+        assert dataset.loc[~missing, 'Lv50 Atk'].equals(full_df.loc[~missing, 'Lv50 Atk'])
+        assert set(dataset['Type']) <= set(full_df['Type'].dropna())
+    assert not datasets[0]['Lv50 Atk'].equals(datasets[1]['Lv50 Atk'])
+    
+    stacked = AutoImputer(full_df).impute_multiple(m=3, stacked=True)
+    assert stacked.shape == (3,) + full_df.shape
+    
+def test_impute_multiple_needs_fitted_models():
+    with pytest.raises(ValueError):
+        AutoImputer(df, keep_fitted_models=False).impute_multiple(m=2)
+    
+def test_impute_inplace_writes_into_given_frame():
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Type'] = np.nan
+    strategies = {'Lv50 Atk': {'strategy': 'mean'}, 'Type': {'strategy': 'mean'}}
+    expected = AutoImputer(full_df.copy(), predefined_strategies=strategies).impute()
+    
+    inplace_df = full_df.copy()
+    atk_values = inplace_df['Lv50 Atk'].to_numpy()
+    imputer = AutoImputer(inplace_df, predefined_strategies=strategies)
+    
+    assert imputer.impute(inplace=True) is None
+    assert inplace_df.equals(expected)
+    assert np.shares_memory(atk_values, inplace_df['Lv50 Atk'].to_numpy())
+    assert len(imputer.table.column('Lv50 Atk').null_indices[0]) == full_df['Lv50 Atk'].isnull().sum()
+    assert np.shares_memory(atk_values, imputer.table.column('Lv50 Atk').imputed_data.to_numpy())
+    
+def test_impute_inplace_writes_each_column_when_it_is_imputed():
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Lv50 Def'] = np.nan
+    full_df.loc[::3, 'Type'] = np.nan
+    # Linear strategies are deterministic, later columns regress on the columns written before them.
+    strategies = {'Lv50 Atk': {'strategy': 'linear'}, 'Lv50 Def': {'strategy': 'linear'}, 
+                  'Type': {'strategy': 'mean'}}
+    numeric_df = full_df.select_dtypes('number').assign(Type=full_df['Type'])
+    expected = AutoImputer(numeric_df.copy(), predefined_strategies=strategies).impute()
+    
+    inplace_df = numeric_df.copy()
+    AutoImputer(inplace_df, predefined_strategies=strategies).impute(inplace=True)
+    
+    pd.testing.assert_frame_equal(inplace_df, expected, check_dtype=False)
+    
+def test_impute_inplace_retains_only_null_positions():
+    rng = np.random.default_rng(0)
+    large_df = pd.DataFrame(rng.normal(size=(500000, 4)), columns=['a', 'b', 'c', 'd'])
+    large_df = large_df.mask(rng.random(large_df.shape) < 0.01)
+    imputer = MeanImputer(large_df)
+    
+    tracemalloc.start()
+    try:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        imputer.impute(inplace=True)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    
+    assert large_df.isnull().values.any() == False
+    # The null positions of 1% missing cells, no table-sized positions or labels.
+    assert retained < 0.05 * large_df.memory_usage().sum()
+    
+def test_impute_inplace_needs_dataframe():
+    with pytest.raises(ValueError):
+        AutoImputer(sp.random(20, 3, density=0.5, format='csr', random_state=0)).impute(inplace=True)
+    
+def test_impute_delta_returns_only_imputed_cells():
+    full_df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+    full_df.loc[::7, 'Lv50 Atk'] = np.nan
+    full_df.loc[::5, 'Type'] = np.nan
+    full_df.index = full_df.index + 1000
+    imputer = AutoImputer(full_df)
+    
+    delta = imputer.impute(delta=True)
+    imputed_df = imputer._create_df_from_imputed_columns(imputer.table)
+    
+    assert list(delta.columns) == ['row', 'index', 'column', 'value']
+    assert len(delta) == full_df.isnull().values.sum()
+    for _, cell in delta.iterrows():
+        assert pd.isnull(full_df.iloc[cell['row']][cell['column']])
+        assert imputed_df.loc[cell['index'], cell['column']] == cell['value']
+    
+    partition_delta = imputer.transform(full_df.iloc[:10], delta=True)
+    assert sorted(partition_delta['row']) == [0, 0, 5, 7]
+    
+def test_split_cpu_budget():
+    from imputr.imputers._threads import _split_cpu_budget
+    
+    # Few rows per column: all CPUs construct or fit columns side by side.
+    assert _split_cpu_budget(8, task_count=100, row_count=1000) == (8, 1)
+    # Long columns: the estimators get the threads their rows keep busy.
+    assert _split_cpu_budget(8, task_count=100, row_count=40000) == (2, 4)
+    assert _split_cpu_budget(8, task_count=1, row_count=10 ** 6) == (1, 8)
+    assert _split_cpu_budget(8, task_count=3, row_count=1000) == (3, 1)
+    with pytest.raises(ValueError):
+        _split_cpu_budget(0, task_count=1, row_count=1)
+    
+def test_cpu_budget_sets_estimator_threads():
+    # Strategies fit one at a time, the whole budget goes to the forests, also for few rows.
+    imputer = AutoImputer(df, cpu_budget=2)
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    for strategy in imputer.strategies.values():
+        assert strategy.n_jobs == 2
+        assert strategy.impute_strategy.n_jobs == 2
+    assert AutoImputer(df).fit().strategies[imputer.ordered_columns[0].name].impute_strategy.n_jobs is None
+    
+def test_cpu_budget_constructs_table_with_whole_budget():
+    long_df = pd.DataFrame({'cont_col': np.arange(40000, dtype=float), 'cat_col': ['a', 'b'] * 20000})
+    
+    assert MeanImputer(long_df, cpu_budget=4).n_jobs == 4
+    assert MeanImputer(long_df, n_jobs=1, cpu_budget=4).n_jobs == 1
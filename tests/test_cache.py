@@ -0,0 +1,76 @@
+"""
+Tests for the fitted strategy cache.
+"""
+
+import os
+import pandas as pd
+import numpy as np
+from imputr import AutoImputer
+from imputr.strategy import StrategyCache
+
+df = pd.read_csv('datasets/unittestsets/DigiDB_digimonlist_small.csv')
+
+
+def test_cache_hit_loads_fitted_model(tmp_path):
+    cache = StrategyCache(str(tmp_path))
+    
+    imputer = AutoImputer(df, cache=cache)
+    imputed_df = imputer.impute()
+    
+    assert len(os.listdir(tmp_path)) == 3
+    
+    # Forests are not seeded, so equal output means the models were loaded from the cache.
+    cached_df = AutoImputer(df, cache=cache).impute()
+    
+    assert cached_df.equals(imputed_df)
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_fingerprint_changes_with_data_and_params(tmp_path):
+    cache = StrategyCache(str(tmp_path))
+    
+    strategy = AutoImputer(df).strategies['Lv50 Atk']
+    params_strategy = AutoImputer(df, predefined_strategies={
+        'Lv50 Atk': {'strategy': 'rf', 'params': {'n_estimators': 8}}}).strategies['Lv50 Atk']
+    
+    changed_df = df.copy()
+    changed_df.loc[0, 'Lv50 Def'] = 1
+    data_strategy = AutoImputer(changed_df).strategies['Lv50 Atk']
+    
+    fingerprint = cache.fingerprint(strategy)
+    assert fingerprint == cache.fingerprint(AutoImputer(df).strategies['Lv50 Atk'])
+    assert fingerprint != cache.fingerprint(params_strategy)
+    assert fingerprint != cache.fingerprint(data_strategy)
+
+
+def test_lru_eviction(tmp_path):
+    cache = StrategyCache(str(tmp_path), max_bytes=2500)
+    payload = np.zeros(100)
+    
+    cache.put('a', payload)
+    cache.put('b', payload)
+    os.utime(os.path.join(tmp_path, 'a.pkl'), ns=(0, 0))
+    os.utime(os.path.join(tmp_path, 'b.pkl'), ns=(1, 1))
+    cache.get('a')
+    cache.put('c', payload)
+    
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.size <= 2500
+
+
+def test_fingerprint_hashes_each_feature_column_once(tmp_path, monkeypatch):
+    cache = StrategyCache(str(tmp_path))
+    strategies = list(AutoImputer(df).strategies.values())
+    expected = [cache.fingerprint(strategy) for strategy in strategies]
+    
+    hashed = []
+    hash_pandas_object = pd.util.hash_pandas_object
+    monkeypatch.setattr(pd.util, 'hash_pandas_object', 
+                        lambda obj, **kwargs: hashed.append(obj) or hash_pandas_object(obj, **kwargs))
+    column_digests = {}
+    
+    assert [cache.fingerprint(strategy, column_digests) for strategy in strategies] == expected
+    # One hash per target column and one per feature column.
+    assert len(hashed) == len(strategies) + len(column_digests)
@@ -0,0 +1,71 @@
+"""
+Tests for the command-line entry point.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from imputr.cli import main
+
+df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+
+
+def _write_inputs(directory, count: int = 3) -> None:
+    directory.mkdir()
+    for index in range(count):
+        data = df.copy()
+        data.loc[index::7, 'Lv50 Atk'] = np.nan
+        data.loc[index::5, 'Type'] = np.nan
+        data.to_csv(directory / f'file_{index}.csv', index=False)
+
+@pytest.mark.parametrize('workers', ['1', '2'])
+def test_impute_files(tmp_path, workers):
+    _write_inputs(tmp_path / 'inputs')
+    config = tmp_path / 'config.json'
+    config.write_text(json.dumps({'predefined_strategies': {'Lv50 Atk': {'strategy': 'rf'}}}))
+    
+    exit_code = main([str(tmp_path / 'inputs' / '*.csv'), '--output-dir', str(tmp_path / 'outputs'),
+                      '--config', str(config), '--strategies', '{"Type": {"strategy": "mean"}}',
+                      '--suffix', '_imputed', '--workers', workers, '--report', str(tmp_path / 'report.csv'),
+                      '--quiet'])
+    
+    assert exit_code == 0
+    for index in range(3):
+        imputed = pd.read_csv(tmp_path / 'outputs' / f'file_{index}_imputed.csv')
+        assert imputed.shape == df.shape
+        assert imputed.isnull().values.any() == False
+    report = pd.read_csv(tmp_path / 'report.csv')
+    assert (report['status'] == 'imputed').all()
+    assert (report['impute_seconds'] >= 0).all()
+    
+def test_failed_files_are_reported(tmp_path):
+    _write_inputs(tmp_path / 'inputs', count=1)
+    (tmp_path / 'inputs' / 'empty.csv').write_text('')
+    
+    exit_code = main([str(tmp_path / 'inputs' / '*.csv'), '-o', str(tmp_path / 'outputs'), '-j', '1',
+                      '--report', str(tmp_path / 'report.csv'), '-q'])
+    
+    report = pd.read_csv(tmp_path / 'report.csv').set_index('file')
+    assert exit_code == 1
+    assert report.loc[str(tmp_path / 'inputs' / 'empty.csv'), 'status'] == 'failed'
+    assert report.loc[str(tmp_path / 'inputs' / 'file_0.csv'), 'status'] == 'imputed'
+    
+def test_no_matching_files(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / '*.csv'), '-o', str(tmp_path / 'outputs')])
+
+def test_impute_parquet_files(tmp_path):
+    pytest.importorskip('pyarrow')
+    (tmp_path / 'inputs').mkdir()
+    data = df.copy()
+    data.loc[::7, 'Lv50 Atk'] = np.nan
+    data.to_parquet(tmp_path / 'inputs' / 'file.parquet', index=False)
+    
+    exit_code = main([str(tmp_path / 'inputs' / '*.parquet'), '-o', str(tmp_path / 'outputs'), 
+                      '-j', '1', '-q'])
+    
+    imputed = pd.read_parquet(tmp_path / 'outputs' / 'file.parquet')
+    assert exit_code == 0
+    assert imputed.shape == df.shape
+    assert imputed.isnull().values.any() == False
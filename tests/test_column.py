@@ -7,6 +7,7 @@ from imputr.domain import DataType, Column
 import pandas as pd
 from numpy.testing import assert_array_almost_equal
 import numpy as np
+from pandas.api.types import is_numeric_dtype
 
 def test_ctor_cont():
     int_series = pd.Series([1,2,None,3])
@@ -74,4 +75,155 @@ def test_ctor_predefined_datatype_str():
     
     cat_col = Column(int_series, 'cat')
     
-    assert cat_col.type == DataType.CATEGORICAL
\ No newline at end of file
+    assert cat_col.type == DataType.CATEGORICAL
+
+
+def test_append_updates_statistics():
+    cont_col = Column(pd.Series([1.0, 2.0, None, 3.0], name='cont_col'))
+    cont_col.append(pd.Series([None, 6.0], index=[4, 5], name='cont_col'))
+    
+    expected = pd.Series([1.0, 2.0, None, 3.0, None, 6.0])
+    assert cont_col.missing_value_count == 2
+    assert cont_col.unique_value_count == 4
+    assert cont_col.average == pytest.approx(expected.mean())
+    assert cont_col.statistics['std'] == pytest.approx(expected.std(ddof=0))
+    assert cont_col.statistics['missing_fraction'] == pytest.approx(2 / 6)
+    
+    cat_col = Column(pd.Series(['a', 'a', 'b', None], name='cat_col'))
+    cat_col.append(pd.Series(['b', 'b', 'c'], index=[4, 5, 6], name='cat_col'))
+    
+    assert cat_col.data.size == 7
+    assert cat_col.missing_value_count == 1
+    assert cat_col.unique_value_count == 3
+    assert cat_col.average == 'b'
+    assert cat_col.statistics['mode_fraction'] == pytest.approx(3 / 6)
+
+
+def test_append_grows_buffers_in_place():
+    cont_col = Column(pd.Series([1.0, None], name='cont_col'))
+    cat_col = Column(pd.Series(['a', None], name='cat_col'))
+    for start in range(2, 12, 2):
+        cont_col.append(pd.Series([float(start), None], index=range(start, start + 2), name='cont_col'))
+        cat_col.append(pd.Series(['b', 'a'], index=[start, start + 1], name='cat_col'))
+        if start == 8:
+            # The buffers double their capacity, the next append fits in it.
+            cont_buffer, codes_buffer = cont_col.data.to_numpy(), cat_col.codes
+    
+    assert np.shares_memory(cont_col.data.to_numpy(), cont_buffer)
+    assert np.shares_memory(cat_col.codes, codes_buffer)
+    assert isinstance(cont_col.data.index, pd.RangeIndex)
+    pd.testing.assert_series_equal(cont_col.data, pd.Series([1.0, None] + [x for start in range(2, 12, 2)
+                                                                      for x in (start, None)],
+                                                            name='cont_col'))
+    assert list(cat_col.data) == ['a', None] + ['b', 'a'] * 5
+    assert cat_col.missing_value_count == 1
+    assert cat_col.average == 'a'
+    assert cat_col.statistics['mode_fraction'] == pytest.approx(6 / 11)
+
+
+def test_sampled_inference():
+    str_series = pd.Series(['a'] * 600 + ['b'] * 300 + [None] * 100, name='str_col')
+    
+    col = Column(str_series, sample_size=100)
+    
+    assert col.type == DataType.CATEGORICAL
+    assert col.is_estimated
+    assert col.missing_value_count == 100
+    assert col.average == 'a'
+    assert col._unique_value_count is None
+    assert col.unique_value_count == 2
+    
+    col.compute_exact_statistics()
+    
+    assert col.is_estimated == False
+    assert col.statistics['mode_fraction'] == pytest.approx(600 / 900)
+
+
+def test_sampled_inference_numeric_objects():
+    obj_series = pd.Series([1, 2.5, None, 4] * 100, dtype=object, name='obj_col')
+    
+    col = Column(obj_series, sample_size=50)
+    
+    assert col.type == DataType.CONTINUOUS
+    assert is_numeric_dtype(col.data.dtype)
+    assert col.average == pytest.approx(2.5)
+    assert Column(obj_series).type == DataType.CATEGORICAL
+
+
+def test_sampled_inference_keeps_values_outside_sample():
+    obj_series = pd.Series([1, 2, 3] * 1000 + ['unknown'] * 3, dtype=object, name='obj_col')
+    
+    col = Column(obj_series, sample_size=50)
+    
+    assert col.type == DataType.CATEGORICAL
+    assert col.missing_value_count == 0
+    assert list(col.data.iloc[-3:]) == ['unknown'] * 3
+    assert col.statistics['mode_fraction'] == pytest.approx(1000 / 3003)
+    with pytest.raises(ValueError):
+        Column(obj_series, 'cont')
+
+
+def test_categorical_codes():
+    cat_col = Column(pd.Series([2.0, 1.0, None, 2.0], name='cat_col'), 'cat')
+    
+    assert list(cat_col.categories) == [1.0, 2.0]
+    np.testing.assert_array_equal(cat_col.codes, [1, 0, -1, 1])
+    np.testing.assert_array_equal(cat_col.null_indices[0], [2])
+    assert cat_col.average == 2.0
+    # Imputed data is decoded to the original labels instead of strings.
+    assert list(cat_col.imputed_data) == [2.0, 1.0, 2.0, 2.0]
+
+
+def test_inherit_encoding_maps_unseen_labels():
+    fitted_col = Column(pd.Series(['a', 'b', 'b'], name='cat_col'))
+    partition_col = Column(pd.Series(['c', None, 'a'], name='cat_col'))
+    
+    partition_col.inherit_encoding(fitted_col)
+    
+    assert list(partition_col.categories) == ['a', 'b', 'c']
+    np.testing.assert_array_equal(partition_col.codes, [2, -1, 0])
+    assert list(partition_col.imputed_data) == ['c', 'b', 'a']
+
+
+def test_datetime_column():
+    timestamps = pd.Series(pd.to_datetime(['2020-01-01', None, '2020-01-03']), name='dt_col')
+    
+    dt_col = Column(timestamps)
+    
+    assert dt_col.type == DataType.DATETIME
+    assert dt_col.missing_value_count == 1
+    assert is_numeric_dtype(dt_col.data.dtype)
+    assert dt_col.average == pytest.approx(pd.Timestamp('2020-01-02').value)
+    assert list(dt_col.imputed_data) == list(pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03']))
+
+
+def test_datetime_inferred_from_strings():
+    strings = pd.Series(['2020-01-01 10:00', None, '2020-03-01 12:30'] * 100, name='dt_col')
+    
+    assert Column(strings).type == DataType.DATETIME
+    assert Column(strings, sample_size=50).type == DataType.DATETIME
+    assert Column(pd.Series(['May', 'June'], name='month')).type == DataType.CATEGORICAL
+    assert Column(pd.Series(['1', '2'], name='digits')).type == DataType.CATEGORICAL
+
+
+def test_datetime_inference_keeps_values_outside_probe():
+    strings = pd.Series(['2020-01-01'] * 300 + ['not a date'] + [None], name='dt_col')
+    
+    col = Column(strings)
+    
+    assert col.type == DataType.CATEGORICAL
+    assert col.missing_value_count == 1
+    assert 'not a date' in list(col.categories)
+    with pytest.raises(ValueError):
+        Column(strings, 'datetime')
+
+
+def test_sparse_positions_derived_from_sparse_index():
+    dense = pd.Series([0.0, 1.0, np.nan, 0.0, np.nan, 2.0], name='sparse_col')
+
+    for fill_value in [0.0, np.nan]:
+        col = Column(dense.astype(pd.SparseDtype(float, fill_value)))
+
+        np.testing.assert_array_equal(col.null_indices[0], [2, 4])
+        np.testing.assert_array_equal(col.non_null_indices[0], [0, 1, 3, 5])
+        assert col._null_indices is None
@@ -0,0 +1,93 @@
+"""
+Tests for compaction of fitted strategies.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from imputr import AutoImputer
+from imputr.domain import Column
+from imputr.strategy import RandomForestStrategy
+from imputr.strategy._compact import _CompactForest
+
+df = pd.read_csv('datasets/unittestsets/DigiDB_digimonlist_small.csv')
+
+columns = [Column(df.iloc[:, index]) for index, item in enumerate(df.columns)]
+
+target_column_lv50atk = next(filter(lambda x: x.name == 'Lv50 Atk', columns))
+feature_columns_lv50atk = list(filter(lambda x: x.name != target_column_lv50atk.name, columns))
+
+rf_params = {'min_sample_split': 2, 'min_samples_leaf': 1, 'min_weight_fraction_leaf': 0.0}
+
+
+def test_compact_forest_same_predictions():
+    strategy = RandomForestStrategy(target_column_lv50atk, feature_columns_lv50atk, **rf_params)
+    strategy.fit()
+    features = strategy._feature_df
+    expected = strategy.impute_strategy.predict(features)
+    
+    compacted = _CompactForest(strategy.impute_strategy)
+    
+    assert compacted.n_estimators == 64
+    assert compacted.threshold.dtype == np.float32
+    assert compacted.values.dtype == np.float32
+    np.testing.assert_allclose(compacted.predict(features), expected, rtol=1e-5)
+
+
+def test_compact_forest_pruning_and_quantization():
+    strategy = RandomForestStrategy(target_column_lv50atk, feature_columns_lv50atk, **rf_params)
+    strategy.fit()
+    
+    full = _CompactForest(strategy.impute_strategy)
+    pruned = _CompactForest(strategy.impute_strategy, max_depth=1, quantize_leaves=True)
+    
+    assert pruned.node_count <= 3 * pruned.n_estimators
+    assert pruned.node_count <= full.node_count
+    assert pruned.values.dtype == np.uint8
+    assert pruned.predict(strategy._feature_df).shape == (5,)
+
+
+def test_strategy_compact_twice_raises():
+    strategy = RandomForestStrategy(target_column_lv50atk, feature_columns_lv50atk)
+    
+    with pytest.raises(ValueError):
+        strategy.compact()
+    
+    strategy.fit()
+    strategy.compact()
+    
+    with pytest.raises(ValueError):
+        strategy.compact()
+
+
+def test_imputer_compact_report():
+    imputer = AutoImputer(df, include_non_missing=True, 
+                          predefined_strategies={'Number': {'strategy': 'mean'}})
+    imputer.impute()
+    
+    report = imputer.compact(quantize_leaves=True)
+    
+    assert 'Number' not in report.index
+    assert len(report) == 8
+    assert (report['bytes_after'] < report['bytes_before']).all()
+    assert report.loc['Attribute', 'metric'] == 'accuracy'
+    assert report.loc['Lv50 Atk', 'metric'] == 'rmse'
+    
+    imputed_df = imputer.impute()
+    assert imputed_df.isnull().values.any() == False
+
+
+def test_compact_report_scores_held_out_rows():
+    rng = np.random.default_rng(0)
+    feature = Column(pd.Series(rng.normal(size=1000), name='feature'))
+    values = pd.Series(feature.data + rng.normal(size=1000), name='target')
+    values[::10] = np.nan
+    strategy = RandomForestStrategy(Column(values), [feature], max_depth=None, max_leaf_nodes=None, **rf_params)
+    strategy.fit()
+    training_rmse = strategy.score(strategy.target_column.non_null_indices[0])
+    
+    report = strategy.compact()
+    
+    # Noise with a standard deviation of 1 cannot be predicted on rows the forest has not seen.
+    assert report['score_before'] > 0.9 > training_rmse
+    assert report['score_after'] == pytest.approx(report['score_before'], rel=0.05)
@@ -0,0 +1,70 @@
+"""
+Tests for the evaluation harness.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imputr.backend import ProcessPoolBackend
+from imputr.evaluation import evaluate, mask_mcar, mask_mar, mask_pattern
+
+df = pd.read_csv('datasets/DigiDB_digimonlist.csv')
+
+
+@pytest.mark.parametrize('mask_func', [mask_mcar, mask_mar])
+def test_masking_hides_observed_cells(mask_func):
+    masked, mask = mask_func(df, fraction=0.2, columns=['Lv50 Atk', 'Type'])
+    
+    assert mask.sum().to_dict() == {name: (round(0.2 * len(df)) if name in ('Lv50 Atk', 'Type') else 0) 
+                                    for name in df.columns}
+    assert masked[mask].isnull().all().all()
+    assert masked[~mask].equals(df[~mask])
+    
+def test_pattern_masking_reuses_missingness_patterns():
+    data = df.copy()
+    data.loc[::10, ['Lv50 Atk', 'Lv50 Def']] = np.nan
+    
+    masked, mask = mask_pattern(data, fraction=0.2)
+    
+    assert mask.any(axis=None)
+    assert not mask.drop(columns=['Lv50 Atk', 'Lv50 Def']).any(axis=None)
+    
+def test_evaluate_candidates():
+    candidates = {
+        'mean': {'imputer': 'mean'},
+        'rf': {'predefined_strategies': {'Lv50 Atk': {'strategy': 'rf', 'params': {'n_estimators': 8}}}}
+    }
+    
+    report = evaluate(df[['Stage', 'Type', 'Lv 50 HP', 'Lv50 Atk']], candidates, fraction=0.1)
+    
+    assert set(report.index.get_level_values('candidate')) == {'mean', 'rf'}
+    assert report.loc[('rf', 'Type'), 'metric'] == 'accuracy'
+    assert report.loc[('rf', 'Lv50 Atk'), 'metric'] == 'rmse'
+    assert (report['masked_cells'] > 0).all()
+    assert (report[['fit_seconds', 'predict_seconds', 'peak_memory_bytes']] > 0).all().all()
+    
+def test_evaluate_on_process_pool():
+    candidates = {'mean': {'imputer': 'mean'}, 'mean_again': {'imputer': 'mean'}}
+    data = df[['Stage', 'Lv50 Atk']]
+    
+    with ProcessPoolBackend(n_workers=2) as backend:
+        report = evaluate(data, candidates, masking='mar', backend=backend)
+        
+    assert report.loc['mean', 'score'].equals(report.loc['mean_again', 'score'])
+    
+def test_evaluate_times_untraced_pass(monkeypatch):
+    import tracemalloc
+    from imputr import MeanImputer
+    from imputr.evaluation import harness
+    tracing = []
+    
+    class _TracingMeanImputer(MeanImputer):
+        def fit(self):
+            tracing.append(tracemalloc.is_tracing())
+            return super().fit()
+    
+    monkeypatch.setitem(harness._IMPUTERS, 'mean', _TracingMeanImputer)
+    report = evaluate(df[['Stage', 'Lv50 Atk']], {'mean': {'imputer': 'mean'}})
+    
+    assert tracing == [False, True]
+    assert (report['peak_memory_bytes'] > 0).all()
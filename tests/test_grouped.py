@@ -0,0 +1,56 @@
+"""
+Tests for the grouped and ordered strategies.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from imputr import AutoImputer
+from imputr.domain import Column
+from imputr.strategy import FillStrategy, GroupStatisticStrategy
+
+df = pd.DataFrame({'entity': ['a', 'a', 'a', 'b', 'b', 'b', 'c'],
+                   'time': [3, 1, 2, 1, 2, 3, 1],
+                   'value': [np.nan, 1.0, np.nan, 10.0, np.nan, 30.0, np.nan],
+                   'label': ['x', None, 'y', None, 'z', 'z', None]})
+
+
+def _fill(column: str, **params) -> pd.Series:
+    strategies = {column: {'strategy': 'fill', 'params': {'group_by': 'entity', 'order_by': 'time', **params}}}
+    return AutoImputer(df, predefined_strategies=strategies).impute()[column]
+
+def test_fill_along_sort_key_within_groups():
+    average = df['value'].mean()
+    
+    assert _fill('value', method='ffill').tolist() == [1.0, 1.0, 1.0, 10.0, 10.0, 30.0, average]
+    assert _fill('value', method='bfill').tolist() == [1.0, 1.0, 1.0, 10.0, 30.0, 30.0, average]
+    assert _fill('value', method='interpolate').tolist() == [1.0, 1.0, 1.0, 10.0, 20.0, 30.0, average]
+    assert _fill('label').tolist() == ['x', 'y', 'y', 'z', 'z', 'z', 'z']
+    
+def test_fill_in_row_order_without_keys():
+    values = pd.Series([np.nan, 1.0, np.nan, np.nan, 4.0], name='value')
+    strategy = FillStrategy(Column(values), [], method='interpolate')
+    strategy.fit()
+    
+    assert strategy.impute_column().tolist() == [1.0, 1.0, 2.0, 3.0, 4.0]
+    
+def test_group_statistic():
+    strategies = {'value': {'strategy': 'group', 'params': {'group_by': 'entity', 'statistic': 'median'}},
+                  'label': {'strategy': 'group', 'params': {'group_by': ['entity']}}}
+    imputer = AutoImputer(df, predefined_strategies=strategies)
+    imputed_df = imputer.impute()
+    
+    assert imputed_df['value'].tolist() == [1.0, 1.0, 1.0, 10.0, 20.0, 30.0, df['value'].mean()]
+    assert imputed_df['label'].tolist()[3:] == ['z', 'z', 'z', 'z']
+    
+    new_rows = pd.DataFrame({'entity': ['b', 'd'], 'time': [4, 1], 'value': [np.nan, np.nan], 'label': ['z', 'x']})
+    assert imputer.transform(new_rows)['value'].tolist() == [20.0, df['value'].mean()]
+    
+def test_invalid_configurations():
+    label = Column(df['label'])
+    with pytest.raises(ValueError):
+        FillStrategy(label, [], method='interpolate')
+    with pytest.raises(ValueError):
+        GroupStatisticStrategy(label, [Column(df['entity'])], group_by='entity', statistic='mean')
+    with pytest.raises(ValueError):
+        GroupStatisticStrategy(label, [], group_by='entity')
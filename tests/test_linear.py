@@ -0,0 +1,112 @@
+"""
+Tests for the linear strategy.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import Ridge
+from imputr import AutoImputer
+from imputr.domain import Column
+from imputr.strategy import LinearStrategy
+
+rng = np.random.default_rng(0)
+latent = rng.normal(size=(500, 3))
+values = latent @ rng.normal(size=(3, 8)) + 0.1 * rng.normal(size=(500, 8))
+full_df = pd.DataFrame(values, columns=[f'col_{i}' for i in range(8)])
+missing = rng.random(full_df.shape) < 0.1
+df = full_df.mask(missing)
+
+
+def test_linear_strategy_matches_ridge():
+    columns = [Column(df[name]) for name in df.columns]
+    strategy = LinearStrategy(columns[0], columns[1:], alpha=2.0)
+    strategy.fit()
+    
+    encoded = np.column_stack([np.asarray(col.numeric_encoded_imputed_data) for col in columns])
+    observed = columns[0].non_null_indices[0]
+    ridge = Ridge(alpha=2.0).fit(encoded[observed, 1:], encoded[observed, 0])
+    
+    assert np.allclose(strategy.coef_, ridge.coef_)
+    assert strategy.intercept_ == pytest.approx(ridge.intercept_)
+    
+def test_linear_strategy_ignores_placeholders_of_missing_target_values():
+    x = rng.normal(size=2000)
+    y = pd.Series(3 * x + 0.1 * rng.normal(size=2000), name='y').mask(rng.random(2000) < 0.4)
+    target, feature = Column(y), Column(pd.Series(x, name='x'))
+    strategy = LinearStrategy(target, [feature], alpha=1.0)
+    strategy.fit()
+    
+    observed = target.non_null_indices[0]
+    ridge = Ridge(alpha=1.0).fit(x[observed, None], y.to_numpy()[observed])
+    
+    assert strategy.coef_[0] == pytest.approx(ridge.coef_[0])
+    assert strategy.coef_[0] == pytest.approx(3, abs=0.05)
+    assert strategy.intercept_ == pytest.approx(ridge.intercept_)
+    
+def test_linear_strategy_downdate_matches_ridge():
+    wide_values = rng.normal(size=(300, 30))
+    wide_values[:, 0] += wide_values[:, 1:4].sum(axis=1)
+    wide_df = pd.DataFrame(wide_values, columns=[f'col_{i}' for i in range(30)])
+    # Fewer missing rows than columns are removed from the shared inverse.
+    wide_df.iloc[rng.choice(300, 5, replace=False), 0] = np.nan
+    wide_df.iloc[rng.choice(300, 5, replace=False), 1] = np.nan
+    columns = [Column(wide_df[name]) for name in wide_df.columns]
+    encoded = np.column_stack([np.asarray(col.numeric_encoded_imputed_data) for col in columns])
+    
+    full = LinearStrategy(columns[0], columns[1:], alpha=2.0)
+    partial = LinearStrategy(columns[1], columns[2:10], alpha=2.0)
+    LinearStrategy.fit_together([full, partial])
+    for strategy, features in ((full, slice(1, 30)), (partial, slice(2, 10))):
+        strategy.fit()
+        target = columns.index(strategy.target_column)
+        observed = strategy.target_column.non_null_indices[0]
+        ridge = Ridge(alpha=2.0).fit(encoded[observed, features], encoded[observed, target])
+        
+        assert np.allclose(strategy.coef_, ridge.coef_)
+        assert strategy.intercept_ == pytest.approx(ridge.intercept_)
+    
+def test_linear_strategy_uses_continuous_and_datetime_features():
+    days = rng.integers(0, 1000, size=400)
+    dates = pd.Series(pd.Timestamp('2020-01-01') + pd.to_timedelta(days, unit='D'), name='date')
+    labels = pd.Series(rng.choice(['a', 'b', 'c'], size=400), name='label')
+    y = pd.Series(0.5 * days + rng.normal(size=400), name='y').mask(rng.random(400) < 0.1)
+    frame = pd.DataFrame({'y': y, 'date': dates, 'label': labels})
+    
+    imputer = AutoImputer(frame, predefined_strategies={'y': {'strategy': 'linear'}})
+    imputed_df = imputer.impute()
+    
+    strategy = imputer.strategies['y']
+    assert [col.name for col in strategy.feature_columns] == ['date']
+    # Half a unit per day, in epoch nanoseconds.
+    assert strategy.coef_[0] * 86400e9 == pytest.approx(0.5, rel=0.01)
+    missing_y = y.isnull().to_numpy()
+    assert np.abs(imputed_df['y'].to_numpy()[missing_y] - 0.5 * days[missing_y]).max() < 5
+    
+def test_fit_together_shares_one_system():
+    columns = [Column(df[name]) for name in df.columns]
+    strategies = [LinearStrategy(col, [other for other in columns if other is not col]) 
+                  for col in columns]
+    LinearStrategy.fit_together(strategies)
+    
+    assert all(strategy._solution is not None for strategy in strategies)
+    for strategy in strategies:
+        separate = LinearStrategy(strategy.target_column, strategy.feature_columns)
+        strategy.fit()
+        separate.fit()
+        assert strategy._solution is None
+        assert np.allclose(strategy.coef_, separate.coef_)
+        assert strategy.intercept_ == pytest.approx(separate.intercept_)
+    
+def test_impute_with_linear_strategy():
+    imputer = AutoImputer(df, predefined_strategies={name: {'strategy': 'linear'} for name in df.columns})
+    imputed_df = imputer.impute()
+    
+    assert imputed_df.isnull().values.any() == False
+    assert imputed_df.to_numpy()[~missing] == pytest.approx(full_df.to_numpy()[~missing])
+    error = np.sqrt(np.mean((imputed_df.to_numpy()[missing] - full_df.to_numpy()[missing]) ** 2))
+    assert error < 0.5 * full_df.to_numpy().std()
+    
+def test_linear_strategy_rejects_categorical_target():
+    with pytest.raises(ValueError):
+        LinearStrategy(Column(pd.Series(['a', 'b', None], name='label')), [])
@@ -76,3 +76,67 @@ def test_rf_strategy_impute_column():
     
     assert np.size(target_column_lv50atk.imputed_data) == target_column_lv50atk.data.size
     assert np.count_nonzero(pd.isna(target_column_lv50atk.imputed_data)) == 0
+    
+
+def test_rf_strategy_collapses_high_cardinality_target():
+    rng = np.random.default_rng(0)
+    labels = pd.Series([f'label_{i}' for i in rng.integers(0, 50, 1000)], name='target')
+    labels[rng.choice(1000, 100, replace=False)] = None
+    target = Column(labels)
+    feature = Column(pd.Series(rng.normal(size=1000), name='feature'))
+    
+    strategy = RandomForestStrategy(target, [feature], max_classes=5)
+    strategy.fit()
+    imputed = strategy.impute_column()
+    
+    assert len(strategy.impute_strategy.classes_) == 5
+    assert len(strategy._tail_codes) == len(target.categories) - 4
+    assert imputed.notnull().all()
+    assert set(imputed) <= set(target.categories)
+    
+    # Tail categories are drawn from one stream, independent of the chunk size.
+    strategy.max_buffer_rows = 7
+    assert strategy.impute_column().equals(imputed)
+    
+def test_rf_strategy_draw():
+    rng = np.random.default_rng(0)
+    feature = Column(pd.Series(rng.normal(size=1000), name='feature'))
+    values = pd.Series(feature.data * 10 + rng.normal(size=1000), name='target')
+    values[::10] = np.nan
+    labels = pd.Series(np.where(feature.data > 0, 'high', 'low'), name='label')
+    labels[::10] = None
+    
+    continuous = RandomForestStrategy(Column(values), [feature])
+    categorical = RandomForestStrategy(Column(labels), [feature], max_classes=1)
+    for strategy in (continuous, categorical):
+        strategy.fit()
+        strategy.target_column.imputed_data = strategy.impute_column()
+    
+    draws = continuous.draw(5, np.random.default_rng(0))
+    assert draws.shape == (5, 100)
+    assert not np.array_equal(draws[0], draws[1])
+    assert np.array_equal(draws, continuous.draw(5, np.random.default_rng(0)))
+    
+    continuous.compact()
+    assert continuous.draw(5, np.random.default_rng(0)).shape == (5, 100)
+    
+    codes = categorical.draw(5, np.random.default_rng(0))
+    assert codes.shape == (5, 100)
+    assert set(np.unique(codes)) <= {0, 1}
+    
+def test_rf_strategy_validation_score_is_computed_on_demand():
+    rng = np.random.default_rng(0)
+    feature = Column(pd.Series(rng.normal(size=1000), name='feature'))
+    values = pd.Series(feature.data * 10 + rng.normal(size=1000), name='target')
+    values[::10] = np.nan
+    
+    strategy = RandomForestStrategy(Column(values), [feature])
+    strategy.fit()
+    
+    assert not hasattr(strategy.impute_strategy, 'oob_score_')
+    assert strategy._validation_score is None
+    
+    score = strategy.validation_score()
+    
+    assert 0 < score < np.nanstd(values)
+    assert strategy.validation_score() == score
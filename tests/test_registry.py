@@ -0,0 +1,47 @@
+"""
+Tests for the strategy registry.
+"""
+
+import subprocess
+import sys
+import pandas as pd
+import pytest
+from imputr import AutoImputer
+from imputr.strategy import registry, register_strategy, get_strategy, available_strategies, MeanStrategy, \
+    RandomForestStrategy
+
+
+class ConstantStrategy(MeanStrategy):
+    def fit(self) -> None:
+        self.mean = 0.0
+
+
+class _EntryPoint:
+    name = 'constant_ep'
+    
+    def load(self):
+        return ConstantStrategy
+
+
+def test_builtin_strategies():
+    assert get_strategy('rf') is RandomForestStrategy
+    assert get_strategy('mean') is MeanStrategy
+    with pytest.raises(ValueError):
+        get_strategy('non_existent_strategy')
+
+def test_import_does_not_load_scikit_learn():
+    code = 'import sys, imputr, imputr.strategy; assert "sklearn" not in sys.modules'
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+def test_registered_and_entry_point_strategies(monkeypatch):
+    monkeypatch.setattr(registry, '_registered', {})
+    monkeypatch.setattr(registry, '_entry_points', {'constant_ep': _EntryPoint()})
+    register_strategy('constant', 'tests.test_registry:ConstantStrategy')
+    
+    assert {'constant', 'constant_ep', 'rf', 'mean'} <= set(available_strategies())
+    assert get_strategy('constant') is ConstantStrategy
+    assert get_strategy('constant_ep') is ConstantStrategy
+    
+    df = pd.DataFrame({'value': [1.0, None, 3.0]})
+    imputed_df = AutoImputer(df, predefined_strategies={'value': {'strategy': 'constant_ep'}}).impute()
+    assert imputed_df['value'].tolist() == [1.0, 0.0, 3.0]
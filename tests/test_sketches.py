@@ -0,0 +1,94 @@
+"""
+Tests for streaming column summaries.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from imputr import MeanImputer
+from imputr.domain import Column, DataType, Table
+from imputr.domain.sketches import (ColumnSummary, HeavyHittersSketch, HyperLogLog,
+                                    MomentSketch, QuantileSketch)
+
+rng = np.random.default_rng(0)
+values = pd.Series(rng.normal(10, 2, 20000), name='cont_col')
+labels = pd.Series(rng.choice(['a', 'b', 'c'], 20000, p=[0.2, 0.5, 0.3]), name='cat_col')
+
+
+def test_moment_sketch_merge():
+    left = MomentSketch.from_series(values[:5000])
+    right = MomentSketch().update(values[5000:12000]).update(values[12000:])
+    merged = left.merge(right)
+    
+    assert merged.count == 20000
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance == pytest.approx(values.var(ddof=0))
+
+
+def test_heavy_hitters_mode():
+    sketch = HeavyHittersSketch(capacity=2)
+    for start in range(0, 20000, 1000):
+        sketch.update(labels[start:start + 1000])
+    
+    assert sketch.mode == 'b'
+    assert len(sketch.counts) <= 2
+    assert sketch.mode_fraction <= 0.5 + 0.01
+
+
+def test_hyperloglog_unique_count():
+    unique_values = pd.Series(np.arange(50000) % 30000)
+    left = HyperLogLog().update(unique_values[:25000])
+    right = HyperLogLog().update(unique_values[25000:].astype(np.float64))
+    
+    assert left.merge(right).estimate == pytest.approx(30000, rel=0.05)
+    assert HyperLogLog().update(pd.Series(['x', 'y', None, 'x'])).estimate == 2
+
+
+def test_quantile_sketch_median():
+    left = QuantileSketch().update(values[:10000])
+    right = QuantileSketch().update(values[10000:])
+    merged = left.merge(right)
+    
+    assert len(merged.values) <= 512
+    assert merged.median == pytest.approx(values.median(), abs=0.05)
+
+
+def test_column_from_chunks():
+    data = values.copy()
+    data[::10] = np.nan
+    column = Column.from_chunks(np.array_split(data, 7))
+    exact = Column(data)
+    
+    assert column.type == DataType.CONTINUOUS
+    assert column.data.size == data.size
+    assert column.missing_value_count == exact.missing_value_count
+    assert column.average == pytest.approx(exact.average)
+    assert column.unique_value_count == pytest.approx(exact.unique_value_count, rel=0.05)
+    
+    with pytest.raises(ValueError):
+        Column(data, summary=ColumnSummary(DataType.CATEGORICAL))
+
+
+def test_imputer_from_chunks():
+    df = pd.DataFrame({'cont_col': values, 'cat_col': labels})
+    df.loc[::10, 'cont_col'] = np.nan
+    df.loc[::7, 'cat_col'] = np.nan
+    
+    imputer = MeanImputer(np.array_split(df, 4))
+    cat_column = next(filter(lambda x: x.name == 'cat_col', imputer.table.columns))
+    
+    assert isinstance(imputer.table, Table)
+    assert cat_column.average == 'b'
+    assert imputer.impute().isnull().values.any() == False
+
+
+def test_table_from_chunks_infers_type_from_all_chunks():
+    first = pd.DataFrame({'cat_col': [np.nan] * 4, 'cont_col': [1.0, 2.0, np.nan, 4.0]})
+    second = pd.DataFrame({'cat_col': ['a', 'b', 'b', None], 'cont_col': [5.0, 6.0, 7.0, 8.0]})
+    table = Table.from_chunks([first, second])
+    cat_column = next(filter(lambda x: x.name == 'cat_col', table.columns))
+    
+    assert cat_column.type == DataType.CATEGORICAL
+    assert cat_column.missing_value_count == 5
+    assert cat_column.average == 'b'
+    assert Column.from_chunks([first['cat_col'], second['cat_col']]).type == DataType.CATEGORICAL
@@ -2,6 +2,7 @@
 Tests for Table data class.
 """
 
+import pytest
 import pandas as pd
 from imputr.domain import Table, DataType
 
@@ -26,4 +27,63 @@ def test_ctor_with_datatypes():
        if col.name == 'Lv 50 Atk':
            assert col.type == DataType.CATEGORICAL
     
-    
\ No newline at end of file
+           
+def test_ctor_parallel():
+   sequential_table = Table(df, {"Lv50 Atk": 'cat'})
+   
+   for executor in ['thread', 'process']:
+       table = Table(df, {"Lv50 Atk": 'cat'}, n_jobs=2, executor=executor)
+       
+       assert [col.name for col in table.columns] == list(df.columns)
+       for col, sequential_col in zip(table.columns, sequential_table.columns):
+           assert col.type == sequential_col.type
+           assert col.average == sequential_col.average
+           assert col.missing_value_count == sequential_col.missing_value_count
+           assert col.data.equals(sequential_col.data)
+           
+def test_ctor_unknown_executor():
+   with pytest.raises(ValueError):
+       Table(df, n_jobs=2, executor='gpu')
+    
+def test_column_registry_and_feature_view():
+    table = Table(df)
+    
+    assert table.column('Attribute') is table.columns[list(df.columns).index('Attribute')]
+    
+    features = table.feature_columns('Attribute')
+    expected = [col for col in table.columns if col.name != 'Attribute']
+    assert len(features) == len(expected)
+    assert list(features) == expected
+    assert [features[i] for i in range(len(features))] == expected
+    assert features[-1] is expected[-1]
+    assert features[1:3] == expected[1:3]
+    
+def test_encoded_matrix_in_scratch_dir(tmp_path):
+    table = Table(df)
+    matrix = table.encoded_matrix(str(tmp_path))
+    
+    assert len(list(tmp_path.iterdir())) == 1
+    attribute = table.column_index['Attribute']
+    assert list(matrix.values[:, attribute]) == list(table.column('Attribute').imputed_codes)
+    
+    features = table.feature_columns('Attribute')
+    rows = matrix.rows([0, 2], features.positions)
+    assert rows.shape == (2, len(features))
+    
+    matrix.write_column(attribute, [7, 7, 7, 7, 7])
+    assert (matrix.values[:, attribute] == 7).all()
+    
+    matrix.close()
+    assert list(tmp_path.iterdir()) == []
+    
+def test_encoded_matrix_keeps_no_imputed_copies(tmp_path):
+    missing_df = pd.DataFrame({'cont_col': [1.0, None, 3.0, None], 'cat_col': ['a', None, 'b', 'b']})
+    table = Table(missing_df)
+    matrix = table.encoded_matrix(str(tmp_path))
+    
+    assert list(matrix.values[:, 0]) == [1.0, 2.0, 3.0, 2.0]
+    assert list(matrix.values[:, 1]) == [0.0, 1.0, 1.0, 1.0]
+    for col in table.columns:
+        assert col._imputed_data is None and col._imputed_codes is None
+    
+    matrix.close()
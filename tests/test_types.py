@@ -11,6 +11,9 @@ def test_correct_mapping_cat():
 def test_correct_mapping_cont():
     assert DataType.str_to_data_type('cont') == DataType.CONTINUOUS
     
+def test_correct_mapping_datetime():
+    assert DataType.str_to_data_type('datetime') == DataType.DATETIME
+    
 def test_non_existent_str_mapping():
     with pytest.raises(ValueError):
         DataType.str_to_data_type('non_existent_mapping')
\ No newline at end of file